@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'app'
+    verbose_name = 'Kanban'
+
+    def ready(self):
+        from . import signals  # noqa: F401
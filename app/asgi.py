@@ -9,8 +9,15 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 
 import os
 
+import django
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
 
+# Banco, migrations e estáticos antes de montar o app (o WhiteNoise indexa os
+# estáticos na criação do middleware), no mesmo boot do Django
+django.setup(set_prefix=False)
+from app.startup import run_if_enabled  # noqa: E402 (precisa das settings)
+run_if_enabled()
+
 application = get_asgi_application()
@@ -0,0 +1,257 @@
+"""
+Bundles de CSS/JS por página. `build_assets` concatena e minifica os fontes
+de cada bundle em static/bundles/; o collectstatic (manifesto do WhiteNoise)
+cuida dos nomes com hash, das versões gzip/brotli e do cache imutável. Os
+templates usam `{% bundle 'nome' %}`, que cai nos arquivos originais quando
+os bundles não foram gerados ou ASSET_BUNDLES está desligado.
+"""
+import gzip
+import os
+import re
+from functools import lru_cache
+
+from django.conf import settings
+
+try:
+    import brotli
+except ImportError:  # opcional: sem ele o relatório omite o tamanho brotli
+    brotli = None
+
+
+# Nome do bundle -> fontes (caminhos relativos a static/), na ordem de inclusão
+BUNDLES = {
+    'base.css': ['css/style.css'],
+    'login.css': ['css/login-board.css'],
+    'tasks.css': ['css/task-board.css'],
+    'goals.css': ['css/goal-board.css'],
+    'appointments.css': ['css/appointment-board.css'],
+    'main-dashboard.css': ['css/task-board.css', 'css/goal-board.css', 'css/appointment-board.css'],
+    'main-dashboard.js': ['js/card-animation.js', 'js/drag-and-drop.js'],
+    'task-form.js': ['js/assignee-autocomplete.js'],
+}
+
+BUNDLE_DIR = 'bundles'
+
+
+def source_dir():
+    return settings.BASE_DIR / 'static'
+
+
+def output_dir():
+    return source_dir() / BUNDLE_DIR
+
+
+# --- CSS ---
+
+_CSS_TOKENS = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(/\*.*?\*/)''', re.S)
+_CSS_SPACE = re.compile(r'\s+')
+_CSS_PUNCTUATION = re.compile(r'\s*([{};,>])\s*')
+_CSS_COLON = re.compile(r':\s+')
+
+
+def _minify_css_code(code):
+    code = _CSS_SPACE.sub(' ', code)
+    code = _CSS_PUNCTUATION.sub(r'\1', code)
+    return _CSS_COLON.sub(':', code)
+
+
+def minify_css(source):
+    """Remove comentários e espaços supérfluos; strings ficam intactas."""
+    parts = []
+    code = []
+    position = 0
+    for match in _CSS_TOKENS.finditer(source):
+        code.append(source[position:match.start()])
+        if match.group(1):
+            parts.append(_minify_css_code(''.join(code)))
+            parts.append(match.group(1))
+            code = []
+        else:
+            code.append(' ')
+        position = match.end()
+    code.append(source[position:])
+    parts.append(_minify_css_code(''.join(code)))
+    return ''.join(parts).replace(';}', '}').strip()
+
+
+# --- JS ---
+
+# Depois destes caracteres/palavras uma barra abre regex, não divisão
+_REGEX_AFTER = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw', 'yield', 'await'}
+
+
+def _regex_allowed(output):
+    text = ''.join(output[-20:]).rstrip()
+    if not text:
+        return True
+    if text[-1] in _REGEX_AFTER:
+        return True
+    word = re.search(r'[A-Za-z_$][\w$]*$', text)
+    return bool(word) and word.group() in _REGEX_KEYWORDS
+
+
+def minify_js(source):
+    """
+    Minificação conservadora: remove comentários, indentação e linhas vazias,
+    preservando strings, template literals e regex. As quebras de linha
+    ficam, então a inserção automática de ponto e vírgula não muda.
+    """
+    output = []
+    length = len(source)
+    index = 0
+    # Pilha de chaves abertas dentro de ${...} de template literals
+    template_depth = []
+    line_start = True
+
+    def scan_template(index):
+        # Copia o template literal até o fim ou até abrir uma expressão ${
+        while index < length:
+            char = source[index]
+            if char == '\\':
+                output.append(source[index:index + 2])
+                index += 2
+                continue
+            if char == '`':
+                output.append(char)
+                return index + 1, False
+            if source.startswith('${', index):
+                output.append('${')
+                return index + 2, True
+            output.append(char)
+            index += 1
+        return index, False
+
+    while index < length:
+        char = source[index]
+
+        if char == '\n':
+            while output and output[-1] in (' ', '\t'):
+                output.pop()
+            if output and output[-1] != '\n':
+                output.append('\n')
+            line_start = True
+            index += 1
+            continue
+        if char in ' \t\r':
+            if not line_start and output and output[-1] not in (' ', '\n'):
+                output.append(' ')
+            index += 1
+            continue
+        line_start = False
+
+        if source.startswith('//', index):
+            end = source.find('\n', index)
+            index = length if end == -1 else end
+            continue
+        if source.startswith('/*', index):
+            end = source.find('*/', index + 2)
+            comment = source[index:length if end == -1 else end + 2]
+            index = length if end == -1 else end + 2
+            if '\n' in comment:
+                output.append('\n')
+                line_start = True
+            elif output and output[-1] not in (' ', '\n'):
+                output.append(' ')
+            continue
+
+        if char in '"\'':
+            end = index + 1
+            while end < length and source[end] != char:
+                end += 2 if source[end] == '\\' else 1
+            output.append(source[index:end + 1])
+            index = end + 1
+            continue
+        if char == '`':
+            output.append(char)
+            index, opened = scan_template(index + 1)
+            if opened:
+                template_depth.append(0)
+            continue
+        if template_depth:
+            if char == '{':
+                template_depth[-1] += 1
+            elif char == '}':
+                if template_depth[-1] == 0:
+                    template_depth.pop()
+                    output.append(char)
+                    index, opened = scan_template(index + 1)
+                    if opened:
+                        template_depth.append(0)
+                    continue
+                template_depth[-1] -= 1
+        if char == '/' and _regex_allowed(output):
+            end = index + 1
+            in_class = False
+            while end < length and source[end] != '\n':
+                current = source[end]
+                if current == '\\':
+                    end += 2
+                    continue
+                if current == '[':
+                    in_class = True
+                elif current == ']':
+                    in_class = False
+                elif current == '/' and not in_class:
+                    break
+                end += 1
+            output.append(source[index:end + 1])
+            index = end + 1
+            continue
+
+        output.append(char)
+        index += 1
+
+    return ''.join(output).strip() + '\n'
+
+
+# --- Build ---
+
+MINIFIERS = {'.css': minify_css, '.js': minify_js}
+# ';' entre arquivos JS: um fonte sem ponto e vírgula final não se funde ao próximo
+SEPARATORS = {'.css': '\n', '.js': ';\n'}
+
+
+def _suffix(name):
+    return name[name.rfind('.'):]
+
+
+def build_bundle(name):
+    """Gera static/bundles/<name> e devolve as medidas do bundle."""
+    sources = BUNDLES[name]
+    suffix = _suffix(name)
+    minify = MINIFIERS[suffix]
+    raw = []
+    for path in sources:
+        with open(source_dir() / path, encoding='utf-8') as source:
+            raw.append(source.read())
+    content = SEPARATORS[suffix].join(minify(text) for text in raw)
+    data = content.encode('utf-8')
+
+    target = output_dir() / name
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, 'wb') as output:
+        output.write(data)
+
+    return {
+        'name': name,
+        'sources': sources,
+        'raw': sum(len(text.encode('utf-8')) for text in raw),
+        'minified': len(data),
+        'gzip': len(gzip.compress(data, 9)),
+        'brotli': len(brotli.compress(data)) if brotli else None,
+    }
+
+
+def build_all(names=None):
+    results = [build_bundle(name) for name in (names or BUNDLES)]
+    bundle_paths.cache_clear()
+    return results
+
+
+@lru_cache(maxsize=None)
+def bundle_paths(name):
+    """Caminhos estáticos a incluir para o bundle `name`."""
+    if getattr(settings, 'ASSET_BUNDLES', False) and os.path.exists(os.path.join(output_dir(), name)):
+        return (f'{BUNDLE_DIR}/{name}',)
+    return tuple(BUNDLES[name])
@@ -0,0 +1,148 @@
+from itertools import chain
+
+from django.db.models import Case, F, Value, When, Window
+from django.db.models.functions import RowNumber
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from tasks.models import Task
+from goals.models import Goal
+
+
+# Campos usados pelos cards dos boards e do dashboard principal
+TASK_CARD_FIELDS = (
+    'id', 'title', 'description', 'priority', 'status',
+    'due_date', 'created_at', 'updated_at',
+)
+GOAL_CARD_FIELDS = (
+    'id', 'title', 'description', 'priority', 'status', 'period',
+    'due_date', 'created_at', 'updated_at',
+)
+
+
+def load_board(queryset, column_field, columns, fields, order_by=('-created_at',), per_column=None):
+    """
+    Carrega todos os cards de um board em uma única consulta e os agrupa por
+    coluna, preservando a ordenação dentro de cada coluna.
+
+    Com `per_column`, cada coluna é limitada no próprio banco (ROW_NUMBER()
+    particionado pela coluna), ainda em uma única consulta.
+    """
+    queryset = queryset.only(*fields).order_by(*order_by)
+    if per_column:
+        queryset = queryset.annotate(
+            board_position=Window(
+                RowNumber(),
+                partition_by=F(column_field),
+                order_by=list(order_by),
+            )
+        ).filter(board_position__lte=per_column)
+
+    board = {column: [] for column in columns}
+    for card in queryset:
+        board.setdefault(getattr(card, column_field), []).append(card)
+    return board
+
+
+def load_task_board(queryset, order_by=('-created_at',), per_column=None):
+    """Board de tarefas agrupado por status."""
+    return load_board(
+        queryset, 'status', [value for value, _ in Task.STATUS_CHOICES],
+        TASK_CARD_FIELDS, order_by=order_by, per_column=per_column,
+    )
+
+
+def load_goal_board(queryset, order_by=('-created_at',), per_column=None):
+    """Board de metas agrupado por período."""
+    return load_board(
+        queryset, 'period', [value for value, _ in Goal.PERIOD_CHOICES],
+        GOAL_CARD_FIELDS, order_by=order_by, per_column=per_column,
+    )
+
+
+# Ordenação do board de tarefas do dashboard principal: colunas abertas por
+# prioridade e data de criação; concluídas pela última atualização.
+DASHBOARD_TASK_ORDER = (
+    Case(When(status='done', then=Value('')), default=F('priority')).desc(),
+    Case(When(status='done', then=F('updated_at')), default=F('created_at')).desc(),
+)
+# Cards por coluna no board de tarefas do dashboard principal
+DASHBOARD_TASKS_PER_COLUMN = 10
+
+
+def dashboard_tasks(user):
+    """Tarefas do board do dashboard principal: as atribuídas ao usuário."""
+    return Task.objects.filter(assigned_to=user)
+
+
+def board_version():
+    """Versão de um board: o instante da leitura, usado como `since` na próxima."""
+    return timezone.now().isoformat()
+
+
+def parse_since(value):
+    """
+    `since` de um diff como datetime com fuso, ou None se for inválido
+    (inclusive datas bem formadas mas inexistentes, como 2024-02-30).
+    """
+    try:
+        since = parse_datetime(value or '')
+    except ValueError:
+        return None
+    if since is not None and timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since
+
+
+def board_diff(queryset, column_field, fields, since, template_name, context_name, request=None,
+               order_by=('-created_at',), per_column=None):
+    """
+    Cards alterados desde `since` (por `updated_at`), já renderizados com o
+    partial do card, mais a lista de ids ainda existentes para que o cliente
+    remova os excluídos.
+
+    Com `per_column`, o diff vale para o board limitado (o mesmo `order_by` e
+    limite usados para montá-lo): só os cards visíveis entram, e os que saíram
+    do limite somem dos ids.
+    """
+    # A versão é lida antes das consultas para não perder alterações concorrentes
+    version = board_version()
+    if per_column:
+        board = load_board(queryset, column_field, [], fields, order_by=order_by, per_column=per_column)
+        visible = list(chain.from_iterable(board.values()))
+        changed = sorted(
+            (card for card in visible if card.updated_at >= since),
+            key=lambda card: card.created_at, reverse=True,
+        )
+        ids = [card.pk for card in visible]
+    else:
+        changed = queryset.filter(updated_at__gte=since).only(*fields).order_by('-created_at')
+        ids = list(queryset.order_by().values_list('pk', flat=True))
+    return {
+        'version': version,
+        'cards': [
+            {
+                'id': card.pk,
+                'column': getattr(card, column_field),
+                'html': render_to_string(template_name, {context_name: card}, request),
+            }
+            for card in changed
+        ],
+        'ids': ids,
+    }
+
+
+def task_board_diff(queryset, since, request=None, order_by=('-created_at',), per_column=None):
+    return board_diff(
+        queryset, 'status', TASK_CARD_FIELDS, since,
+        'tasks/partials/task_card.html', 'task', request,
+        order_by=order_by, per_column=per_column,
+    )
+
+
+def goal_board_diff(queryset, since, request=None):
+    return board_diff(
+        queryset, 'period', GOAL_CARD_FIELDS, since,
+        'goals/partials/goal_card.html', 'goal', request,
+    )
@@ -0,0 +1,64 @@
+from django.db import transaction
+from django.utils import timezone
+
+from .dashboard_cache import invalidate_user
+from .events import publish_card_event
+
+
+MAX_MOVES = 500
+
+
+def apply_moves(queryset, field, choices, moves, owner_fields, event_type, invalid_message='Valor inválido'):
+    """
+    Aplica vários movimentos `{id, <field>}` de uma vez.
+
+    A posse dos itens é validada por `queryset` (já filtrado pelo usuário) em
+    uma única consulta, e as alterações são gravadas com `bulk_update` em uma
+    transação. Retorna um resultado por movimento, na ordem recebida.
+
+    Como `bulk_update` não dispara sinais, os caches dos donos dos itens são
+    invalidados e os eventos `event_type` publicados aqui.
+    """
+    results = []
+    pending = {}
+    for move in moves:
+        item_id = move.get('id') if isinstance(move, dict) else None
+        value = move.get(field) if isinstance(move, dict) else None
+        try:
+            item_id = int(item_id)
+        except (TypeError, ValueError):
+            results.append({'id': item_id, 'success': False, 'error': 'ID inválido'})
+            continue
+        if not isinstance(value, str) or value not in choices:
+            results.append({'id': item_id, 'success': False, 'error': invalid_message})
+            continue
+        result = {'id': item_id, 'success': True, field: value}
+        results.append(result)
+        # Movimentos repetidos do mesmo item: vale o último
+        pending[item_id] = value
+
+    if not pending:
+        return results
+
+    now = timezone.now()
+    with transaction.atomic():
+        items = list(
+            queryset.select_for_update()
+            .filter(pk__in=pending)
+            .only('pk', field, 'updated_at', *owner_fields)
+        )
+        for item in items:
+            setattr(item, field, pending[item.pk])
+            item.updated_at = now
+        queryset.model.objects.bulk_update(items, [field, 'updated_at'])
+
+    found = {item.pk for item in items}
+    for result in results:
+        if result['success'] and result['id'] not in found:
+            result.update(success=False, error='Item não encontrado')
+            result.pop(field, None)
+
+    invalidate_user(*(getattr(item, name) for item in items for name in owner_fields))
+    for item in items:
+        publish_card_event(event_type, 'updated', item, [getattr(item, name) for name in owner_fields])
+    return results
@@ -0,0 +1,68 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.views.decorators.http import condition
+
+from .dashboard_cache import get_version
+
+
+# Os fingerprints não dependem do relógio; só mudam com a versão do usuário
+FINGERPRINT_TIMEOUT = 60 * 60 * 24
+
+
+def model_fingerprint(user, model, owner_field):
+    """
+    Impressão digital barata dos dados do usuário em `model`: MAX(updated_at)
+    e quantidade de linhas. Fica em cache até a próxima invalidação do usuário.
+    """
+    key = 'fingerprint:{}:{}:{}'.format(model._meta.label_lower, user.pk, get_version(user.pk))
+    fingerprint = cache.get(key)
+    if fingerprint is None:
+        data = model.objects.filter(**{owner_field: user}).order_by().aggregate(
+            last_update=Max('updated_at'), total=Count('pk'),
+        )
+        last_update = data['last_update'].isoformat() if data['last_update'] else '-'
+        fingerprint = f"{data['total']}:{last_update}"
+        cache.set(key, fingerprint, FINGERPRINT_TIMEOUT)
+    return fingerprint
+
+
+def overdue_flag(user, model, owner_field, pk):
+    """'1' se o `due_date` do objeto `pk` já passou; muda sozinho com o relógio."""
+    due_date = model.objects.filter(pk=pk, **{owner_field: user}).values_list('due_date', flat=True).first()
+    return '1' if due_date and timezone.now() > due_date else '0'
+
+
+def user_etag(*sources, daily=False, overdue=None):
+    """
+    Decorator de GET condicional (ETag) para views por usuário.
+
+    `sources` são pares (model, campo_dono); o model precisa de `updated_at`.
+    Inclua também o que muda a página sem tocar no model principal (ex.: as
+    regras de repetição dos compromissos). Com `daily=True` a data local
+    entra no ETag, para páginas que destacam "hoje". O ETag também varia com o
+    cookie CSRF (o HTML embute o token) e com o cabeçalho X-Requested-With,
+    já que a mesma URL responde o board completo ou só o partial.
+
+    `overdue=(model, campo_dono)`, em views de detalhe (`pk`), inclui se o
+    prazo do objeto já passou: o "Atrasada!" aparece sem que nada seja salvo.
+    """
+    def etag_func(request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return None
+        parts = [
+            str(request.user.pk),
+            request.headers.get('X-Requested-With', ''),
+            request.COOKIES.get(settings.CSRF_COOKIE_NAME, ''),
+        ]
+        parts += [model_fingerprint(request.user, model, owner) for model, owner in sources]
+        if overdue:
+            parts.append(overdue_flag(request.user, *overdue, kwargs['pk']))
+        if daily:
+            parts.append(timezone.localdate().isoformat())
+        return hashlib.sha1('|'.join(parts).encode()).hexdigest()
+
+    return condition(etag_func=etag_func)
@@ -0,0 +1,52 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+
+def _version_key(user_id):
+    return f'dashboard:version:{user_id}'
+
+
+def _new_version():
+    # Uma versão baseada no relógio nunca repete um valor já usado, mesmo que a
+    # chave de versão seja descartada pelo backend de cache.
+    return time.time_ns()
+
+
+def get_version(user_id):
+    """Versão atual dos dados do usuário; muda a cada invalidação."""
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = _new_version()
+        if not cache.add(key, version, None):
+            version = cache.get(key, version)
+    return version
+
+
+def invalidate_user(*user_ids):
+    """Invalida todos os snapshots dos usuários informados."""
+    keys = {_version_key(user_id): _new_version() for user_id in set(user_ids) if user_id}
+    if keys:
+        cache.set_many(keys, None)
+
+
+def get_snapshot(user, name, builder):
+    """
+    Retorna o snapshot `name` do usuário, calculando-o com `builder` quando não
+    estiver em cache.
+
+    A chave inclui a data local para que contadores como "hoje" e "atrasadas"
+    sejam recalculados na virada do dia; o timeout cobre as mudanças de relógio
+    dentro do mesmo dia.
+    """
+    key = 'dashboard:{}:{}:{}:{}'.format(
+        name, user.pk, get_version(user.pk), timezone.localdate().isoformat()
+    )
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = builder()
+        cache.set(key, snapshot, settings.DASHBOARD_CACHE_TIMEOUT)
+    return snapshot
@@ -0,0 +1,90 @@
+import time
+from bisect import bisect_left
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+
+
+DIRECTORY_VERSION_KEY = 'directory:version'
+
+# O diretório só muda quando um usuário muda; o timeout é só uma rede de segurança
+DIRECTORY_TIMEOUT = 60 * 60 * 24
+
+# Cópia em memória do processo, reaproveitada enquanto a versão não muda
+_local = {'version': None, 'directory': None}
+
+
+def _get_version():
+    version = cache.get(DIRECTORY_VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(DIRECTORY_VERSION_KEY, version, None):
+            version = cache.get(DIRECTORY_VERSION_KEY, version)
+    return version
+
+
+def invalidate_directory():
+    cache.set(DIRECTORY_VERSION_KEY, time.time_ns(), None)
+
+
+def _build():
+    users = User.objects.filter(is_active=True).order_by('username').values_list(
+        'pk', 'username', 'first_name', 'last_name',
+    )
+    entries = []
+    index = []
+    for pk, username, first_name, last_name in users:
+        name = f'{first_name} {last_name}'.strip()
+        position = len(entries)
+        entries.append((pk, username, name))
+        # Busca por prefixo no login, no nome e no sobrenome
+        for key in {username, name, last_name}:
+            if key:
+                index.append((key.lower(), position))
+    index.sort()
+    return {'entries': entries, 'index': index}
+
+
+def get_directory():
+    """
+    Diretório de usuários ativos: `entries` (pk, username, nome) em ordem de
+    username e `index`, uma lista ordenada de (chave, posição) para busca por
+    prefixo com bisect. Fica em cache versionado, invalidado quando um usuário
+    é salvo ou removido.
+    """
+    version = _get_version()
+    if _local['version'] == version:
+        return _local['directory']
+
+    key = f'directory:{version}'
+    directory = cache.get(key)
+    if directory is None:
+        directory = _build()
+        cache.set(key, directory, DIRECTORY_TIMEOUT)
+    _local.update(version=version, directory=directory)
+    return directory
+
+
+def assignee_choices():
+    """Choices (pk, username) para o campo "Atribuído para"."""
+    return [(pk, username) for pk, username, _ in get_directory()['entries']]
+
+
+def search_directory(prefix, limit=10):
+    """Usuários cujo login, nome ou sobrenome começa com `prefix`."""
+    directory = get_directory()
+    entries, index = directory['entries'], directory['index']
+    prefix = prefix.strip().lower()
+    if not prefix:
+        return [entries[position] for position in range(min(limit, len(entries)))]
+
+    found = []
+    seen = set()
+    for cursor in range(bisect_left(index, (prefix,)), len(index)):
+        key, position = index[cursor]
+        if not key.startswith(prefix) or len(found) >= limit:
+            break
+        if position not in seen:
+            seen.add(position)
+            found.append(entries[position])
+    return found
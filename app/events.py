@@ -0,0 +1,87 @@
+import asyncio
+import json
+import threading
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+
+class InMemoryBroker:
+    """
+    Broker em processo: entrega eventos aos assinantes conectados a este mesmo
+    processo. Serve para um único worker ASGI; com vários workers, configure em
+    EVENTS_BROKER um backend compartilhado com a mesma interface.
+    """
+
+    def __init__(self, max_queue_size=100):
+        self.max_queue_size = max_queue_size
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id):
+        """Registra um assinante; deve ser chamado dentro do event loop que vai consumir."""
+        queue = asyncio.Queue(self.max_queue_size)
+        subscriber = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, user_id, subscriber):
+        with self._lock:
+            subscribers = self._subscribers.get(user_id)
+            if subscribers:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[user_id]
+
+    def publish(self, user_ids, event):
+        """Publica `event` para os usuários; seguro para chamar de código síncrono."""
+        with self._lock:
+            targets = [
+                subscriber
+                for user_id in set(user_ids) if user_id
+                for subscriber in self._subscribers.get(user_id, ())
+            ]
+        for loop, queue in targets:
+            loop.call_soon_threadsafe(_put_nowait, queue, event)
+
+
+def _put_nowait(queue, event):
+    # Um assinante lento não pode travar os demais: descarta o evento mais antigo
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(event)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                path = getattr(settings, 'EVENTS_BROKER', 'app.events.InMemoryBroker')
+                _broker = import_string(path)()
+    return _broker
+
+
+def publish_card_event(kind, action, instance, user_ids):
+    """
+    Publica um evento de card (`created`, `updated` ou `deleted`) depois do
+    commit, para que os clientes já encontrem a alteração ao consultar o board.
+    """
+    event = {
+        'type': kind,
+        'action': action,
+        'id': instance.pk,
+        'updated_at': instance.updated_at.isoformat() if instance.updated_at else None,
+    }
+    user_ids = list(user_ids)
+    transaction.on_commit(lambda: get_broker().publish(user_ids, event))
+
+
+def format_sse(event):
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
@@ -0,0 +1,164 @@
+import csv
+import json
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from tasks.models import Task
+from goals.models import Goal
+from appointments.models import Appointment
+
+
+# Linhas lidas do banco por ida ao cursor (servidor, no PostgreSQL)
+CHUNK_SIZE = 2000
+
+# Colunas exportadas por tipo e o campo que liga a linha ao usuário
+EXPORTS = {
+    'tasks': {
+        'model': Task,
+        'owner': 'created_by',
+        'fields': (
+            'id', 'title', 'description', 'priority', 'status',
+            'assigned_to__username', 'created_by__username', 'due_date',
+            'estimated_hours', 'actual_hours', 'created_at', 'updated_at',
+        ),
+    },
+    'goals': {
+        'model': Goal,
+        'owner': 'created_by',
+        'fields': (
+            'id', 'title', 'description', 'priority', 'status', 'period',
+            'due_date', 'created_at', 'updated_at',
+        ),
+    },
+    'appointments': {
+        'model': Appointment,
+        'owner': 'user',
+        'fields': (
+            'id', 'title', 'description', 'appointment_type', 'priority', 'status',
+            'date', 'start_time', 'end_time', 'location', 'created_at', 'updated_at',
+            'recurrence__frequency', 'recurrence__interval', 'recurrence__until',
+            'recurrence__exceptions',
+        ),
+    },
+}
+
+FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'ics': ('text/calendar; charset=utf-8', 'ics'),
+}
+
+
+def export_rows(kind, user=None, chunk_size=CHUNK_SIZE):
+    """
+    Tuplas `.values_list()` do tipo `kind`, lidas em blocos de `chunk_size`
+    com `.iterator()`: a memória usada não cresce com o número de linhas.
+    """
+    spec = EXPORTS[kind]
+    queryset = spec['model'].objects.all()
+    if user is not None:
+        queryset = queryset.filter(**{spec['owner']: user})
+    return queryset.order_by('pk').values_list(*spec['fields']).iterator(chunk_size=chunk_size)
+
+
+class _Echo:
+    """Pseudo-arquivo para o `csv.writer`: devolve a linha em vez de gravá-la."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    # Listas (ex.: datas excluídas de uma recorrência) saem em JSON, que o
+    # importador lê de volta; o repr do Python não seria reimportável
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, cls=DjangoJSONEncoder, ensure_ascii=False)
+    return value
+
+
+def csv_lines(header, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow([_csv_value(value) for value in row])
+
+
+def ndjson_lines(header, rows):
+    for row in rows:
+        yield json.dumps(dict(zip(header, row)), cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+
+def _ics_escape(value):
+    return (
+        str(value or '')
+        .replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+        .replace('\r\n', '\\n').replace('\n', '\\n')
+    )
+
+
+def _ics_fold(line):
+    # RFC 5545: linhas de até 75 octetos, continuação começando com espaço
+    data = line.encode()
+    if len(data) <= 75:
+        return line + '\r\n'
+    parts = []
+    while data:
+        size = 75 if not parts else 74
+        # Não corta um caractere UTF-8 ao meio
+        while size < len(data) and (data[size] & 0xC0) == 0x80:
+            size -= 1
+        parts.append(data[:size].decode())
+        data = data[size:]
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def ics_lines(header, rows):
+    """Compromissos como VEVENTs; séries recorrentes saem com RRULE/EXDATE."""
+    stamp = datetime.now(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    yield _ics_fold('BEGIN:VCALENDAR')
+    yield _ics_fold('VERSION:2.0')
+    yield _ics_fold('PRODID:-//Kanban//Compromissos//PT')
+    for row in rows:
+        item = dict(zip(header, row))
+        start = datetime.combine(item['date'], item['start_time'])
+        lines = [
+            'BEGIN:VEVENT',
+            f"UID:appointment-{item['id']}@kanban",
+            f'DTSTAMP:{stamp}',
+            f'DTSTART:{start:%Y%m%dT%H%M%S}',
+            f"DTEND:{datetime.combine(item['date'], item['end_time']):%Y%m%dT%H%M%S}",
+            f"SUMMARY:{_ics_escape(item['title'])}",
+        ]
+        if item['description']:
+            lines.append(f"DESCRIPTION:{_ics_escape(item['description'])}")
+        if item['location']:
+            lines.append(f"LOCATION:{_ics_escape(item['location'])}")
+        if item['recurrence__frequency']:
+            rule = f"RRULE:FREQ={item['recurrence__frequency'].upper()};INTERVAL={item['recurrence__interval']}"
+            if item['recurrence__until']:
+                rule += f";UNTIL={item['recurrence__until']:%Y%m%d}T235959"
+            lines.append(rule)
+            for value in item['recurrence__exceptions'] or ():
+                day = datetime.combine(datetime.fromisoformat(value).date(), item['start_time'])
+                lines.append(f'EXDATE:{day:%Y%m%dT%H%M%S}')
+        lines.append('END:VEVENT')
+        yield ''.join(_ics_fold(line) for line in lines)
+    yield _ics_fold('END:VCALENDAR')
+
+
+WRITERS = {
+    'csv': csv_lines,
+    'ndjson': ndjson_lines,
+    'ics': ics_lines,
+}
+
+
+def export_stream(kind, fmt, user=None, chunk_size=CHUNK_SIZE):
+    """Gerador de texto no formato `fmt` para o tipo `kind`."""
+    if kind not in EXPORTS:
+        raise ValueError(f'Tipo de exportação inválido: {kind}')
+    if fmt not in WRITERS or (fmt == 'ics' and kind != 'appointments'):
+        raise ValueError(f'Formato inválido para {kind}: {fmt}')
+    header = EXPORTS[kind]['fields']
+    return WRITERS[fmt](header, export_rows(kind, user, chunk_size))
@@ -0,0 +1,313 @@
+import csv
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from itertools import islice
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from tasks.models import Task
+from goals.models import Goal
+from appointments.models import Appointment, RecurrenceRule
+
+from .dashboard_cache import invalidate_user
+
+
+# Linhas validadas e inseridas por transação
+BATCH_SIZE = 500
+
+# Colunas aceitas por tipo (os mesmos nomes da exportação) e o campo dono
+IMPORTS = {
+    'tasks': {
+        'model': Task,
+        'owner': 'created_by',
+        'fields': (
+            'title', 'description', 'priority', 'status', 'due_date',
+            'estimated_hours', 'actual_hours', 'created_at',
+        ),
+    },
+    'goals': {
+        'model': Goal,
+        'owner': 'created_by',
+        'fields': ('title', 'description', 'priority', 'status', 'period', 'due_date', 'created_at'),
+    },
+    'appointments': {
+        'model': Appointment,
+        'owner': 'user',
+        'fields': (
+            'title', 'description', 'appointment_type', 'priority', 'status',
+            'date', 'start_time', 'end_time', 'location',
+        ),
+    },
+}
+
+RULE_FIELDS = {
+    'recurrence__frequency': 'frequency',
+    'recurrence__interval': 'interval',
+    'recurrence__until': 'until',
+    'recurrence__exceptions': 'exceptions',
+}
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    errors: list = field(default_factory=list)
+
+    @property
+    def failed(self):
+        return len(self.errors)
+
+    def as_dict(self, max_errors=100):
+        return {
+            'created': self.created,
+            'failed': self.failed,
+            'errors': [{'row': row, 'errors': errors} for row, errors in self.errors[:max_errors]],
+        }
+
+
+# --- Leitores: cada um produz (número da linha, dicionário) ---
+
+def read_csv(lines):
+    for number, row in enumerate(csv.DictReader(lines), start=2):
+        yield number, row
+
+
+def read_ndjson(lines):
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            record = {'__error__': f'JSON inválido: {exc}'}
+        if not isinstance(record, dict):
+            record = {'__error__': 'Cada linha deve ser um objeto JSON.'}
+        yield number, record
+
+
+def _ics_unescape(value):
+    return (
+        value.replace('\\n', '\n').replace('\\N', '\n')
+        .replace('\\,', ',').replace('\\;', ';').replace('\\\\', '\\')
+    )
+
+
+def _ics_datetime(value):
+    value = value.rstrip('Z')
+    if 'T' in value:
+        return datetime.strptime(value, '%Y%m%dT%H%M%S')
+    return datetime.strptime(value, '%Y%m%d')
+
+
+def _unfold(lines):
+    current = None
+    for number, line in enumerate(lines, start=1):
+        line = line.rstrip('\r\n')
+        if line[:1] in (' ', '\t') and current is not None:
+            current[1] += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = [number, line]
+    if current is not None:
+        yield current
+
+
+def read_ics(lines):
+    """VEVENTs como compromissos; RRULE/EXDATE viram a regra de repetição."""
+    event = None
+    for number, line in _unfold(lines):
+        name, _, value = line.partition(':')
+        # Parâmetros (ex.: DTSTART;TZID=...) são ignorados: horários locais
+        name = name.partition(';')[0].upper()
+        if name == 'BEGIN' and value.upper() == 'VEVENT':
+            event, start_line = {}, number
+        elif event is None:
+            continue
+        elif name == 'END' and value.upper() == 'VEVENT':
+            yield start_line, event
+            event = None
+        elif name in ('SUMMARY', 'DESCRIPTION', 'LOCATION'):
+            key = 'title' if name == 'SUMMARY' else name.lower()
+            event[key] = _ics_unescape(value)
+        elif name in ('DTSTART', 'DTEND'):
+            try:
+                moment = _ics_datetime(value)
+            except ValueError:
+                event['__error__'] = f'{name} inválido: {value}'
+                continue
+            if name == 'DTSTART':
+                event['date'] = moment.date().isoformat()
+                event['start_time'] = moment.strftime('%H:%M')
+            else:
+                event['end_time'] = moment.strftime('%H:%M')
+        elif name == 'RRULE':
+            parts = dict(part.partition('=')[::2] for part in value.split(';'))
+            event['recurrence__frequency'] = parts.get('FREQ', '').lower()
+            event['recurrence__interval'] = parts.get('INTERVAL', '1')
+            if parts.get('UNTIL'):
+                event['recurrence__until'] = _ics_datetime(parts['UNTIL']).date().isoformat()
+        elif name == 'EXDATE':
+            exceptions = event.setdefault('recurrence__exceptions', [])
+            for item in value.split(','):
+                try:
+                    exceptions.append(_ics_datetime(item).date().isoformat())
+                except ValueError:
+                    event['__error__'] = f'EXDATE inválido: {item}'
+
+
+READERS = {
+    'csv': read_csv,
+    'ndjson': read_ndjson,
+    'ics': read_ics,
+}
+
+
+def _batches(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _messages(error):
+    if hasattr(error, 'message_dict'):
+        return {key: list(values) for key, values in error.message_dict.items()}
+    return {'__all__': list(error.messages)}
+
+
+class Importer:
+    """
+    Importa registros de um tipo (`tasks`, `goals` ou `appointments`) para o
+    usuário `user`. Os registros são validados com as regras do model
+    (`full_clean`) em lotes de `batch_size`, e cada lote é gravado com
+    `bulk_create` numa transação própria. Erros são coletados por linha.
+    """
+
+    def __init__(self, kind, user, batch_size=BATCH_SIZE, dry_run=False):
+        if kind not in IMPORTS:
+            raise ValueError(f'Tipo de importação inválido: {kind}')
+        self.kind = kind
+        self.spec = IMPORTS[kind]
+        self.user = user
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self._usernames = {user.username: user}
+        self._assignees = {user.pk}
+
+    def run(self, records):
+        result = ImportResult()
+        for batch in _batches(records, self.batch_size):
+            self._import_batch(batch, result)
+        if result.created and not self.dry_run:
+            # bulk_create não dispara post_save: invalida os caches aqui
+            invalidate_user(*self._assignees)
+        return result
+
+    def _resolve_users(self, batch):
+        # Uma consulta por lote, só para os nomes ainda não vistos
+        names = {
+            (record.get('assigned_to__username') or record.get('assigned_to') or '').strip()
+            for _, record in batch
+        }
+        missing = names - set(self._usernames) - {''}
+        if missing:
+            for user in User.objects.filter(username__in=missing):
+                self._usernames[user.username] = user
+
+    def _build(self, record):
+        if '__error__' in record:
+            raise ValidationError(record['__error__'])
+
+        values = {}
+        for name in self.spec['fields']:
+            value = record.get(name)
+            if isinstance(value, str):
+                value = value.strip()
+            if value in (None, ''):
+                # Campo vazio: usa o default do model
+                continue
+            values[name] = value
+        instance = self.spec['model'](**values, **{self.spec['owner']: self.user})
+
+        if self.kind == 'tasks':
+            username = (record.get('assigned_to__username') or record.get('assigned_to') or '').strip()
+            assignee = self._usernames.get(username) if username else self.user
+            if assignee is None:
+                raise ValidationError({'assigned_to': [f'Usuário não encontrado: {username}']})
+            instance.assigned_to = assignee
+
+        # As FKs já foram resolvidas acima; validá-las aqui custaria uma consulta por linha
+        instance.full_clean(exclude=[self.spec['owner'], 'assigned_to'], validate_unique=False)
+        for name in self.spec['fields']:
+            value = getattr(instance, name)
+            if isinstance(value, datetime) and timezone.is_naive(value):
+                # Datas sem fuso são interpretadas no fuso atual
+                setattr(instance, name, timezone.make_aware(value))
+
+        if self.kind == 'appointments':
+            if instance.end_time <= instance.start_time:
+                raise ValidationError({'end_time': ['O horário de término deve ser posterior ao de início.']})
+            instance._import_rule = self._build_rule(record)
+        return instance
+
+    def _build_rule(self, record):
+        frequency = str(record.get('recurrence__frequency') or '').strip()
+        if not frequency:
+            return None
+        values = {target: record.get(source) for source, target in RULE_FIELDS.items()}
+        exceptions = values['exceptions'] or []
+        if isinstance(exceptions, str):
+            exceptions = json.loads(exceptions) if exceptions.startswith('[') else exceptions.split(',')
+        if not isinstance(exceptions, list):
+            raise ValidationError({'exceptions': ['Informe uma lista de datas.']})
+        values['exceptions'] = sorted({date.fromisoformat(str(day).strip()).isoformat() for day in exceptions})
+        values['interval'] = values['interval'] or 1
+        values['until'] = values['until'] or None
+        rule = RecurrenceRule(**values)
+        rule.full_clean(exclude=['appointment'])
+        return rule
+
+    def _import_batch(self, batch, result):
+        if self.kind == 'tasks':
+            self._resolve_users(batch)
+
+        valid = []
+        for number, record in batch:
+            try:
+                valid.append(self._build(record))
+            except (ValidationError, ValueError) as exc:
+                error = exc if isinstance(exc, ValidationError) else ValidationError(str(exc))
+                result.errors.append((number, _messages(error)))
+
+        if not valid:
+            return
+        if self.dry_run:
+            result.created += len(valid)
+            return
+
+        with transaction.atomic():
+            created = self.spec['model'].objects.bulk_create(valid)
+            rules = []
+            for instance in created:
+                rule = getattr(instance, '_import_rule', None)
+                if rule is not None:
+                    rule.appointment = instance
+                    rules.append(rule)
+            if rules:
+                RecurrenceRule.objects.bulk_create(rules)
+
+        result.created += len(created)
+        if self.kind == 'tasks':
+            self._assignees.update(instance.assigned_to_id for instance in created)
+
+
+def import_records(kind, fmt, lines, user, batch_size=BATCH_SIZE, dry_run=False):
+    """Lê `lines` no formato `fmt` e importa os registros de `kind` para `user`."""
+    if fmt not in READERS or (fmt == 'ics' and kind != 'appointments'):
+        raise ValueError(f'Formato inválido para {kind}: {fmt}')
+    return Importer(kind, user, batch_size, dry_run).run(READERS[fmt](lines))
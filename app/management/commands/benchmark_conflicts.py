@@ -0,0 +1,79 @@
+import random
+import time
+from datetime import date, time as dtime, timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from appointments.conflicts import find_conflicts, free_slots
+from appointments.models import Appointment
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        'Mede a detecção de conflitos e o cálculo de horários livres para um '
+        'usuário com muitos compromissos. Os dados são criados numa transação '
+        'desfeita ao final.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--appointments', type=int, default=100_000)
+        parser.add_argument('--probes', type=int, default=1_000)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        try:
+            with transaction.atomic():
+                self._run(rng, options['appointments'], options['probes'])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _run(self, rng, total, probes):
+        user = User.objects.create(username=f'bench-conflicts-{time.time_ns()}')
+        # ~8 compromissos por dia, espalhados pelos dias necessários
+        span = max(total // 8, 1)
+        first_day = date(2000, 1, 1)
+
+        started = time.perf_counter()
+        batch = []
+        for index in range(total):
+            start = rng.randrange(0, 23 * 60)
+            length = rng.choice((15, 30, 45, 60))
+            end = min(start + length, 23 * 60 + 59)
+            batch.append(Appointment(
+                title=f'Bench {index}',
+                user=user,
+                date=first_day + timedelta(days=rng.randrange(span)),
+                start_time=dtime(start // 60, start % 60),
+                end_time=dtime(end // 60, end % 60),
+            ))
+            if len(batch) == 5_000:
+                Appointment.objects.bulk_create(batch)
+                batch = []
+        Appointment.objects.bulk_create(batch)
+        self.stdout.write(f'{total} compromissos criados em {time.perf_counter() - started:.2f}s')
+
+        started = time.perf_counter()
+        found = 0
+        for _ in range(probes):
+            day = first_day + timedelta(days=rng.randrange(span))
+            hour = rng.randrange(0, 23)
+            found += len(find_conflicts(user, day, dtime(hour, 0), dtime(hour + 1, 0)))
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f'find_conflicts: {elapsed / probes * 1000:.3f} ms/chamada '
+            f'({found} conflitos em {probes} consultas)'
+        )
+
+        started = time.perf_counter()
+        for _ in range(probes):
+            free_slots(user, first_day + timedelta(days=rng.randrange(span)), days=7)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f'free_slots (7 dias): {elapsed / probes * 1000:.3f} ms/chamada')
@@ -0,0 +1,138 @@
+import io
+import json
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils.crypto import get_random_string
+
+from tasks.models import Task
+
+from .loadtest import session_cookie
+
+
+# Ajustes aplicados à conexão default em cada modo comparado
+MODES = {
+    'none': {'CONN_MAX_AGE': 0},
+    'persistent': {'CONN_MAX_AGE': 600, 'CONN_HEALTH_CHECKS': True},
+    'pool': {'CONN_MAX_AGE': 0, 'OPTIONS': {'pool': {'min_size': 1, 'max_size': 4}}},
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Mede a latência por requisição de update_task_status passando pelo '
+        'ciclo completo do handler WSGI (que fecha ou devolve a conexão ao '
+        'fim de cada requisição) sem conexão persistente, com CONN_MAX_AGE e '
+        'com o pool do psycopg 3. Use contra um PostgreSQL local.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--modes', default='none,persistent,pool', help=f'Modos ({", ".join(MODES)}).')
+        parser.add_argument('--user', required=True, help='Usuário dono da tarefa usada no teste.')
+        parser.add_argument('--requests', type=int, default=500, help='Requisições por modo.')
+        parser.add_argument('--report', help='Grava o resultado JSON neste arquivo.')
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['user'])
+        except User.DoesNotExist:
+            raise CommandError(f"Usuário não encontrado: {options['user']}")
+
+        modes = [mode for mode in options['modes'].split(',') if mode]
+        unknown = set(modes) - set(MODES)
+        if unknown:
+            raise CommandError(f"Modos desconhecidos: {', '.join(sorted(unknown))}")
+        if 'pool' in modes and connections['default'].vendor != 'postgresql':
+            self.stdout.write(self.style.WARNING('Pool só existe no PostgreSQL; modo "pool" ignorado.'))
+            modes.remove('pool')
+
+        # As requisições fecham a conexão; não dá para usar uma transação desfeita
+        task = Task.objects.create(title='Benchmark de conexões', created_by=user, assigned_to=user)
+        original = dict(connections['default'].settings_dict)
+        results = {}
+        try:
+            for mode in modes:
+                results[mode] = self._run_mode(mode, original, task, user, options['requests'])
+        finally:
+            self._configure(original)
+            Task.objects.filter(pk=task.pk).delete()
+
+        self.stdout.write(f"{'modo':<12} {'p50 ms':>9} {'p95 ms':>9} {'média ms':>9} {'connect()':>10} {'backends':>9}")
+        for mode, result in results.items():
+            self.stdout.write(
+                f"{mode:<12} {result['ms_p50']:>9.2f} {result['ms_p95']:>9.2f} "
+                f"{result['ms_mean']:>9.2f} {result['connects']:>10} {result['backends'] or '-':>9}"
+            )
+        if options['report']:
+            with open(options['report'], 'w', encoding='utf-8') as output:
+                json.dump({'vendor': connections['default'].vendor, 'results': results}, output, indent=2)
+            self.stdout.write(f"Relatório gravado em {options['report']}")
+
+    def _configure(self, settings_dict):
+        connection = connections['default']
+        connection.close()
+        if hasattr(connection, 'close_pool'):
+            connection.close_pool()
+        connection.settings_dict.clear()
+        connection.settings_dict.update(settings_dict)
+
+    def _run_mode(self, mode, original, task, user, total):
+        overrides = MODES[mode]
+        self._configure({
+            **original, **overrides,
+            'OPTIONS': {**original.get('OPTIONS', {}), **overrides.get('OPTIONS', {})},
+        })
+
+        # connect() conta aberturas (ou retiradas do pool); os PIDs de backend
+        # do PostgreSQL contam as conexões físicas de fato
+        connects = 0
+        backends = set()
+        connection = connections['default']
+        connect = connection.connect
+
+        def counting_connect():
+            nonlocal connects
+            connects += 1
+            connect()
+            info = getattr(connection.connection, 'info', None)
+            if info is not None:
+                backends.add(info.backend_pid)
+
+        connection.connect = counting_connect
+        csrf = get_random_string(32)
+        environ = RequestFactory().post(
+            reverse('tasks:update_status'),
+            content_type='application/json',
+            HTTP_COOKIE=f'{session_cookie(user)}; csrftoken={csrf}',
+            HTTP_X_CSRFTOKEN=csrf,
+        ).environ
+        handler = WSGIHandler()
+        statuses = ('todo', 'in_progress')
+        timings = []
+        try:
+            for index in range(total):
+                body = json.dumps({'id': task.pk, 'status': statuses[index % 2]}).encode()
+                request_environ = {**environ, 'wsgi.input': io.BytesIO(body), 'CONTENT_LENGTH': str(len(body))}
+                started = time.perf_counter()
+                response = handler(request_environ, lambda status, headers: None)
+                response.close()
+                timings.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    raise CommandError(f'{mode}: resposta {response.status_code}: {response.content[:200]!r}')
+        finally:
+            del connection.connect
+
+        ordered = sorted(timings)
+        return {
+            'ms_p50': round(statistics.median(ordered), 3),
+            'ms_p95': round(ordered[int(len(ordered) * 0.95) - 1], 3),
+            'ms_mean': round(statistics.fmean(ordered), 3),
+            'connects': connects,
+            'backends': len(backends),
+        }
@@ -0,0 +1,91 @@
+import random
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app.importer import Importer
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _task_records(count, rng, usernames):
+    for index in range(count):
+        yield index + 2, {
+            'title': f'Tarefa importada {index}',
+            'description': 'Gerada pelo benchmark de importação',
+            'priority': rng.choice(('low', 'medium', 'high')),
+            'status': rng.choice(('todo', 'in_progress', 'done')),
+            'assigned_to__username': rng.choice(usernames),
+            'estimated_hours': f'{rng.randrange(1, 40)}.50',
+            'due_date': '',
+        }
+
+
+def _goal_records(count, rng, usernames):
+    for index in range(count):
+        yield index + 2, {
+            'title': f'Meta importada {index}',
+            'priority': rng.choice(('low', 'medium', 'high')),
+            'period': rng.choice(('weekly', 'monthly', 'annual')),
+        }
+
+
+def _appointment_records(count, rng, usernames):
+    for index in range(count):
+        hour = rng.randrange(0, 23)
+        yield index + 2, {
+            'title': f'Compromisso importado {index}',
+            'date': f'2030-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}',
+            'start_time': f'{hour:02d}:00',
+            'end_time': f'{hour:02d}:45',
+        }
+
+
+GENERATORS = {
+    'tasks': _task_records,
+    'goals': _goal_records,
+    'appointments': _appointment_records,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Mede a vazão da importação em lote (registros/s) para cada tamanho de '
+        'lote. Os dados são criados numa transação desfeita ao final.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', nargs='?', choices=sorted(GENERATORS), default='tasks')
+        parser.add_argument('--rows', type=int, default=20_000)
+        parser.add_argument('--batch-sizes', default='100,500,2000')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        batch_sizes = [int(size) for size in options['batch_sizes'].split(',')]
+        try:
+            with transaction.atomic():
+                self._run(options['kind'], options['rows'], batch_sizes, options['seed'])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _run(self, kind, rows, batch_sizes, seed):
+        stamp = time.time_ns()
+        users = User.objects.bulk_create([
+            User(username=f'bench-import-{stamp}-{index}') for index in range(20)
+        ])
+        usernames = [user.username for user in users]
+
+        for batch_size in batch_sizes:
+            records = GENERATORS[kind](rows, random.Random(seed), usernames)
+            started = time.perf_counter()
+            result = Importer(kind, users[0], batch_size=batch_size).run(records)
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f'{kind} lote={batch_size}: {result.created} criados, {result.failed} erros, '
+                f'{elapsed:.2f}s ({result.created / elapsed:.0f} registros/s)'
+            )
@@ -0,0 +1,126 @@
+import json
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.template import engines
+from django.test import RequestFactory
+from django.utils import timezone
+
+from tasks.models import Task
+
+from app.seed import seed_user
+from app.views import build_dashboard_snapshot
+
+
+TEMPLATE = 'main_dashboard.html'
+
+
+class Command(BaseCommand):
+    help = (
+        'Mede a renderização do dashboard principal com volume realista: sem '
+        'cache de fragmentos, com o cache frio (primeira renderização) e '
+        'quente, e com um card alterado. Os dados semeados são desfeitos ao final.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--volume', type=int, default=2000,
+                            help='Tarefas, metas e compromissos criados (cada).')
+        parser.add_argument('--user', help='Usa um usuário já populado em vez de semear.')
+        parser.add_argument('--repeat', type=int, default=5, help='Renderizações por cenário.')
+        parser.add_argument('--report', help='Grava o resultado JSON neste arquivo.')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            report = self._run(options)
+            transaction.set_rollback(True)
+        caches['fragments'].clear()
+
+        if options['report']:
+            with open(options['report'], 'w', encoding='utf-8') as output:
+                json.dump(report, output, indent=2)
+            self.stdout.write(f"Relatório gravado em {options['report']}")
+
+    def _prepare_user(self, options):
+        if options['user']:
+            try:
+                return User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"Usuário não encontrado: {options['user']}")
+        user = User.objects.create(username=f'bench-templates-{time.time_ns()}')
+        volume = options['volume']
+        seed_user(user, tasks=volume, goals=volume, appointments=volume)
+        return user
+
+    def _render(self, template, context, request):
+        started = time.perf_counter()
+        template.render(context, request)
+        return (time.perf_counter() - started) * 1000
+
+    def _run(self, options):
+        user = self._prepare_user(options)
+        repeat = max(options['repeat'], 1)
+        request = RequestFactory().get('/')
+        request.user = user
+        context = {'page_title': 'Dashboard', 'user': user, **build_dashboard_snapshot(user)}
+        cards = sum(len(context[key]) for key in (
+            'todo_tasks', 'in_progress_tasks', 'done_tasks', 'goals_weekly', 'goals_monthly',
+            'goals_quarterly', 'goals_biannual', 'goals_annual', 'all_recent_appointments',
+        ))
+
+        engine = engines['django'].engine
+        loaders = [type(loader).__module__ + '.' + type(loader).__name__ for loader in engine.template_loaders]
+
+        # Carregar o template: a primeira vez compila; com cached.Loader as seguintes saem da memória
+        started = time.perf_counter()
+        template = engines['django'].get_template(TEMPLATE)
+        load_first = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        engines['django'].get_template(TEMPLATE)
+        load_again = (time.perf_counter() - started) * 1000
+
+        fragments = caches['fragments']
+        results = {}
+
+        caches['fragments'] = DummyCache('', {})
+        try:
+            results['sem_cache'] = [self._render(template, context, request) for _ in range(repeat)]
+        finally:
+            caches['fragments'] = fragments
+
+        fragments.clear()
+        results['cache_frio'] = [self._render(template, context, request)]
+        results['cache_quente'] = [self._render(template, context, request) for _ in range(repeat)]
+
+        # Um card alterado: só ele é renderizado de novo
+        changed = next(
+            (card for key in ('todo_tasks', 'in_progress_tasks', 'done_tasks') for card in context[key]),
+            None,
+        )
+        if changed is not None:
+            # update() não aplica auto_now: updated_at vai junto, como num save()
+            Task.objects.filter(pk=changed.pk).update(title=f'{changed.title}*', updated_at=timezone.now())
+            changed.refresh_from_db(fields=['title', 'updated_at'])
+            results['um_card_alterado'] = [self._render(template, context, request)]
+
+        self.stdout.write(f'Loaders: {", ".join(loaders)}')
+        self.stdout.write(f'Carregar {TEMPLATE}: {load_first:.2f}ms na primeira vez, {load_again:.3f}ms depois')
+        self.stdout.write(f'{cards} cards no dashboard')
+        self.stdout.write(f"{'cenário':<18} {'mediana ms':>11} {'máx ms':>9}")
+        summary = {}
+        for name, timings in results.items():
+            summary[name] = {'ms_p50': round(statistics.median(timings), 2), 'ms_max': round(max(timings), 2)}
+            self.stdout.write(f"{name:<18} {summary[name]['ms_p50']:>11.2f} {summary[name]['ms_max']:>9.2f}")
+
+        return {
+            'template': TEMPLATE,
+            'loaders': loaders,
+            'load_ms': {'first': round(load_first, 3), 'again': round(load_again, 3)},
+            'cards': cards,
+            'repeat': repeat,
+            'results': summary,
+        }
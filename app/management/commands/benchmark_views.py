@@ -0,0 +1,265 @@
+import json
+import logging
+import statistics
+import time
+from datetime import timedelta
+from importlib import import_module
+from urllib.parse import quote
+
+import django
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+
+from tasks.models import Task
+from goals.models import Goal
+from appointments.models import Appointment
+
+from app.dashboard_cache import invalidate_user
+from app.seed import seed_user
+
+
+# URLconfs cobertos; os includes de app.urls são percorridos pelos próprios módulos
+URLCONFS = ('app.urls', 'tasks.urls', 'goals.urls', 'appointments.urls')
+
+# Rotas que não fazem sentido num benchmark autenticado
+SKIP = {'logout', 'login'}
+
+# Model usado para preencher <pk> em cada namespace
+PK_MODELS = {
+    'tasks': (Task, 'created_by'),
+    'goals': (Goal, 'created_by'),
+    'appointments': (Appointment, 'user'),
+}
+
+# Argumentos de rota e variações de query string por view; {recent} vira um
+# instante de poucos minutos atrás (diff incremental típico de um board)
+ROUTE_KWARGS = {
+    'export_data': {'kind': 'tasks', 'fmt': 'csv'},
+    'import_data': {'kind': 'tasks'},
+}
+VARIANTS = {
+    'global_search': ['q=Tarefa'],
+    'assignee_autocomplete': ['q=b'],
+    'tasks:task_list': ['', 'pagination=cursor'],
+    'tasks:tasks_board': ['', 'since={recent}'],
+    'goals:goals_board': ['', 'since={recent}'],
+    'main_dashboard_tasks_diff': ['since={recent}'],
+    'appointments:appointment_calendar': ['', 'view=week', 'months=3'],
+    'appointments:appointment_free_slots': ['days=7'],
+}
+
+# Orçamento por requisição: consultas (com cache frio) e ms (mediana). Os
+# limites de consultas são o custo medido de cada view (--volume 1000) mais
+# uma de folga, para que um N+1 ou uma consulta a mais apareça como falha;
+# sessão e usuário já contam 2. Views novas caem no padrão até terem o seu.
+DEFAULT_BUDGET = {'queries': 5, 'ms': 500}
+BUDGETS = {
+    # Boards, snapshot e agregados dos contadores, compromissos expandidos
+    'main_dashboard': {'queries': 13},
+    'main_dashboard_tasks_diff': {'queries': 4},
+    'global_search': {'queries': 6},
+    'assignee_autocomplete': {'queries': 4},
+    'board_events': {'queries': 3},
+    'metrics': {'queries': 3},
+    'export_data': {'queries': 4, 'ms': 5000},
+    'import_data': {'queries': 3},
+    'tasks:task_list': {'queries': 5},
+    'tasks:task_dashboard': {'queries': 5},
+    'tasks:tasks_board': {'queries': 6, 'ms': 1000},
+    'tasks:task_create': {'queries': 4},
+    'tasks:task_detail': {'queries': 8},
+    'tasks:task_update': {'queries': 5},
+    'tasks:task_delete': {'queries': 5},
+    'goals:goal_list': {'queries': 5},
+    'goals:goal_dashboard': {'queries': 8},
+    'goals:goals_board': {'queries': 6, 'ms': 1000},
+    'goals:goal_create': {'queries': 3},
+    'goals:goal_detail': {'queries': 7},
+    'goals:goal_update': {'queries': 4},
+    'goals:goal_delete': {'queries': 5},
+    'appointments:appointment_list': {'queries': 5},
+    'appointments:appointments_dashboard': {'queries': 11},
+    'appointments:appointment_calendar': {'queries': 7, 'ms': 800},
+    'appointments:appointment_free_slots': {'queries': 6},
+    'appointments:appointment_create': {'queries': 4},
+    'appointments:appointment_detail': {'queries': 7},
+    'appointments:appointment_update': {'queries': 6},
+    'appointments:appointment_delete': {'queries': 4},
+    'appointments:update_appointment_status': {'queries': 3},
+}
+
+# Respostas de erro esperadas num GET autenticado comum; além delas só o 405
+# (endpoints só POST) é aceito, qualquer outro 4xx/5xx é falha
+EXPECTED_STATUS = {
+    'metrics': 403,  # restrito a staff ou token
+    'appointments:update_appointment_status': 400,  # responde 400 a GET
+}
+
+
+def iter_routes():
+    """(nome, padrão) de cada rota dos URLconfs cobertos, com namespace."""
+    for module_name in URLCONFS:
+        module = import_module(module_name)
+        namespace = getattr(module, 'app_name', None)
+        for pattern in module.urlpatterns:
+            if not isinstance(pattern, URLPattern) or not pattern.name:
+                continue
+            yield (f'{namespace}:{pattern.name}' if namespace else pattern.name), pattern
+
+
+class Command(BaseCommand):
+    help = (
+        'Semeia volumes realistas e acessa todas as views, medindo consultas e '
+        'tempo de cada uma contra um orçamento. Grava um relatório JSON para '
+        'comparar execuções (ex.: SQLite x PostgreSQL).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--volume', type=int, default=1000,
+                            help='Tarefas, metas e compromissos criados (cada).')
+        parser.add_argument('--user', help='Usa um usuário já populado em vez de semear.')
+        parser.add_argument('--repeat', type=int, default=5, help='Requisições por URL.')
+        parser.add_argument('--report', help='Grava o relatório JSON neste arquivo.')
+        parser.add_argument('--budgets', help='JSON com orçamentos por view (sobrepõe os padrões).')
+        parser.add_argument('--keep', action='store_true', help='Mantém os dados semeados.')
+        parser.add_argument('--no-fail', action='store_true',
+                            help='Não falha ao estourar orçamento (respostas de erro sempre falham).')
+
+    def handle(self, *args, **options):
+        budgets = dict(BUDGETS)
+        if options['budgets']:
+            with open(options['budgets'], encoding='utf-8') as source:
+                budgets.update(json.load(source))
+
+        # Os 4xx/5xx esperados (ex.: GET em endpoints só POST) não devem poluir a saída
+        logging.disable(logging.CRITICAL)
+        try:
+            with transaction.atomic():
+                report = self._run(options, budgets)
+                if not options['keep']:
+                    transaction.set_rollback(True)
+        finally:
+            logging.disable(logging.NOTSET)
+            cache.clear()
+
+        if options['report']:
+            with open(options['report'], 'w', encoding='utf-8') as output:
+                json.dump(report, output, indent=2)
+            self.stdout.write(f"Relatório gravado em {options['report']}")
+
+        errors = [result for result in report['results'] if not result['status_ok']]
+        over_budget = [result for result in report['results'] if not result['within_budget']]
+        if errors or (over_budget and not options['no_fail']):
+            raise CommandError(
+                f'{len(errors)} requisições com status de erro, '
+                f'{len(over_budget)} fora do orçamento'
+            )
+
+    def _prepare_user(self, options):
+        if options['user']:
+            try:
+                return User.objects.get(username=options['user']), 0.0
+            except User.DoesNotExist:
+                raise CommandError(f"Usuário não encontrado: {options['user']}")
+
+        started = time.perf_counter()
+        stamp = time.time_ns()
+        users = User.objects.bulk_create([User(username=f'bench-{stamp}-{index}') for index in range(10)])
+        user = users[0]
+        volume = options['volume']
+        seed_user(user, tasks=volume, goals=volume, appointments=volume, assignees=users)
+        invalidate_user(*(member.pk for member in users))
+        return user, time.perf_counter() - started
+
+    def _build_requests(self, user):
+        recent = (timezone.now() - timedelta(minutes=5)).isoformat()
+        for name, pattern in iter_routes():
+            if name in SKIP:
+                continue
+            kwargs = dict(ROUTE_KWARGS.get(name, {}))
+            if 'pk' in pattern.pattern.converters:
+                model, owner = PK_MODELS[name.split(':')[0]]
+                pk = model.objects.filter(**{owner: user}).order_by('-pk').values_list('pk', flat=True).first()
+                if pk is None:
+                    continue
+                kwargs['pk'] = pk
+            url = reverse(name, kwargs=kwargs)
+            for query in VARIANTS.get(name, ['']):
+                query = query.format(recent=quote(recent))
+                yield name, f'{url}?{query}' if query else url
+
+    def _measure(self, client, url, repeat):
+        timings = []
+        queries = []
+        status = None
+        cache.clear()
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = client.get(url)
+                if response.streaming:
+                    b''.join(response.streaming_content)
+                timings.append((time.perf_counter() - started) * 1000)
+            queries.append(len(captured))
+            status = response.status_code
+        return status, queries, timings
+
+    def _run(self, options, budgets):
+        user, seed_seconds = self._prepare_user(options)
+        client = Client(raise_request_exception=False)
+        client.force_login(user)
+        repeat = max(options['repeat'], 1)
+
+        results = []
+        for name, url in self._build_requests(user):
+            status, queries, timings = self._measure(client, url, repeat)
+            budget = {**DEFAULT_BUDGET, **budgets.get(name, {})}
+            warm = timings[1:] or timings
+            result = {
+                'name': name,
+                'url': url,
+                'status': status,
+                'queries_cold': queries[0],
+                'queries_warm': max(queries[1:] or queries),
+                'ms_cold': round(timings[0], 2),
+                'ms_p50': round(statistics.median(warm), 2),
+                'ms_max': round(max(warm), 2),
+                'budget': budget,
+            }
+            result['status_ok'] = status < 400 or status in (405, EXPECTED_STATUS.get(name))
+            # Um 405 responde antes da view: consultas e tempo não dizem nada
+            result['within_budget'] = status == 405 or (
+                result['queries_cold'] <= budget['queries'] and result['ms_p50'] <= budget['ms']
+            )
+            result['ok'] = result['status_ok'] and result['within_budget']
+            results.append(result)
+            self._print(result)
+
+        return {
+            'generated_at': timezone.now().isoformat(),
+            'vendor': connection.vendor,
+            'django': django.get_version(),
+            'volume': None if options['user'] else options['volume'],
+            'user': user.username,
+            'seed_seconds': round(seed_seconds, 2),
+            'repeat': repeat,
+            'results': results,
+        }
+
+    def _print(self, result):
+        line = (
+            f"{result['status']:>3}  {result['queries_cold']:>3}q/{result['queries_warm']:>3}q  "
+            f"{result['ms_cold']:>8.1f}ms/{result['ms_p50']:>8.1f}ms  {result['url']}"
+        )
+        if result['ok']:
+            self.stdout.write(line)
+        elif not result['status_ok']:
+            self.stdout.write(self.style.ERROR(f"{line}  (status inesperado)"))
+        else:
+            self.stdout.write(self.style.ERROR(f"{line}  (orçamento: {result['budget']})"))
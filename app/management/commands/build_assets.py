@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app.assets import BUNDLES, build_all
+
+
+def _kb(size):
+    return '-' if size is None else f'{size / 1024:.1f}'
+
+
+class Command(BaseCommand):
+    help = (
+        'Concatena e minifica o CSS/JS de cada página em static/bundles/ e '
+        'mostra o tamanho de cada bundle (original, minificado, gzip, brotli). '
+        'Rode antes do collectstatic, que gera os nomes com hash e as versões '
+        'comprimidas.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('bundles', nargs='*', help=f'Bundles a gerar (padrão: todos: {", ".join(BUNDLES)}).')
+
+    def handle(self, *args, **options):
+        unknown = set(options['bundles']) - set(BUNDLES)
+        if unknown:
+            raise CommandError(f"Bundles desconhecidos: {', '.join(sorted(unknown))}")
+
+        results = build_all(options['bundles'])
+        self.stdout.write(f"{'bundle':<22} {'fontes':>6} {'original':>9} {'min':>8} {'gzip':>8} {'brotli':>8}  (KiB)")
+        totals = {'raw': 0, 'minified': 0, 'gzip': 0, 'brotli': 0}
+        for result in results:
+            self.stdout.write(
+                f"{result['name']:<22} {len(result['sources']):>6} {_kb(result['raw']):>9} "
+                f"{_kb(result['minified']):>8} {_kb(result['gzip']):>8} {_kb(result['brotli']):>8}"
+            )
+            for key in totals:
+                if totals[key] is not None and result[key] is not None:
+                    totals[key] += result[key]
+                else:
+                    totals[key] = None
+        self.stdout.write(
+            f"{'total':<22} {'':>6} {_kb(totals['raw']):>9} {_kb(totals['minified']):>8} "
+            f"{_kb(totals['gzip']):>8} {_kb(totals['brotli']):>8}"
+        )
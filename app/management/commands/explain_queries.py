@@ -0,0 +1,95 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from tasks.models import Task
+from goals.models import Goal
+from appointments.models import Appointment
+from appointments.recurrence import occurrences
+
+from app.boards import (
+    DASHBOARD_TASK_ORDER, DASHBOARD_TASKS_PER_COLUMN, dashboard_tasks, load_goal_board, load_task_board,
+)
+from app.stats import appointment_stats, goal_stats, task_stats
+
+
+def view_calls(user):
+    """
+    (rótulo, função) com as mesmas chamadas que as views fazem: os helpers de
+    app.boards, app.stats e da expansão de recorrências. O EXPLAIN é feito
+    sobre o SQL que elas executam, então não há consultas montadas à mão que
+    possam divergir das views.
+    """
+    today = timezone.localdate()
+    tasks = Task.objects.filter(created_by=user)
+    goals = Goal.objects.filter(created_by=user)
+    appointments = Appointment.objects.filter(user=user)
+
+    yield 'tasks_board', lambda: load_task_board(tasks)
+    yield 'task_list', lambda: list(tasks.select_related('assigned_to').order_by('-created_at', '-id')[:10])
+    yield 'task_dashboard (estatísticas)', lambda: task_stats(tasks)
+    yield 'main_dashboard (board de tarefas)', lambda: load_task_board(
+        dashboard_tasks(user), order_by=DASHBOARD_TASK_ORDER, per_column=DASHBOARD_TASKS_PER_COLUMN,
+    )
+    yield 'main_dashboard (estatísticas de tarefas)', lambda: task_stats(dashboard_tasks(user))
+    yield 'goals_board', lambda: load_goal_board(goals)
+    yield 'goal_list', lambda: list(goals.order_by('-created_at', '-id')[:10])
+    yield 'goal_dashboard (estatísticas)', lambda: goal_stats(goals)
+    yield 'appointments_dashboard (próximos 7 dias)', lambda: list(
+        occurrences(user, today + timedelta(days=1), today + timedelta(days=7))
+    )
+    yield 'appointments_dashboard (estatísticas)', lambda: appointment_stats(appointments, today=today)
+    yield 'appointment_calendar (mês)', lambda: list(
+        occurrences(user, today.replace(day=1), today.replace(day=28))
+    )
+
+
+def captured_queries(call):
+    """SQL (já com os parâmetros) executado por `call`."""
+    with CaptureQueriesContext(connection) as captured:
+        call()
+    return [query['sql'] for query in captured]
+
+
+class Command(BaseCommand):
+    help = 'Mostra o EXPLAIN das consultas principais de cada view para um usuário.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help='Username usado nos filtros (padrão: primeiro usuário).')
+        parser.add_argument(
+            '--analyze', action='store_true',
+            help='Executa as consultas (EXPLAIN ANALYZE, apenas PostgreSQL).',
+        )
+
+    def handle(self, *args, **options):
+        if options['user']:
+            try:
+                user = User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"Usuário '{options['user']}' não encontrado.")
+        else:
+            user = User.objects.order_by('pk').first()
+            if user is None:
+                raise CommandError('Nenhum usuário cadastrado.')
+
+        explain_options = {}
+        if options['analyze']:
+            if connection.vendor != 'postgresql':
+                raise CommandError('--analyze só é suportado no PostgreSQL.')
+            explain_options = {'analyze': True}
+
+        prefix = connection.ops.explain_query_prefix(**explain_options)
+        for label, call in view_calls(user):
+            queries = captured_queries(call)
+            for index, sql in enumerate(queries, start=1):
+                suffix = f' [{index}/{len(queries)}]' if len(queries) > 1 else ''
+                self.stdout.write(self.style.MIGRATE_HEADING(f'{label}{suffix}'))
+                with connection.cursor() as cursor:
+                    cursor.execute(f'{prefix} {sql}')
+                    self.stdout.write('\n'.join(' '.join(map(str, row)) for row in cursor.fetchall()))
+                self.stdout.write('')
+
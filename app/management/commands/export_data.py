@@ -0,0 +1,37 @@
+import sys
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from app.export import CHUNK_SIZE, EXPORTS, WRITERS, export_stream
+
+
+class Command(BaseCommand):
+    help = 'Exporta tarefas, metas ou compromissos em CSV, NDJSON ou .ics, em streaming.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=sorted(EXPORTS))
+        parser.add_argument('--format', dest='fmt', choices=sorted(WRITERS), default='csv')
+        parser.add_argument('--user', help='Exporta só os dados deste usuário (padrão: todos).')
+        parser.add_argument('--output', '-o', help='Arquivo de saída (padrão: stdout).')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        user = None
+        if options['user']:
+            try:
+                user = User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"Usuário não encontrado: {options['user']}")
+
+        try:
+            stream = export_stream(options['kind'], options['fmt'], user, options['chunk_size'])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8', newline='') as output:
+                output.writelines(stream)
+            self.stderr.write(f"Exportação gravada em {options['output']}")
+        else:
+            sys.stdout.writelines(stream)
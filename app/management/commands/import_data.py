@@ -0,0 +1,70 @@
+import json
+import sys
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from app.importer import BATCH_SIZE, IMPORTS, READERS, import_records
+
+
+class Command(BaseCommand):
+    help = (
+        'Importa tarefas, metas ou compromissos de um arquivo CSV, NDJSON ou .ics '
+        'para um usuário. Pode rodar em segundo plano (cron, nohup, job do '
+        'container); o relatório de erros sai em JSON com --report.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=sorted(IMPORTS))
+        parser.add_argument('path', help="Arquivo de entrada ('-' para stdin).")
+        parser.add_argument('--user', required=True, help='Dono dos registros importados.')
+        parser.add_argument('--format', dest='fmt', choices=sorted(READERS),
+                            help='Formato do arquivo (padrão: pela extensão).')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+        parser.add_argument('--dry-run', action='store_true', help='Só valida, sem gravar.')
+        parser.add_argument('--report', help='Grava o relatório (JSON) neste arquivo.')
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['user'])
+        except User.DoesNotExist:
+            raise CommandError(f"Usuário não encontrado: {options['user']}")
+
+        path = options['path']
+        fmt = options['fmt'] or path.rsplit('.', 1)[-1].lower()
+        if fmt not in READERS:
+            raise CommandError('Não foi possível deduzir o formato; use --format.')
+
+        started = time.perf_counter()
+        try:
+            if path == '-':
+                result = self._import(options, fmt, sys.stdin, user)
+            else:
+                with open(path, encoding='utf-8-sig', newline='') as source:
+                    result = self._import(options, fmt, source, user)
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc))
+        elapsed = time.perf_counter() - started
+
+        if options['report']:
+            with open(options['report'], 'w', encoding='utf-8') as report:
+                json.dump(result.as_dict(max_errors=None), report, ensure_ascii=False, indent=2)
+
+        for row, errors in result.errors[:20]:
+            self.stderr.write(f'Linha {row}: {json.dumps(errors, ensure_ascii=False)}')
+        if result.failed > 20:
+            self.stderr.write(f'... e mais {result.failed - 20} linhas com erro')
+
+        verb = 'válidos' if options['dry_run'] else 'importados'
+        rate = result.created / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'{result.created} registros {verb}, {result.failed} com erro '
+            f'em {elapsed:.2f}s ({rate:.0f} registros/s)'
+        ))
+
+    def _import(self, options, fmt, source, user):
+        return import_records(
+            options['kind'], fmt, source, user,
+            batch_size=options['batch_size'], dry_run=options['dry_run'],
+        )
@@ -0,0 +1,186 @@
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+
+# Como subir cada servidor comparado; {port} é trocado pela porta livre
+SERVERS = {
+    'runserver': [sys.executable, 'manage.py', 'runserver', '127.0.0.1:{port}'],
+    'wsgi': ['gunicorn', '--config', 'gunicorn.conf.py', '--bind', '127.0.0.1:{port}'],
+    'asgi': ['gunicorn', '--config', 'gunicorn.conf.py', '--bind', '127.0.0.1:{port}'],
+}
+
+DEFAULT_PATHS = ['/', '/tasks/', '/goals/', '/appointments/']
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(port, process, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise CommandError(f'O servidor terminou na inicialização (código {process.returncode})')
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise CommandError(f'O servidor não respondeu na porta {port} em {timeout}s')
+
+
+def session_cookie(user):
+    """Cookie de sessão autenticada para `user`, sem passar pelo formulário de login."""
+    store = import_string(f'{settings.SESSION_ENGINE}.SessionStore')()
+    store[SESSION_KEY] = str(user.pk)
+    store[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+    store[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    store.save()
+    return f'{settings.SESSION_COOKIE_NAME}={store.session_key}'
+
+
+def _worker(host, port, paths, headers, deadline, samples, errors):
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    index = 0
+    while time.monotonic() < deadline:
+        path = paths[index % len(paths)]
+        index += 1
+        started = time.perf_counter()
+        try:
+            connection.request('GET', path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors.append(path)
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        elapsed = (time.perf_counter() - started) * 1000
+        if response.status >= 400:
+            errors.append(path)
+        else:
+            samples.append(elapsed)
+    connection.close()
+
+
+def run_load(host, port, paths, headers, concurrency, duration):
+    """Dispara `concurrency` clientes keep-alive por `duration` segundos."""
+    samples, errors = [], []
+    deadline = time.monotonic() + duration
+    threads = [
+        threading.Thread(target=_worker, args=(host, port, paths, headers, deadline, samples, errors))
+        for _ in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(samples)
+    return {
+        'requests': len(samples),
+        'errors': len(errors),
+        'rps': round(len(samples) / elapsed, 1),
+        'ms_p50': round(statistics.median(ordered), 2) if ordered else None,
+        'ms_p95': round(ordered[int(len(ordered) * 0.95) - 1], 2) if ordered else None,
+        'ms_max': round(ordered[-1], 2) if ordered else None,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        'Teste de carga: sobe cada servidor (runserver, Gunicorn WSGI/ASGI) numa '
+        'porta local, dispara requisições autenticadas concorrentes e compara '
+        'vazão e latência. Com --target, mede um servidor já em execução.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--servers', default='runserver,wsgi',
+                            help=f'Servidores a comparar ({", ".join(SERVERS)}).')
+        parser.add_argument('--target', help='URL base de um servidor já no ar (ex.: http://127.0.0.1:48321).')
+        parser.add_argument('--user', help='Usuário autenticado nas requisições.')
+        parser.add_argument('--path', action='append', dest='paths', help='Caminho a requisitar (repetível).')
+        parser.add_argument('--concurrency', type=int, default=8)
+        parser.add_argument('--duration', type=float, default=10.0, help='Segundos por servidor.')
+        parser.add_argument('--warmup', type=float, default=2.0, help='Segundos de aquecimento descartados.')
+        parser.add_argument('--workers', type=int, help='WEB_CONCURRENCY repassado ao Gunicorn.')
+        parser.add_argument('--report', help='Grava o resultado JSON neste arquivo.')
+
+    def handle(self, *args, **options):
+        paths = options['paths'] or DEFAULT_PATHS
+        headers = {'Connection': 'keep-alive'}
+        if options['user']:
+            try:
+                user = User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"Usuário não encontrado: {options['user']}")
+            headers['Cookie'] = session_cookie(user)
+
+        results = {}
+        if options['target']:
+            parts = urlsplit(options['target'])
+            results['target'] = self._measure(parts.hostname, parts.port or 80, paths, headers, options)
+        else:
+            for name in filter(None, options['servers'].split(',')):
+                if name not in SERVERS:
+                    raise CommandError(f'Servidor desconhecido: {name}')
+                results[name] = self._run_server(name, paths, headers, options)
+
+        self._print(results)
+        if options['report']:
+            with open(options['report'], 'w', encoding='utf-8') as output:
+                json.dump({'paths': paths, 'concurrency': options['concurrency'],
+                           'duration': options['duration'], 'results': results}, output, indent=2)
+            self.stdout.write(f"Relatório gravado em {options['report']}")
+
+    def _run_server(self, name, paths, headers, options):
+        port = _free_port()
+        env = {**os.environ, 'SERVER_MODE': name, 'PORT': str(port), 'GUNICORN_ACCESS_LOG': ''}
+        if options['workers']:
+            env['WEB_CONCURRENCY'] = str(options['workers'])
+        command = [part.format(port=port) for part in SERVERS[name]]
+        self.stdout.write(f"Subindo {name}: {' '.join(command)}")
+        process = subprocess.Popen(
+            command, cwd=settings.BASE_DIR, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            _wait_ready(port, process)
+            return self._measure('127.0.0.1', port, paths, headers, options)
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    def _measure(self, host, port, paths, headers, options):
+        if options['warmup'] > 0:
+            run_load(host, port, paths, headers, options['concurrency'], options['warmup'])
+        return run_load(host, port, paths, headers, options['concurrency'], options['duration'])
+
+    def _print(self, results):
+        self.stdout.write(f"{'servidor':<10} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'máx ms':>9} {'erros':>6}")
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:<10} {result['rps']:>8} {result['ms_p50'] or 0:>9.1f} "
+                f"{result['ms_p95'] or 0:>9.1f} {result['ms_max'] or 0:>9.1f} {result['errors']:>6}"
+            )
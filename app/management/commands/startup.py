@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from app import startup
+
+
+class Command(BaseCommand):
+    help = (
+        'Prepara o ambiente num único processo: espera o banco, aplica '
+        'migrations só se houver pendências e coleta estáticos só se o '
+        'manifesto não existir. Com --write-fingerprint, grava o fingerprint '
+        'das migrations (usado no build da imagem).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--write-fingerprint', action='store_true',
+                            help='Só grava migrations.lock e sai (não acessa o banco).')
+        parser.add_argument('--skip-migrate', action='store_true')
+        parser.add_argument('--skip-static', action='store_true')
+        parser.add_argument('--db-timeout', type=int, default=30,
+                            help='Segundos esperando o banco ficar acessível.')
+
+    def handle(self, *args, **options):
+        if options['write_fingerprint']:
+            data = startup.write_fingerprint()
+            self.stdout.write(f"{startup.FINGERPRINT_FILE.name}: {data['fingerprint']} "
+                              f"({len(data['migrations'])} migrations)")
+            return
+        startup.run(
+            migrate=not options['skip_migrate'],
+            static=not options['skip_static'],
+            db_timeout=options['db_timeout'],
+        )
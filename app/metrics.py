@@ -0,0 +1,236 @@
+import json
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import ExitStack
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.template.backends.django import DjangoTemplates
+
+
+logger = logging.getLogger('app.performance')
+
+# Métricas da requisição em andamento (uma por thread/tarefa)
+_current = ContextVar('request_metrics', default=None)
+
+
+@dataclass
+class RequestMetrics:
+    queries: int = 0
+    db_time: float = 0.0
+    template_time: float = 0.0
+
+
+def _db_wrapper(execute, sql, params, many, context):
+    metrics = _current.get()
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        if metrics is not None:
+            metrics.queries += 1
+            metrics.db_time += time.perf_counter() - started
+
+
+# --- Templates ---
+
+class InstrumentedTemplate:
+    """Template do backend Django que soma o tempo de renderização na requisição."""
+
+    def __init__(self, template):
+        self.template = template
+
+    @property
+    def origin(self):
+        return self.template.origin
+
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        started = time.perf_counter()
+        try:
+            return self.template.render(context, request)
+        finally:
+            if metrics is not None:
+                metrics.template_time += time.perf_counter() - started
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """Backend `DjangoTemplates` que mede o tempo de cada renderização."""
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name):
+        return InstrumentedTemplate(super().get_template(template_name))
+
+
+# --- Histogramas no formato texto do Prometheus ---
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+METRICS = {
+    'kanban_request_duration_seconds': ('Tempo total da requisição.', DURATION_BUCKETS),
+    'kanban_db_duration_seconds': ('Tempo gasto no banco por requisição.', DURATION_BUCKETS),
+    'kanban_template_duration_seconds': ('Tempo de renderização de templates por requisição.', DURATION_BUCKETS),
+    'kanban_db_queries': ('Consultas ao banco por requisição.', QUERY_BUCKETS),
+    'kanban_response_size_bytes': ('Tamanho do corpo da resposta.', SIZE_BUCKETS),
+}
+
+
+class Registry:
+    """
+    Histogramas por (métrica, rota, método) e contador de respostas por status.
+    Os valores são do processo atual; com vários workers, cada um expõe os seus.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._responses = {}
+
+    def observe(self, name, labels, value):
+        buckets = METRICS[name][1]
+        key = (name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [[0] * (len(buckets) + 1), 0.0, 0]
+            index = bisect_left(buckets, value)
+            histogram[0][index] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def count_response(self, labels):
+        with self._lock:
+            self._responses[labels] = self._responses.get(labels, 0) + 1
+
+    def render(self):
+        with self._lock:
+            histograms = {key: (list(counts), total, count) for key, (counts, total, count) in self._histograms.items()}
+            responses = dict(self._responses)
+
+        lines = [
+            '# HELP kanban_requests_total Respostas por rota, método e status.',
+            '# TYPE kanban_requests_total counter',
+        ]
+        for (route, method, status), count in sorted(responses.items()):
+            lines.append(f'kanban_requests_total{{route="{route}",method="{method}",status="{status}"}} {count}')
+
+        for name, (help_text, buckets) in METRICS.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} histogram')
+            for (metric, (route, method)), (counts, total, count) in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                labels = f'route="{route}",method="{method}"'
+                cumulative = 0
+                for bound, bucket_count in zip((*buckets, '+Inf'), counts):
+                    cumulative += bucket_count
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_sum{{{labels}}} {total:.6f}')
+                lines.append(f'{name}_count{{{labels}}} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+
+# --- Middleware ---
+
+def _route(request):
+    match = getattr(request, 'resolver_match', None)
+    return match.view_name if match else 'unresolved'
+
+
+def _response_size(response):
+    if getattr(response, 'streaming', False):
+        return None
+    return len(response.content)
+
+
+class PerformanceMiddleware:
+    """
+    Mede, por requisição, o tempo total, as consultas e o tempo de banco (via
+    `execute_wrapper`), o tempo de templates e o tamanho da resposta. Publica
+    os valores no cabeçalho `Server-Timing` (se SERVER_TIMING), em log
+    estruturado (logger `app.performance`) e nos histogramas de /metrics/.
+
+    Em views assíncronas o banco roda em outras threads e não é medido.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(_db_wrapper))
+                response = self.get_response(request)
+            self._record(request, response, metrics, time.perf_counter() - started)
+            return response
+        finally:
+            _current.reset(token)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+            self._record(request, response, metrics, time.perf_counter() - started)
+            return response
+        finally:
+            _current.reset(token)
+
+    def _record(self, request, response, metrics, elapsed):
+        route = _route(request)
+        size = _response_size(response)
+        labels = (route, request.method)
+
+        registry.count_response((route, request.method, response.status_code))
+        registry.observe('kanban_request_duration_seconds', labels, elapsed)
+        registry.observe('kanban_db_duration_seconds', labels, metrics.db_time)
+        registry.observe('kanban_template_duration_seconds', labels, metrics.template_time)
+        registry.observe('kanban_db_queries', labels, metrics.queries)
+        if size is not None:
+            registry.observe('kanban_response_size_bytes', labels, size)
+
+        if getattr(settings, 'SERVER_TIMING', False):
+            response['Server-Timing'] = ', '.join((
+                f'app;dur={elapsed * 1000:.1f}',
+                f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.queries} queries"',
+                f'tpl;dur={metrics.template_time * 1000:.1f}',
+            ))
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps({
+                'event': 'request',
+                'route': route,
+                'method': request.method,
+                'path': request.path,
+                'status': response.status_code,
+                'duration_ms': round(elapsed * 1000, 2),
+                'db_queries': metrics.queries,
+                'db_ms': round(metrics.db_time * 1000, 2),
+                'template_ms': round(metrics.template_time * 1000, 2),
+                'size': size,
+            }))
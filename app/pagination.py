@@ -0,0 +1,140 @@
+import base64
+import binascii
+import json
+from functools import reduce
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db.models import Q
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class CursorPage:
+    """Página de uma paginação por cursor; imita a interface usada nos templates."""
+
+    is_cursor = True
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Paginação por chave (keyset): em vez de OFFSET, cada página continua a
+    partir dos valores de ordenação do último item da anterior, e nenhum
+    COUNT(*) é executado.
+
+    `ordering` deve identificar cada linha de forma única (termine com o id) e
+    usar a mesma direção em todos os campos, ex.: ('-created_at', '-id').
+    """
+
+    def __init__(self, queryset, ordering, per_page):
+        descending = {name.startswith('-') for name in ordering}
+        if len(descending) != 1:
+            raise ValueError('Todos os campos de ordenação devem ter a mesma direção.')
+        self.queryset = queryset
+        self.ordering = tuple(ordering)
+        self.fields = [name.lstrip('-') for name in ordering]
+        self.descending = descending.pop()
+        self.per_page = per_page
+
+    # --- Cursores ---
+
+    def encode_cursor(self, obj, direction):
+        values = [getattr(obj, field) for field in self.fields]
+        payload = json.dumps({'d': direction, 'v': [
+            value.isoformat() if hasattr(value, 'isoformat') else value for value in values
+        ]})
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            direction, values = payload['d'], payload['v']
+            if direction not in ('n', 'p') or len(values) != len(self.fields):
+                raise InvalidCursor(cursor)
+            model = self.queryset.model
+            values = [
+                model._meta.get_field(field).to_python(value)
+                for field, value in zip(self.fields, values)
+            ]
+        except (binascii.Error, ValueError, KeyError, TypeError, ValidationError) as exc:
+            raise InvalidCursor(cursor) from exc
+        return direction, values
+
+    # --- Consulta ---
+
+    def _after(self, values, descending):
+        """Filtro das linhas que vêm depois de `values` na ordem dada."""
+        lookup = 'lt' if descending else 'gt'
+        clauses = []
+        for index, field in enumerate(self.fields):
+            equal = {name: value for name, value in zip(self.fields[:index], values[:index])}
+            clauses.append(Q(**equal, **{f'{field}__{lookup}': values[index]}))
+        return reduce(lambda a, b: a | b, clauses)
+
+    def get_page(self, cursor=None):
+        """Retorna a página do cursor; cursores inválidos levam à primeira página."""
+        direction, values = 'n', None
+        if cursor:
+            try:
+                direction, values = self.decode_cursor(cursor)
+            except InvalidCursor:
+                direction, values = 'n', None
+
+        backwards = direction == 'p'
+        descending = self.descending != backwards
+        ordering = [('-' if descending else '') + field for field in self.fields]
+
+        queryset = self.queryset.order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(self._after(values, descending))
+
+        rows = list(queryset[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if backwards:
+            rows.reverse()
+
+        if not rows:
+            return CursorPage([])
+
+        has_next = has_more if not backwards else True
+        has_previous = values is not None if not backwards else has_more
+        return CursorPage(
+            rows,
+            next_cursor=self.encode_cursor(rows[-1], 'n') if has_next else None,
+            previous_cursor=self.encode_cursor(rows[0], 'p') if has_previous else None,
+        )
+
+
+def paginate(request, queryset, ordering, per_page=10):
+    """
+    Paginação das listas: por número de página (padrão) ou por cursor quando a
+    requisição traz `cursor` ou `pagination=cursor`.
+    """
+    if 'cursor' in request.GET or request.GET.get('pagination') == 'cursor':
+        return CursorPaginator(queryset, ordering, per_page).get_page(request.GET.get('cursor'))
+    paginator = Paginator(queryset.order_by(*ordering), per_page)
+    return paginator.get_page(request.GET.get('page'))
@@ -0,0 +1,178 @@
+import logging
+import os
+import re
+import sys
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+
+logger = logging.getLogger('app.queries')
+
+DEFAULTS = {
+    'MODE': 'off',               # off | log | raise
+    'N_PLUS_ONE_THRESHOLD': 5,   # repetições do mesmo SQL numa requisição
+    'SLOW_QUERY_MS': 100,
+    'IGNORE': [],                # regex de SQL a ignorar
+}
+
+# Listas IN de tamanhos diferentes são a mesma forma
+_IN_LIST = re.compile(r'IN \((?:%s, )*%s\)')
+_NUMBER = re.compile(r'\b\d+\b')
+_STRING = re.compile(r"'(?:[^']|'')*'")
+
+_DJANGO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__import__('django').__file__)))
+# Arquivos de instrumentação que envolvem a execução e não são a origem real
+_SKIP_FILES = {
+    os.path.abspath(__file__),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'metrics.py'),
+}
+
+
+class QueryProblem(Exception):
+    """Levantada no modo `raise` quando a requisição tem N+1 ou consulta lenta."""
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, 'QUERY_DETECTOR', {})}
+
+
+def shape(sql):
+    """Forma da consulta: sem literais e com listas IN colapsadas."""
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    return _IN_LIST.sub('IN (...)', sql)
+
+
+def _origin():
+    """(arquivo:linha do código do projeto, template:linha) de onde a consulta partiu."""
+    code = template = None
+    frame = sys._getframe(2)
+    while frame is not None and (code is None or template is None):
+        filename = frame.f_code.co_filename
+        if template is None and frame.f_code.co_name == 'render_annotated':
+            node = frame.f_locals.get('self')
+            token = getattr(node, 'token', None)
+            origin = getattr(node, 'origin', None)
+            if token is not None and origin is not None:
+                template = f'{origin.template_name or origin.name}:{token.lineno}'
+        elif (
+            code is None
+            and not filename.startswith(_DJANGO_DIR)
+            and 'site-packages' not in filename
+            and os.path.abspath(filename) not in _SKIP_FILES
+            and not filename.startswith('<')
+        ):
+            code = f'{os.path.relpath(filename, settings.BASE_DIR)}:{frame.f_lineno} ({frame.f_code.co_name})'
+        frame = frame.f_back
+    return code, template
+
+
+class QueryDetector:
+    """
+    Agrupa as consultas executadas dentro do bloco pela forma do SQL e aponta
+    N+1 (a mesma forma repetida `N_PLUS_ONE_THRESHOLD` vezes ou mais) e
+    consultas acima de `SLOW_QUERY_MS`, com a linha de código e de template
+    que as originou. Uso: `with QueryDetector() as detector: ...`.
+    """
+
+    def __init__(self, mode=None, label=None, **options):
+        config = {**get_config(), **options}
+        self.mode = mode or config['MODE']
+        self.threshold = config['N_PLUS_ONE_THRESHOLD']
+        self.slow_ms = config['SLOW_QUERY_MS']
+        self.ignore = [re.compile(pattern) for pattern in config['IGNORE']]
+        self.label = label
+        self.shapes = {}
+        self.slow = []
+        self._stack = None
+
+    def __enter__(self):
+        self._stack = ExitStack()
+        for alias in connections:
+            self._stack.enter_context(connections[alias].execute_wrapper(self))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stack.close()
+        if exc_type is None:
+            self.report()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            if not any(pattern.search(sql) for pattern in self.ignore):
+                self._record(sql, elapsed)
+
+    def _record(self, sql, elapsed):
+        key = shape(sql)
+        entry = self.shapes.get(key)
+        if entry is None:
+            entry = self.shapes[key] = {'count': 0, 'ms': 0.0, 'origin': None}
+        entry['count'] += 1
+        entry['ms'] += elapsed
+        # A origem só é buscada quando a forma começa a se repetir
+        if entry['count'] == 2 and entry['origin'] is None:
+            entry['origin'] = _origin()
+        if elapsed >= self.slow_ms:
+            self.slow.append({'sql': sql, 'ms': round(elapsed, 2), 'origin': _origin()})
+
+    def problems(self):
+        found = []
+        for key, entry in self.shapes.items():
+            if entry['count'] >= self.threshold:
+                code, template = entry['origin'] or (None, None)
+                found.append({
+                    'kind': 'n+1', 'sql': key, 'count': entry['count'],
+                    'ms': round(entry['ms'], 2), 'code': code, 'template': template,
+                })
+        for entry in self.slow:
+            code, template = entry['origin']
+            found.append({
+                'kind': 'slow', 'sql': entry['sql'], 'count': 1,
+                'ms': entry['ms'], 'code': code, 'template': template,
+            })
+        return found
+
+    def report(self):
+        problems = self.problems()
+        if not problems or self.mode == 'off':
+            return problems
+        lines = [f'{len(problems)} problema(s) de consulta em {self.label or "bloco"}:']
+        for problem in problems:
+            where = ', '.join(filter(None, (problem['code'], problem['template']))) or 'origem desconhecida'
+            lines.append(
+                f"  [{problem['kind']}] {problem['count']}x, {problem['ms']:.1f}ms em {where}: {problem['sql'][:300]}"
+            )
+        message = '\n'.join(lines)
+        if self.mode == 'raise':
+            raise QueryProblem(message)
+        logger.warning(message)
+        return problems
+
+
+class QueryDetectorMiddleware:
+    """
+    Roda o `QueryDetector` em cada requisição. Em produção (MODE 'off') o
+    middleware se desliga na inicialização e não custa nada.
+    """
+
+    def __init__(self, get_response):
+        if get_config()['MODE'] == 'off':
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        detector = QueryDetector()
+        with detector:
+            response = self.get_response(request)
+            match = request.resolver_match
+            view = match.view_name if match else 'unresolved'
+            detector.label = f'{view} ({request.method} {request.path})'
+        return response
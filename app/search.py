@@ -0,0 +1,76 @@
+from functools import reduce
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, FloatField, Q, Value, When
+from django.utils.module_loading import import_string
+
+from tasks.models import Task
+from goals.models import Goal
+from appointments.models import Appointment
+
+
+# Campos pesquisáveis de cada model; o primeiro é o título, que pesa mais no ranking
+SEARCH_FIELDS = {
+    Task: ('title', 'description'),
+    Goal: ('title', 'description'),
+    Appointment: ('title', 'description', 'location'),
+}
+
+
+class BasicSearchBackend:
+    """
+    Busca portável (funciona no SQLite): filtra com `icontains` e ordena por um
+    ranking simples baseado no título.
+    """
+
+    def filter(self, queryset, query):
+        fields = SEARCH_FIELDS[queryset.model]
+        return queryset.filter(reduce(
+            lambda a, b: a | b,
+            (Q(**{f'{field}__icontains': query}) for field in fields),
+        ))
+
+    def rank(self, queryset, query):
+        title = SEARCH_FIELDS[queryset.model][0]
+        return queryset.annotate(rank=Case(
+            When(**{f'{title}__iexact': query}, then=Value(1.0)),
+            When(**{f'{title}__istartswith': query}, then=Value(0.75)),
+            When(**{f'{title}__icontains': query}, then=Value(0.5)),
+            default=Value(0.25),
+            output_field=FloatField(),
+        ))
+
+    def search(self, queryset, query):
+        return self.rank(self.filter(queryset, query), query).order_by('-rank', '-pk')
+
+
+class TrigramSearchBackend(BasicSearchBackend):
+    """
+    Busca para PostgreSQL: o filtro `icontains` é atendido pelos índices GIN
+    trigram das migrações e o ranking usa a similaridade por palavra (pg_trgm).
+    """
+
+    def rank(self, queryset, query):
+        from django.contrib.postgres.search import TrigramWordSimilarity
+        from django.db.models.functions import Greatest
+
+        title, *others = SEARCH_FIELDS[queryset.model]
+        similarities = [TrigramWordSimilarity(query, title) * 2]
+        similarities += [TrigramWordSimilarity(query, field) for field in others]
+        return queryset.annotate(rank=Greatest(*similarities))
+
+
+def get_backend():
+    """Backend configurado em SEARCH_BACKEND ou o padrão para o banco em uso."""
+    path = getattr(settings, 'SEARCH_BACKEND', None)
+    if path:
+        return import_string(path)()
+    if connection.vendor == 'postgresql':
+        return TrigramSearchBackend()
+    return BasicSearchBackend()
+
+
+def search(queryset, query):
+    """Filtra e ordena `queryset` por relevância para `query`."""
+    return get_backend().search(queryset, query)
@@ -0,0 +1,111 @@
+import random
+from datetime import time, timedelta
+
+from django.db.models import F
+from django.utils import timezone
+
+from tasks.models import Task
+from goals.models import Goal
+from appointments.models import Appointment, RecurrenceRule
+
+
+# Registros por INSERT; mantém a memória estável em volumes grandes
+SEED_BATCH_SIZE = 5000
+
+
+def _values(choices):
+    return [value for value, _ in choices]
+
+
+def _insert(model, rows, batch_size):
+    """Grava os objetos gerados por `rows` em lotes com bulk_create."""
+    created = []
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            created.extend(obj.pk for obj in model.objects.bulk_create(batch))
+            batch = []
+    if batch:
+        created.extend(obj.pk for obj in model.objects.bulk_create(batch))
+    return created
+
+
+def _tasks(user, count, rng, assignees, now):
+    statuses = _values(Task.STATUS_CHOICES)
+    priorities = _values(Task.PRIORITY_CHOICES)
+    for index in range(count):
+        created_at = now - timedelta(minutes=rng.randrange(60 * 24 * 365))
+        yield Task(
+            title=f'Tarefa {index}',
+            description='Gerada para testes de carga',
+            priority=rng.choice(priorities),
+            status=rng.choice(statuses),
+            assigned_to=rng.choice(assignees),
+            created_by=user,
+            created_at=created_at,
+            due_date=created_at + timedelta(days=rng.randrange(1, 60)) if rng.random() < 0.7 else None,
+        )
+
+
+def _goals(user, count, rng, now):
+    statuses = _values(Goal.STATUS_CHOICES)
+    priorities = _values(Goal.PRIORITY_CHOICES)
+    periods = _values(Goal.PERIOD_CHOICES)
+    for index in range(count):
+        created_at = now - timedelta(minutes=rng.randrange(60 * 24 * 365))
+        yield Goal(
+            title=f'Meta {index}',
+            priority=rng.choice(priorities),
+            status=rng.choice(statuses),
+            period=rng.choice(periods),
+            created_by=user,
+            created_at=created_at,
+            due_date=created_at + timedelta(days=rng.randrange(7, 365)) if rng.random() < 0.5 else None,
+        )
+
+
+def _appointments(user, count, rng, today):
+    types = _values(Appointment.TYPE_CHOICES)
+    priorities = _values(Appointment.PRIORITY_CHOICES)
+    # Espalha os compromissos em torno de hoje, uns 8 por dia
+    span = max(count // 8, 1)
+    for index in range(count):
+        start = rng.randrange(7 * 60, 20 * 60, 15)
+        end = start + rng.choice((15, 30, 45, 60))
+        yield Appointment(
+            title=f'Compromisso {index}',
+            appointment_type=rng.choice(types),
+            priority=rng.choice(priorities),
+            user=user,
+            date=today + timedelta(days=rng.randrange(-span // 2, span - span // 2)),
+            start_time=time(start // 60, start % 60),
+            end_time=time(end // 60, end % 60),
+        )
+
+
+def seed_user(user, tasks=0, goals=0, appointments=0, assignees=None, recurring=0.01,
+              seed=0, batch_size=SEED_BATCH_SIZE):
+    """
+    Cria volumes realistas de tarefas, metas e compromissos para `user` com
+    bulk_create (sem sinais: quem chama invalida os caches se precisar).
+    Uma fração `recurring` dos compromissos ganha regra de repetição semanal.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    assignees = assignees or [user]
+
+    _insert(Task, _tasks(user, tasks, rng, assignees, now), batch_size)
+    _insert(Goal, _goals(user, goals, rng, now), batch_size)
+    appointment_ids = _insert(Appointment, _appointments(user, appointments, rng, timezone.localdate()), batch_size)
+
+    # bulk_create aplica auto_now; volta updated_at para a data de criação para
+    # que só alterações reais apareçam como recentes (ex.: diffs de board)
+    Task.objects.filter(created_by=user).update(updated_at=F('created_at'))
+    Goal.objects.filter(created_by=user).update(updated_at=F('created_at'))
+
+    rules = (
+        RecurrenceRule(appointment_id=pk, frequency='weekly')
+        for pk in appointment_ids if rng.random() < recurring
+    )
+    _insert(RecurrenceRule, rules, batch_size)
@@ -26,10 +26,13 @@ INSTALLED_APPS = [
     'goals',
     'tasks',
     'appointments',
+    'app',
     'widget_tweaks',
 ]
 
 MIDDLEWARE = [
+    "app.metrics.PerformanceMiddleware",  # tempo, consultas e templates por requisição
+    "app.query_detector.QueryDetectorMiddleware",  # N+1 e consultas lentas (desligado com QUERY_DETECTOR=off)
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",  # serve static files em produção
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -42,12 +45,23 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "app.urls"
 
+# Fora de DEBUG os templates compilados ficam em memória (cached.Loader);
+# em DEBUG cada requisição relê os arquivos.
+TEMPLATE_LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        # DjangoTemplates com medição do tempo de renderização (ver app.metrics)
+        "BACKEND": "app.metrics.InstrumentedDjangoTemplates",
+        "NAME": "django",  # mantém o alias padrão do engine
         "DIRS": [BASE_DIR / "templates"],
-        "APP_DIRS": True,
         "OPTIONS": {
+            "loaders": TEMPLATE_LOADERS if DEBUG else [
+                ("django.template.loaders.cached.Loader", TEMPLATE_LOADERS),
+            ],
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
@@ -71,9 +85,121 @@ DATABASES = {
         "PASSWORD": config("DATABASE_PASSWORD"),
         "HOST": config("DATABASE_HOST"),
         "PORT": config("DATABASE_PORT", default=5432),
+        # Conexões persistentes: reaproveitadas entre requisições por até
+        # CONN_MAX_AGE segundos, com verificação antes de reutilizar
+        "CONN_MAX_AGE": config("DATABASE_CONN_MAX_AGE", default=60, cast=int),
+        "CONN_HEALTH_CHECKS": config("DATABASE_CONN_HEALTH_CHECKS", default=True, cast=bool),
+        "OPTIONS": {},
     }
 }
 
+# Pool nativo do psycopg 3 (só PostgreSQL). Substitui as conexões
+# persistentes: o Django exige CONN_MAX_AGE = 0 com pool. Cada processo do
+# Gunicorn tem o seu pool; use max_size >= GUNICORN_THREADS.
+if config("DATABASE_POOL", default=False, cast=bool):
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": config("DATABASE_POOL_MIN_SIZE", default=2, cast=int),
+        "max_size": config("DATABASE_POOL_MAX_SIZE", default=10, cast=int),
+        "timeout": config("DATABASE_POOL_TIMEOUT", default=10, cast=int),
+    }
+
+# =========================
+# Cache
+# =========================
+# locmem por padrão, que só serve a um processo: com vários workers do
+# Gunicorn o servidor recusa subir (gunicorn.conf.py) até que o cache seja
+# compartilhado (FileBasedCache, DatabaseCache ou Redis), ex.:
+# CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+# CACHE_LOCATION=redis://127.0.0.1:6379/1
+CACHES = {
+    "default": {
+        "BACKEND": config("CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": config("CACHE_LOCATION", default="kanban"),
+    },
+    # HTML dos cards ({% cache ... using='fragments' %}), com chave por
+    # (modelo, pk, updated_at), por isso pode ficar por processo. Em DEBUG fica desligado para que alterações
+    # nos templates apareçam na hora; troque o prefixo ao publicar mudanças
+    # nos partials se o cache sobreviver ao deploy (ex.: Redis).
+    "fragments": {
+        "BACKEND": (
+            config("FRAGMENT_CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache")
+            if config("FRAGMENT_CACHE", default=not DEBUG, cast=bool)
+            else "django.core.cache.backends.dummy.DummyCache"
+        ),
+        "LOCATION": config("FRAGMENT_CACHE_LOCATION", default="fragments"),
+        "KEY_PREFIX": config("FRAGMENT_CACHE_PREFIX", default="fragments"),
+    },
+}
+
+if CACHES["fragments"]["BACKEND"].endswith("LocMemCache"):
+    # O limite padrão (300 entradas) não comporta os cards de um board grande
+    CACHES["fragments"]["OPTIONS"] = {
+        "MAX_ENTRIES": config("FRAGMENT_CACHE_MAX_ENTRIES", default=20000, cast=int),
+    }
+
+# Tempo máximo (s) de um snapshot de dashboard; limita a defasagem dos
+# contadores que dependem do relógio ("atrasadas", "hoje").
+DASHBOARD_CACHE_TIMEOUT = config("DASHBOARD_CACHE_TIMEOUT", default=60, cast=int)
+
+# Grade de horários dos compromissos (passo em minutos: 5, 10, 15 ou 30) e
+# expediente padrão, usado quando o usuário não configurou o seu.
+APPOINTMENT_SLOT_MINUTES = config("APPOINTMENT_SLOT_MINUTES", default=15, cast=int)
+APPOINTMENT_WORKING_HOURS = (
+    config("APPOINTMENT_DAY_START", default="00:00"),
+    config("APPOINTMENT_DAY_END", default="23:45"),
+)
+
+# =========================
+# Métricas de desempenho
+# =========================
+# Cabeçalho Server-Timing nas respostas (expõe tempos internos: padrão só em DEBUG)
+SERVER_TIMING = config("SERVER_TIMING", default=DEBUG, cast=bool)
+# Token para /metrics/ (Authorization: Bearer <token>); staff logado sempre pode
+METRICS_TOKEN = config("METRICS_TOKEN", default="")
+
+# Detector de N+1 e consultas lentas: off (produção), log (staging) ou raise (testes)
+QUERY_DETECTOR = {
+    "MODE": config("QUERY_DETECTOR", default="log" if DEBUG else "off"),
+    "N_PLUS_ONE_THRESHOLD": config("QUERY_DETECTOR_THRESHOLD", default=5, cast=int),
+    "SLOW_QUERY_MS": config("QUERY_DETECTOR_SLOW_MS", default=100, cast=int),
+}
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "plain": {"format": "%(message)s"},
+    },
+    "handlers": {
+        "performance": {"class": "logging.StreamHandler", "formatter": "plain"},
+    },
+    "loggers": {
+        # Uma linha JSON por requisição; use WARNING para desligar
+        "app.performance": {
+            "handlers": ["performance"],
+            "level": config("PERFORMANCE_LOG_LEVEL", default="INFO"),
+            "propagate": False,
+        },
+        "app.queries": {
+            "handlers": ["performance"],
+            "level": "WARNING",
+            "propagate": False,
+        },
+        "app.startup": {
+            "handlers": ["performance"],
+            "level": "INFO",
+            "propagate": False,
+        },
+    },
+}
+
+# =========================
+# Eventos em tempo real (SSE, requer servidor ASGI)
+# =========================
+# O broker padrão entrega eventos apenas dentro do processo atual.
+EVENTS_BROKER = config("EVENTS_BROKER", default="app.events.InMemoryBroker")
+
 
 # =========================
 # Senhas
@@ -99,7 +225,26 @@ USE_TZ = True
 STATIC_URL = "/static/"
 STATICFILES_DIRS = [BASE_DIR / "static"]
 STATIC_ROOT = BASE_DIR / "staticfiles"
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# STATICFILES_STORAGE foi removido no Django 5.1; o backend fica em STORAGES
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "app.storage.StaticFilesStorage"},
+}
+
+# Bundles minificados por página (manage.py build_assets, antes do
+# collectstatic). Desligado em DEBUG: os templates incluem os fontes.
+ASSET_BUNDLES = config("ASSET_BUNDLES", default=not DEBUG, cast=bool)
+
+# =========================
+# Inicialização
+# =========================
+# app/wsgi.py e app/asgi.py esperam o banco, migram se houver pendências e
+# coletam estáticos antes de montar o app (com o preload do Gunicorn, uma vez
+# no master). O entrypoint.sh do contêiner liga por padrão; desligue em
+# réplicas quando um job separado migra.
+STARTUP_CHECKS = config("STARTUP_CHECKS", default=False, cast=bool)
+STARTUP_MIGRATE = config("STARTUP_MIGRATE", default=True, cast=bool)
+STARTUP_DB_TIMEOUT = config("STARTUP_DB_TIMEOUT", default=30, cast=int)
 
 # =========================
 # PK default
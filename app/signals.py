@@ -0,0 +1,67 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from tasks.models import Task
+from goals.models import Goal
+from appointments.models import Appointment, RecurrenceRule, UserWorkingHours
+from appointments.timeslots import invalidate_working_hours
+
+from .dashboard_cache import invalidate_user
+from .directory import invalidate_directory
+from .events import publish_card_event
+
+
+def _action(signal, created):
+    if signal is post_delete:
+        return 'deleted'
+    return 'created' if created else 'updated'
+
+
+@receiver(pre_save, sender=Task)
+def task_reassigning(sender, instance, **kwargs):
+    # Quem deixa de ser o responsável também precisa tirar o card do board
+    instance._previous_assignee_id = (
+        Task.objects.filter(pk=instance.pk).values_list('assigned_to_id', flat=True).first()
+        if instance.pk else None
+    )
+
+
+@receiver([post_save, post_delete], sender=Task)
+def task_changed(sender, instance, signal, created=False, **kwargs):
+    owners = (instance.created_by_id, instance.assigned_to_id, getattr(instance, '_previous_assignee_id', None))
+    invalidate_user(*owners)
+    publish_card_event('task', _action(signal, created), instance, owners)
+
+
+@receiver([post_save, post_delete], sender=Goal)
+def goal_changed(sender, instance, signal, created=False, **kwargs):
+    invalidate_user(instance.created_by_id)
+    publish_card_event('goal', _action(signal, created), instance, [instance.created_by_id])
+
+
+@receiver([post_save, post_delete], sender=Appointment)
+def appointment_changed(sender, instance, signal, created=False, **kwargs):
+    invalidate_user(instance.user_id)
+    publish_card_event('appointment', _action(signal, created), instance, [instance.user_id])
+
+
+@receiver([post_save, post_delete], sender=RecurrenceRule)
+def recurrence_changed(sender, instance, **kwargs):
+    # A regra muda as ocorrências expandidas nos dashboards e no calendário
+    user_id = Appointment.objects.filter(pk=instance.appointment_id).values_list('user_id', flat=True).first()
+    if user_id:
+        invalidate_user(user_id)
+
+
+@receiver([post_save, post_delete], sender=User)
+def user_changed(sender, instance, update_fields=None, **kwargs):
+    # O login só atualiza last_login, que não aparece no diretório
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    invalidate_directory()
+
+
+@receiver([post_save, post_delete], sender=UserWorkingHours)
+def working_hours_changed(sender, instance, **kwargs):
+    invalidate_working_hours(instance.user_id)
@@ -0,0 +1,141 @@
+"""
+Preparação do contêiner num único boot do Django: espera o banco, aplica
+migrations só quando há pendências e coleta estáticos só se o manifesto não
+veio na imagem (ou ficou desatualizado). Chamado por app/wsgi.py e
+app/asgi.py (STARTUP_CHECKS) antes de montar o app, no mesmo boot do Django:
+o WhiteNoise indexa o STATIC_ROOT uma única vez ao carregar o app e, com o
+preload do Gunicorn, os workers herdam esse índice. O comando `startup` faz
+o mesmo avulso.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.recorder import MigrationRecorder
+from django.db.utils import OperationalError
+
+from app.assets import build_all
+
+
+logger = logging.getLogger('app.startup')
+
+# Gerado no build da imagem; ausente (ex.: código montado em volume) o
+# fingerprint é recalculado carregando as migrations do disco
+FINGERPRINT_FILE = settings.BASE_DIR / 'migrations.lock'
+
+STATIC_MANIFEST = 'staticfiles.json'
+
+
+def wait_for_database(timeout=30, interval=1, alias=DEFAULT_DB_ALIAS):
+    """Abre a conexão até `timeout` segundos; levanta o último erro se não conseguir."""
+    deadline = time.monotonic() + timeout
+    connection = connections[alias]
+    while True:
+        try:
+            connection.ensure_connection()
+            return
+        except OperationalError as error:
+            if time.monotonic() >= deadline:
+                raise
+            logger.warning('Banco indisponível (%s); nova tentativa em %ss', error, interval)
+            connection.close()
+            time.sleep(interval)
+
+
+def disk_migrations():
+    """(app, nome) de todas as migrations do código, ordenadas."""
+    loader = MigrationLoader(None, ignore_no_migrations=True)
+    return sorted(loader.disk_migrations)
+
+
+def fingerprint(migrations):
+    digest = hashlib.sha256()
+    for app_label, name in migrations:
+        digest.update(f'{app_label}.{name}\n'.encode())
+    return digest.hexdigest()[:16]
+
+
+def write_fingerprint(path=FINGERPRINT_FILE):
+    migrations = disk_migrations()
+    data = {'fingerprint': fingerprint(migrations), 'migrations': migrations}
+    with open(path, 'w', encoding='utf-8') as output:
+        json.dump(data, output)
+    return data
+
+
+def read_fingerprint(path=FINGERPRINT_FILE):
+    try:
+        with open(path, encoding='utf-8') as source:
+            data = json.load(source)
+    except FileNotFoundError:
+        migrations = disk_migrations()
+        return {'fingerprint': fingerprint(migrations), 'migrations': migrations}
+    data['migrations'] = [tuple(key) for key in data['migrations']]
+    return data
+
+
+def pending_migrations(data, alias=DEFAULT_DB_ALIAS):
+    """Migrations do fingerprint ainda não registradas no banco (uma consulta)."""
+    recorder = MigrationRecorder(connections[alias])
+    if not recorder.has_table():
+        return data['migrations']
+    applied = set(recorder.migration_qs.values_list('app', 'name'))
+    return [key for key in data['migrations'] if key not in applied]
+
+
+def ensure_migrated(alias=DEFAULT_DB_ALIAS):
+    data = read_fingerprint()
+    pending = pending_migrations(data, alias)
+    if not pending:
+        logger.info('Migrations em dia (fingerprint %s)', data['fingerprint'])
+        return False
+    logger.info('%d migration(s) pendente(s); aplicando', len(pending))
+    call_command('migrate', database=alias, interactive=False, verbosity=1)
+    return True
+
+
+def _static_changed_since(timestamp):
+    for directory in settings.STATICFILES_DIRS:
+        for root, _, files in os.walk(directory):
+            for name in files:
+                if os.path.getmtime(os.path.join(root, name)) > timestamp:
+                    return True
+    return False
+
+
+def ensure_static():
+    """collectstatic só se o manifesto não existir ou for mais antigo que os fontes."""
+    manifest = settings.STATIC_ROOT / STATIC_MANIFEST
+    if manifest.exists() and not _static_changed_since(manifest.stat().st_mtime):
+        logger.info('Estáticos já coletados (%s)', manifest)
+        return False
+    logger.info('Manifesto de estáticos ausente ou desatualizado; rodando collectstatic')
+    if settings.ASSET_BUNDLES:
+        build_all()
+    call_command('collectstatic', interactive=False, verbosity=0)
+    return True
+
+
+def run(migrate=True, static=True, db_timeout=30):
+    started = time.perf_counter()
+    wait_for_database(db_timeout)
+    if migrate:
+        ensure_migrated()
+    if static:
+        ensure_static()
+    logger.info('Inicialização concluída em %.2fs', time.perf_counter() - started)
+
+
+def run_if_enabled():
+    """Roda as verificações conforme STARTUP_CHECKS/STARTUP_MIGRATE/STARTUP_DB_TIMEOUT."""
+    if not settings.STARTUP_CHECKS:
+        return
+    run(migrate=settings.STARTUP_MIGRATE, db_timeout=settings.STARTUP_DB_TIMEOUT)
+    # O app ainda vai ser montado (e, no Gunicorn, o master vai dar fork)
+    connections.close_all()
@@ -0,0 +1,76 @@
+from datetime import timedelta
+
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from appointments.recurrence import RULE_FIELDS, occurrence_dates
+
+
+def _aggregate(queryset, counters):
+    """Calcula todos os contadores em uma única consulta com agregação condicional."""
+    # A ordenação padrão dos models não tem efeito em um aggregate, mas limpar
+    # evita que ela apareça no SQL gerado.
+    return queryset.order_by().aggregate(**counters)
+
+
+def task_stats(queryset, now=None):
+    """Estatísticas de tarefas (mesmas chaves usadas no dashboard)."""
+    now = now or timezone.now()
+    return _aggregate(queryset, {
+        'total_tasks': Count('pk'),
+        'pending_tasks': Count('pk', filter=Q(status='todo')),
+        'in_progress_tasks': Count('pk', filter=Q(status='in_progress')),
+        'completed_tasks': Count('pk', filter=Q(status='done')),
+        'overdue_tasks': Count('pk', filter=Q(
+            due_date__lt=now,
+            status__in=['todo', 'in_progress'],
+        )),
+    })
+
+
+def goal_stats(queryset, now=None):
+    """Estatísticas de metas (mesmas chaves usadas no dashboard)."""
+    now = now or timezone.now()
+    return _aggregate(queryset, {
+        'total_goals': Count('pk'),
+        'pending_goals': Count('pk', filter=Q(status='not_started')),
+        'in_progress_goals': Count('pk', filter=Q(status='in_progress')),
+        'completed_goals': Count('pk', filter=Q(status='completed')),
+        'overdue_goals': Count('pk', filter=Q(
+            due_date__lt=now,
+            status__in=['not_started', 'in_progress'],
+        )),
+    })
+
+
+# Janela (dias depois de hoje) dos compromissos "próximos": as séries
+# recorrentes não têm fim, então a contagem precisa de um horizonte
+UPCOMING_DAYS = 7
+
+
+def appointment_stats(queryset, today=None, upcoming_days=UPCOMING_DAYS):
+    """
+    Estatísticas de compromissos (mesmas chaves usadas no dashboard).
+
+    "Hoje" e "próximos" contam ocorrências, como as listas do dashboard: os
+    compromissos avulsos saem da agregação e as séries recorrentes são
+    expandidas em memória (uma consulta a mais, só com as séries).
+    """
+    today = today or timezone.localdate()
+    horizon = today + timedelta(days=upcoming_days)
+    single = Q(recurrence__isnull=True)
+    stats = _aggregate(queryset, {
+        'total_appointments': Count('pk'),
+        'today_appointments': Count('pk', filter=single & Q(date=today)),
+        'upcoming_appointments': Count('pk', filter=single & Q(date__gt=today, date__lte=horizon)),
+        'confirmed_appointments': Count('pk', filter=Q(status='confirmado')),
+        'urgent_appointments': Count('pk', filter=Q(priority='urgente')),
+    })
+
+    series = queryset.filter(recurrence__isnull=False, date__lte=horizon).filter(
+        Q(recurrence__until__isnull=True) | Q(recurrence__until__gte=today)
+    ).order_by().values_list('date', *RULE_FIELDS)
+    for first, frequency, interval, until, exceptions in series:
+        for day in occurrence_dates(first, frequency, interval, today, horizon, until, exceptions):
+            stats['today_appointments' if day == today else 'upcoming_appointments'] += 1
+    return stats
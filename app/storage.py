@@ -0,0 +1,15 @@
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+class StaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    Manifesto do WhiteNoise (nomes com hash + versões comprimidas). Um arquivo
+    referenciado no template mas ausente do manifesto (ex.: favicon.ico) sai
+    com o nome original em vez de derrubar a página com ValueError.
+    """
+
+    def stored_name(self, name):
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            return name
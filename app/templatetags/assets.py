@@ -0,0 +1,20 @@
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html_join
+
+from app.assets import bundle_paths
+
+
+register = template.Library()
+
+TAGS = {
+    '.css': '<link rel="stylesheet" href="{}">',
+    '.js': '<script src="{}"></script>',
+}
+
+
+@register.simple_tag
+def bundle(name):
+    """Inclui o bundle gerado ou, sem ele, os arquivos originais na ordem."""
+    tag = TAGS[name[name.rfind('.'):]]
+    return format_html_join('\n    ', tag, ((static(path),) for path in bundle_paths(name)))
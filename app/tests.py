@@ -0,0 +1,189 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from tasks.models import Task
+from goals.models import Goal
+from appointments.models import Appointment, RecurrenceRule
+
+from app.export import export_stream
+from app.importer import import_records
+from app.stats import appointment_stats, goal_stats, task_stats
+
+
+class StatsTests(TestCase):
+    """Os contadores do dashboard saem de uma consulta por model, com qualquer volume."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('stats', password='senha')
+        now = timezone.now()
+        today = timezone.localdate()
+        Task.objects.bulk_create([
+            Task(title='a', status='todo', created_by=cls.user, assigned_to=cls.user,
+                 due_date=now - timedelta(days=1)),
+            Task(title='b', status='todo', created_by=cls.user, assigned_to=cls.user),
+            Task(title='c', status='in_progress', created_by=cls.user, assigned_to=cls.user),
+            Task(title='d', status='done', created_by=cls.user, assigned_to=cls.user,
+                 due_date=now - timedelta(days=1)),
+        ])
+        Goal.objects.bulk_create([
+            Goal(title='a', status='not_started', period='weekly', created_by=cls.user,
+                 due_date=now - timedelta(days=1)),
+            Goal(title='b', status='in_progress', period='monthly', created_by=cls.user),
+            Goal(title='c', status='completed', period='annual', created_by=cls.user),
+        ])
+        Appointment.objects.bulk_create([
+            Appointment(title='a', user=cls.user, date=today, start_time='09:00', end_time='10:00',
+                        status='confirmado', priority='urgente'),
+            Appointment(title='b', user=cls.user, date=today + timedelta(days=2),
+                        start_time='09:00', end_time='10:00'),
+            Appointment(title='c', user=cls.user, date=today - timedelta(days=2),
+                        start_time='09:00', end_time='10:00'),
+        ])
+
+    def test_task_stats(self):
+        with self.assertNumQueries(1):
+            stats = task_stats(Task.objects.filter(created_by=self.user))
+        self.assertEqual(stats, {
+            'total_tasks': 4,
+            'pending_tasks': 2,
+            'in_progress_tasks': 1,
+            'completed_tasks': 1,
+            'overdue_tasks': 1,
+        })
+
+    def test_goal_stats(self):
+        with self.assertNumQueries(1):
+            stats = goal_stats(Goal.objects.filter(created_by=self.user))
+        self.assertEqual(stats, {
+            'total_goals': 3,
+            'pending_goals': 1,
+            'in_progress_goals': 1,
+            'completed_goals': 1,
+            'overdue_goals': 1,
+        })
+
+    def test_appointment_stats(self):
+        # Agregado + séries recorrentes (expandidas para "hoje" e "próximos")
+        with self.assertNumQueries(2):
+            stats = appointment_stats(Appointment.objects.filter(user=self.user))
+        self.assertEqual(stats['total_appointments'], 3)
+        self.assertEqual(stats['today_appointments'], 1)
+        self.assertEqual(stats['upcoming_appointments'], 1)
+        self.assertEqual(stats['confirmed_appointments'], 1)
+        self.assertEqual(stats['urgent_appointments'], 1)
+
+    def test_appointment_stats_count_recurring_occurrences(self):
+        today = timezone.localdate()
+        weekly = Appointment.objects.create(title='semanal', user=self.user, date=today - timedelta(days=7),
+                                            start_time='08:00', end_time='08:30')
+        RecurrenceRule.objects.create(appointment=weekly, frequency='weekly')
+        stats = appointment_stats(Appointment.objects.filter(user=self.user), today=today)
+        # A série tem uma ocorrência hoje e outra daqui a 7 dias
+        self.assertEqual(stats['today_appointments'], 2)
+        self.assertEqual(stats['upcoming_appointments'], 2)
+
+
+class MainDashboardQueryTests(TestCase):
+    """O número de consultas do dashboard principal não cresce com os dados."""
+
+    # Sessão + usuário; board e agregado de tarefas; board e agregado de
+    # metas; compromissos avulsos e repetidos de hoje e dos próximos dias (4);
+    # agregado e séries recorrentes dos contadores de compromissos (2)
+    EXPECTED_QUERIES = 12
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('dashboard', password='senha')
+
+    def setUp(self):
+        # Sem snapshot em cache: o dashboard é montado do zero a cada requisição
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def _populate(self, count):
+        now = timezone.now()
+        today = timezone.localdate()
+        statuses = [value for value, _ in Task.STATUS_CHOICES]
+        periods = [value for value, _ in Goal.PERIOD_CHOICES]
+        Task.objects.bulk_create([
+            Task(title=f'Tarefa {index}', status=statuses[index % len(statuses)],
+                 created_by=self.user, assigned_to=self.user, due_date=now + timedelta(days=index))
+            for index in range(count)
+        ])
+        Goal.objects.bulk_create([
+            Goal(title=f'Meta {index}', period=periods[index % len(periods)], created_by=self.user)
+            for index in range(count)
+        ])
+        appointments = Appointment.objects.bulk_create([
+            Appointment(title=f'Compromisso {index}', user=self.user, date=today + timedelta(days=index % 8),
+                        start_time='09:00', end_time='10:00')
+            for index in range(count)
+        ])
+        RecurrenceRule.objects.bulk_create([
+            RecurrenceRule(appointment=appointment, frequency='weekly') for appointment in appointments[::5]
+        ])
+
+    def _dashboard(self):
+        cache.clear()
+        response = self.client.get(reverse('main_dashboard'))
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_query_count_is_constant(self):
+        self._populate(5)
+        with self.assertNumQueries(self.EXPECTED_QUERIES):
+            self._dashboard()
+
+        self._populate(50)
+        with self.assertNumQueries(self.EXPECTED_QUERIES):
+            self._dashboard()
+
+    def test_cached_snapshot_skips_dashboard_queries(self):
+        self._populate(10)
+        self._dashboard()
+        with self.assertNumQueries(2):  # sessão + usuário
+            self.client.get(reverse('main_dashboard'))
+
+
+class ExportImportRoundTripTests(TestCase):
+    """Uma exportação pode ser reimportada sem perder as regras de repetição."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.source = User.objects.create_user('exporta', password='senha')
+        cls.target = User.objects.create_user('importa', password='senha')
+        today = timezone.localdate()
+        weekly = Appointment.objects.create(
+            title='Reunião, semanal', user=cls.source, date=today,
+            start_time='09:00', end_time='10:00',
+        )
+        RecurrenceRule.objects.create(
+            appointment=weekly, frequency='weekly', interval=2, until=today + timedelta(days=90),
+            exceptions=[(today + timedelta(days=14)).isoformat(), (today + timedelta(days=28)).isoformat()],
+        )
+        Appointment.objects.create(
+            title='Avulso', user=cls.source, date=today, start_time='11:00', end_time='11:30',
+        )
+
+    def _rules(self, user):
+        return list(
+            RecurrenceRule.objects.filter(appointment__user=user)
+            .order_by('appointment__title')
+            .values_list('appointment__title', 'frequency', 'interval', 'until', 'exceptions')
+        )
+
+    def test_round_trip(self):
+        for fmt in ('csv', 'ndjson', 'ics'):
+            with self.subTest(fmt=fmt):
+                Appointment.objects.filter(user=self.target).delete()
+                text = ''.join(export_stream('appointments', fmt, self.source))
+                result = import_records('appointments', fmt, text.splitlines(keepends=True), self.target)
+                self.assertEqual(result.errors, [])
+                self.assertEqual(result.created, 2)
+                self.assertEqual(self._rules(self.target), self._rules(self.source))
@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.urls import path, include
-from .views import main_dashboard, login_view, logout_view
+from .views import main_dashboard, main_dashboard_tasks_diff, login_view, logout_view, global_search, board_events, export_data, import_data, assignee_autocomplete, metrics
 from django.conf import settings
 from django.conf.urls.static import static
 
@@ -8,8 +8,15 @@ from django.conf.urls.static import static
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', main_dashboard, name='main_dashboard'),
+    path('dashboard/tasks/diff/', main_dashboard_tasks_diff, name='main_dashboard_tasks_diff'),
     path('login/', login_view, name='login'),
     path('logout/', logout_view, name='logout'),
+    path('search/', global_search, name='global_search'),
+    path('users/autocomplete/', assignee_autocomplete, name='assignee_autocomplete'),
+    path('events/', board_events, name='board_events'),
+    path('metrics/', metrics, name='metrics'),
+    path('export/<str:kind>.<str:fmt>', export_data, name='export_data'),
+    path('import/<str:kind>/', import_data, name='import_data'),
     path('tasks/', include('tasks.urls')),
     path('goals/', include('goals.urls')),
     path('appointments/', include('appointments.urls')),
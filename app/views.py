@@ -49,90 +49,91 @@ def logout_view(request):
     return redirect('login')
 
 
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render
+from django.urls import reverse
 from django.utils import timezone
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_http_methods
+import asyncio
+import io
 from datetime import timedelta
-from itertools import chain
+from itertools import chain, islice
 
 from tasks.models import Task
 from goals.models import Goal
 from appointments.models import Appointment
+from appointments.recurrence import occurrences
 
+from .stats import task_stats as get_task_stats
+from .stats import goal_stats as get_goal_stats
+from .stats import appointment_stats as get_appointment_stats
+from .boards import (
+    DASHBOARD_TASK_ORDER, DASHBOARD_TASKS_PER_COLUMN, board_version, dashboard_tasks,
+    load_goal_board, load_task_board, parse_since, task_board_diff,
+)
+from .dashboard_cache import get_snapshot
+from .directory import search_directory
+from .search import search
+from .events import format_sse, get_broker
+from .export import FORMATS, export_stream
+from .importer import import_records
+from .metrics import registry
 
-@login_required
-def main_dashboard(request):
-    user = request.user
+
+def build_dashboard_snapshot(user):
+    """Monta os dados do dashboard principal já materializados (prontos para cache)."""
+    # Versão lida antes das consultas; o cliente a usa para pedir só as mudanças
+    version = board_version()
     
     # --- Tarefas ---
-    base_tasks = Task.objects.filter(assigned_to=user).select_related('assigned_to')
-    
-    todo_tasks = base_tasks.filter(status='todo').order_by('-priority', '-created_at')[:10]
-    in_progress_tasks = base_tasks.filter(status='in_progress').order_by('-priority', '-created_at')[:10]
-    done_tasks = base_tasks.filter(status='done').order_by('-updated_at')[:10]
-    
-    task_stats = {
-        'total_tasks': base_tasks.count(),
-        'pending_tasks': base_tasks.filter(status='todo').count(),
-        'in_progress_tasks': base_tasks.filter(status='in_progress').count(),
-        'completed_tasks': base_tasks.filter(status='done').count(),
-        'overdue_tasks': base_tasks.filter(
-            due_date__lt=timezone.now(), 
-            status__in=['todo', 'in_progress']
-        ).count(),
-    }
+    base_tasks = dashboard_tasks(user)
+    
+    task_board = load_task_board(base_tasks, order_by=DASHBOARD_TASK_ORDER, per_column=DASHBOARD_TASKS_PER_COLUMN)
+    todo_tasks = task_board['todo']
+    in_progress_tasks = task_board['in_progress']
+    done_tasks = task_board['done']
+    
+    task_stats = get_task_stats(base_tasks)
     
     # --- Metas ---
-    base_goals = Goal.objects.filter(created_by=user).select_related('created_by')
-    
-    goals_weekly = base_goals.filter(period='weekly')
-    goals_monthly = base_goals.filter(period='monthly')
-    goals_quarterly = base_goals.filter(period='quarterly')
-    goals_biannual = base_goals.filter(period='biannual')  # ✅ Correto
-    goals_annual = base_goals.filter(period='annual')
-
-    recent_goals = base_goals.order_by('-created_at')[:5]
-    
-    goal_stats = {
-        'total_goals': base_goals.count(),
-        'pending_goals': base_goals.filter(status='not_started').count(),
-        'in_progress_goals': base_goals.filter(status='in_progress').count(),
-        'completed_goals': base_goals.filter(status='completed').count(),
-        'overdue_goals': base_goals.filter(
-            due_date__lt=timezone.now(), 
-            status__in=['not_started', 'in_progress']
-        ).count(),
-    }
+    base_goals = Goal.objects.filter(created_by=user)
+    
+    goal_board = load_goal_board(base_goals)
+    goals_weekly = goal_board['weekly']
+    goals_monthly = goal_board['monthly']
+    goals_quarterly = goal_board['quarterly']
+    goals_biannual = goal_board['biannual']  # ✅ Correto
+    goals_annual = goal_board['annual']
+
+    # Os cards já estão em memória; as 5 mais recentes saem deles
+    recent_goals = sorted(chain.from_iterable(goal_board.values()), key=lambda g: g.created_at, reverse=True)[:5]
+    
+    goal_stats = get_goal_stats(base_goals)
     
     # --- Compromissos ---
     today = timezone.localdate()
     base_appointments = Appointment.objects.filter(user=user).select_related('user')
     
     # Hoje
-    today_appointments = base_appointments.filter(date=today).order_by('start_time')[:5]
+    today_appointments = list(islice(occurrences(user, today, today), 5))
     
     # Próximos 7 dias
     next_week = today + timedelta(days=7)
-    upcoming_appointments = base_appointments.filter(
-        date__gt=today,
-        date__lte=next_week
-    ).order_by('date', 'start_time')[:5]
+    upcoming_appointments = list(islice(occurrences(user, today + timedelta(days=1), next_week), 5))
     
     # Combinar hoje + futuros (máx 6)
     all_recent_appointments = list(chain(today_appointments, upcoming_appointments))
     all_recent_appointments = sorted(all_recent_appointments, key=lambda x: (x.date, x.start_time))[:6]
     
-    appointment_stats = {
-        'total_appointments': base_appointments.count(),
-        'today_appointments': base_appointments.filter(date=today).count(),
-        'upcoming_appointments': base_appointments.filter(date__gt=today).count(),
-        'confirmed_appointments': base_appointments.filter(status='confirmado').count(),
-        'urgent_appointments': base_appointments.filter(priority='urgente').count(),
-    }
+    appointment_stats = get_appointment_stats(base_appointments, today=today)
     
-    context = {
-        'page_title': 'Dashboard',
-        'user': user,
+    return {
+        'board_version': version,
         
         # Tarefas
         'todo_tasks': todo_tasks,
@@ -155,5 +156,159 @@ def main_dashboard(request):
         'all_recent_appointments': all_recent_appointments,
         'appointment_stats': appointment_stats,
     }
+
+
+@login_required
+def main_dashboard(request):
+    user = request.user
+    snapshot = get_snapshot(user, 'main', lambda: build_dashboard_snapshot(user))
+    
+    context = {
+        'page_title': 'Dashboard',
+        'user': user,
+        **snapshot,
+    }
     
     return render(request, 'main_dashboard.html', context)
+
+
+@login_required
+def main_dashboard_tasks_diff(request):
+    """
+    Diff incremental (`?since=`) do board de tarefas do dashboard principal:
+    mesmas tarefas, ordenação e limite por coluna do board que ele atualiza.
+    """
+    since = parse_since(request.GET.get('since'))
+    if since is None:
+        return JsonResponse({'error': 'Parâmetro since inválido'}, status=400)
+    return JsonResponse(task_board_diff(
+        dashboard_tasks(request.user), since, request,
+        order_by=DASHBOARD_TASK_ORDER, per_column=DASHBOARD_TASKS_PER_COLUMN,
+    ))
+
+
+@login_required
+def global_search(request):
+    """Busca unificada em tarefas, metas e compromissos do usuário (JSON)."""
+    query = request.GET.get('q', '').strip()
+    try:
+        limit = min(max(int(request.GET.get('limit', 10)), 1), 50)
+    except ValueError:
+        limit = 10
+
+    if not query:
+        return JsonResponse({'query': query, 'tasks': [], 'goals': [], 'appointments': []})
+
+    sources = (
+        ('tasks', Task.objects.filter(created_by=request.user), 'tasks:task_detail'),
+        ('goals', Goal.objects.filter(created_by=request.user), 'goals:goal_detail'),
+        ('appointments', Appointment.objects.filter(user=request.user), 'appointments:appointment_detail'),
+    )
+    results = {'query': query}
+    for key, queryset, url_name in sources:
+        rows = search(queryset, query).values('pk', 'title', 'rank')[:limit]
+        results[key] = [
+            {
+                'id': row['pk'],
+                'title': row['title'],
+                'rank': round(row['rank'], 4),
+                'url': reverse(url_name, args=[row['pk']]),
+            }
+            for row in rows
+        ]
+    return JsonResponse(results)
+
+
+@login_required
+def export_data(request, kind, fmt):
+    """Exporta tarefas, metas ou compromissos do usuário (CSV, NDJSON ou .ics) em streaming."""
+    try:
+        stream = export_stream(kind, fmt, user=request.user)
+    except ValueError:
+        raise Http404('Exportação não disponível')
+
+    content_type, extension = FORMATS[fmt]
+    response = StreamingHttpResponse(stream, content_type=content_type)
+    filename = f'{kind}-{timezone.localdate():%Y%m%d}.{extension}'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+@login_required
+@require_http_methods(["POST"])
+def import_data(request, kind):
+    """Importa um arquivo CSV, NDJSON ou .ics enviado em `file` e devolve o relatório (JSON)."""
+    upload = request.FILES.get('file')
+    if upload is None:
+        return JsonResponse({'error': 'Envie o arquivo no campo "file"'}, status=400)
+
+    fmt = request.POST.get('format') or upload.name.rsplit('.', 1)[-1].lower()
+    try:
+        lines = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        result = import_records(kind, fmt, lines, request.user)
+    except (ValueError, UnicodeDecodeError) as exc:
+        return JsonResponse({'error': str(exc)}, status=400)
+
+    return JsonResponse(result.as_dict(), status=200 if result.created or not result.failed else 400)
+
+
+@login_required
+def assignee_autocomplete(request):
+    """Usuários ativos cujo login ou nome começa com `q` (JSON), a partir do diretório em cache."""
+    try:
+        limit = min(max(int(request.GET.get('limit', 10)), 1), 50)
+    except ValueError:
+        limit = 10
+    results = [
+        {'id': pk, 'username': username, 'name': name}
+        for pk, username, name in search_directory(request.GET.get('q', ''), limit)
+    ]
+    return JsonResponse({'results': results})
+
+
+@never_cache
+def metrics(request):
+    """Histogramas por rota no formato texto do Prometheus (staff ou METRICS_TOKEN)."""
+    token = settings.METRICS_TOKEN
+    authorized = request.user.is_authenticated and request.user.is_staff
+    if not authorized and token:
+        authorized = constant_time_compare(request.headers.get('Authorization', ''), f'Bearer {token}')
+    if not authorized:
+        return HttpResponse(status=403)
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+# Intervalo (s) entre comentários de keep-alive no stream de eventos
+EVENTS_KEEPALIVE = 25
+
+
+@login_required
+async def board_events(request):
+    """Stream (Server-Sent Events) com as alterações de cards do usuário."""
+    if not isinstance(request, ASGIRequest):
+        # Sob WSGI o stream ocuparia um worker indefinidamente; 204 faz o
+        # EventSource parar de reconectar.
+        return HttpResponse(status=204)
+
+    user = await request.auser()
+    broker = get_broker()
+
+    async def stream():
+        subscriber = broker.subscribe(user.pk)
+        queue = subscriber[1]
+        try:
+            yield 'retry: 5000\n\n'
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=EVENTS_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield ': keepalive\n\n'
+                else:
+                    yield format_sse(event)
+        finally:
+            broker.unsubscribe(user.pk, subscriber)
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
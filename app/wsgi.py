@@ -9,8 +9,15 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 
 import os
 
+import django
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
 
+# Banco, migrations e estáticos antes de montar o app (o WhiteNoise indexa os
+# estáticos na criação do middleware), no mesmo boot do Django
+django.setup(set_prefix=False)
+from app.startup import run_if_enabled  # noqa: E402 (precisa das settings)
+run_if_enabled()
+
 application = get_wsgi_application()
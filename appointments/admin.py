@@ -1,5 +1,10 @@
 from django.contrib import admin
-from .models import Appointment
+from .models import Appointment, RecurrenceRule, UserWorkingHours
+
+
+class RecurrenceRuleInline(admin.StackedInline):
+    model = RecurrenceRule
+    extra = 0
 
 
 @admin.register(Appointment)
@@ -9,6 +14,7 @@ class AppointmentAdmin(admin.ModelAdmin):
     search_fields = ['title', 'description', 'location']
     date_hierarchy = 'date'
     ordering = ['date', 'start_time']
+    inlines = [RecurrenceRuleInline]
     
     def is_today(self, obj):
         return obj.is_today
@@ -19,3 +25,9 @@ class AppointmentAdmin(admin.ModelAdmin):
         return obj.is_upcoming
     is_upcoming.boolean = True
     is_upcoming.short_description = 'Futuro'
+
+
+@admin.register(UserWorkingHours)
+class UserWorkingHoursAdmin(admin.ModelAdmin):
+    list_display = ['user', 'start_time', 'end_time', 'slot_minutes']
+    search_fields = ['user__username']
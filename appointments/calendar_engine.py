@@ -0,0 +1,100 @@
+import calendar
+from datetime import timedelta
+
+from django.utils import timezone
+from django.utils.dates import MONTHS
+
+from app.dashboard_cache import get_snapshot
+from .recurrence import occurrences
+
+
+# Colunas usadas pelas prévias do calendário
+PREVIEW_FIELDS = ('pk', 'title', 'priority', 'date', 'start_time')
+
+# Semanas começando no domingo, como no cabeçalho do template
+FIRST_WEEKDAY = calendar.SUNDAY
+
+
+def load_days(user, start, end, previews=3):
+    """
+    Índice por dia dos compromissos entre `start` e `end` (inclusive), montado
+    com consultas `.values()` e séries recorrentes expandidas só para a janela:
+    total do dia, as primeiras `previews` prévias e quantos ficaram de fora.
+    """
+    days = {}
+    for row in occurrences(user, start, end, fields=PREVIEW_FIELDS):
+        day = days.setdefault(row['date'], {'count': 0, 'previews': []})
+        day['count'] += 1
+        if len(day['previews']) < previews:
+            day['previews'].append(row)
+    for day in days.values():
+        day['overflow'] = day['count'] - len(day['previews'])
+    return days
+
+
+def _cell(day, days, month=None, today=None):
+    info = days.get(day, {})
+    return {
+        'date': day,
+        'day': day.day,
+        'in_month': month is None or day.month == month,
+        'is_today': day == today,
+        'count': info.get('count', 0),
+        'previews': info.get('previews', []),
+        'overflow': info.get('overflow', 0),
+    }
+
+
+def _add_months(year, month, offset):
+    index = year * 12 + (month - 1) + offset
+    return index // 12, index % 12 + 1
+
+
+def build_months(user, year, month, count=1, previews=3):
+    """Grades de `count` meses consecutivos a partir de `month`/`year`."""
+    today = timezone.localdate()
+    cal = calendar.Calendar(FIRST_WEEKDAY)
+    months = [_add_months(year, month, offset) for offset in range(count)]
+
+    # Uma consulta para todo o intervalo visível (inclui os dias de borda das semanas)
+    first_weeks = cal.monthdatescalendar(*months[0])
+    last_weeks = cal.monthdatescalendar(*months[-1])
+    days = load_days(user, first_weeks[0][0], last_weeks[-1][-1], previews)
+
+    grids = []
+    for grid_year, grid_month in months:
+        grids.append({
+            'year': grid_year,
+            'month': grid_month,
+            'month_name': str(MONTHS[grid_month]),
+            'weeks': [
+                [_cell(day, days, grid_month, today) for day in week]
+                for week in cal.monthdatescalendar(grid_year, grid_month)
+            ],
+        })
+    return grids
+
+
+def build_week(user, day, previews=3):
+    """Grade da semana (domingo a sábado) que contém `day`."""
+    today = timezone.localdate()
+    start = day - timedelta(days=(day.weekday() - FIRST_WEEKDAY) % 7)
+    end = start + timedelta(days=6)
+    days = load_days(user, start, end, previews)
+    return {
+        'start': start,
+        'end': end,
+        'weeks': [[_cell(start + timedelta(days=offset), days, today=today) for offset in range(7)]],
+    }
+
+
+def cached_months(user, year, month, count=1, previews=3):
+    """`build_months` com cache por usuário, invalidado quando um compromisso muda."""
+    name = f'calendar:month:{year}-{month:02d}:{count}:{previews}'
+    return get_snapshot(user, name, lambda: build_months(user, year, month, count, previews))
+
+
+def cached_week(user, day, previews=3):
+    """`build_week` com cache por usuário, invalidado quando um compromisso muda."""
+    name = f'calendar:week:{day.isoformat()}:{previews}'
+    return get_snapshot(user, name, lambda: build_week(user, day, previews))
@@ -0,0 +1,65 @@
+from datetime import datetime, time, timedelta
+
+from .recurrence import occurrences
+
+
+def find_conflicts(user, day, start_time, end_time, exclude_pk=None):
+    """
+    Compromissos do usuário em `day` que se sobrepõem ao intervalo
+    [start_time, end_time), incluindo ocorrências de séries recorrentes.
+
+    A consulta dos avulsos filtra por igualdade em (user, date) e por faixa em
+    start_time, o prefixo exato do índice `appt_user_date_time_idx`: o custo é
+    uma busca no índice mais os compromissos daquele dia, e não uma varredura.
+    """
+    return [
+        appointment
+        for appointment in occurrences(
+            user, day, day, start_time__lt=end_time, end_time__gt=start_time,
+        )
+        if exclude_pk is None or appointment.pk != exclude_pk
+    ]
+
+
+def _merge_busy(intervals):
+    """Une intervalos (início, fim) ordenados que se sobrepõem ou se tocam."""
+    merged = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def _minutes_between(start, end):
+    return (datetime.combine(datetime.min, end) - datetime.combine(datetime.min, start)) // timedelta(minutes=1)
+
+
+def free_slots(user, start_day, days=1, day_start=time(0, 0), day_end=time(23, 59), min_minutes=15):
+    """
+    Intervalos livres por dia entre `day_start` e `day_end`, para `days` dias a
+    partir de `start_day`. Usa uma consulta para os avulsos e outra para as
+    séries recorrentes de todo o período.
+    """
+    end_day = start_day + timedelta(days=days - 1)
+    busy_by_day = {}
+    for row in occurrences(user, start_day, end_day, fields=('date', 'start_time', 'end_time')):
+        busy_by_day.setdefault(row['date'], []).append((row['start_time'], row['end_time']))
+
+    result = []
+    for offset in range(days):
+        day = start_day + timedelta(days=offset)
+        slots = []
+        cursor = day_start
+        for start, end in _merge_busy(busy_by_day.get(day, [])):
+            if end <= day_start or start >= day_end:
+                continue
+            if start > cursor and _minutes_between(cursor, start) >= min_minutes:
+                slots.append((cursor, start))
+            cursor = max(cursor, end)
+        if cursor < day_end and _minutes_between(cursor, day_end) >= min_minutes:
+            slots.append((cursor, day_end))
+        result.append({'date': day, 'slots': slots})
+    return result
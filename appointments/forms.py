@@ -1,26 +1,45 @@
 from django import forms
-from .models import Appointment
-from datetime import datetime
-
-
-def get_time_choices(step_minutes=15):
-    choices = []
-    for hour in range(24):
-        for minute in range(0, 60, step_minutes):
-            time_str = f"{hour:02d}:{minute:02d}"
-            choices.append((time_str, time_str))
-    return choices
+from .models import Appointment, RecurrenceRule
+from .conflicts import find_conflicts
+from .timeslots import get_working_hours
+from datetime import date, time
 
 
 class AppointmentForm(forms.ModelForm):
+    # As opções vêm da grade pré-calculada do expediente do usuário (ver __init__)
     start_time = forms.ChoiceField(
-        choices=get_time_choices(),
+        choices=(),
         widget=forms.Select(attrs={'class': 'form-select'})
     )
     end_time = forms.ChoiceField(
-        choices=get_time_choices(),
+        choices=(),
+        widget=forms.Select(attrs={'class': 'form-select'})
+    )
+    recurrence_frequency = forms.ChoiceField(
+        label='Repetição',
+        choices=[('', 'Não repete')] + RecurrenceRule.FREQUENCY_CHOICES,
+        required=False,
         widget=forms.Select(attrs={'class': 'form-select'})
     )
+    recurrence_interval = forms.IntegerField(
+        label='A cada',
+        min_value=1,
+        max_value=365,
+        initial=1,
+        required=False,
+        widget=forms.NumberInput(attrs={'class': 'form-control'})
+    )
+    recurrence_until = forms.DateField(
+        label='Repetir até',
+        required=False,
+        widget=forms.DateInput(attrs={'class': 'form-control', 'type': 'date'})
+    )
+    recurrence_exceptions = forms.CharField(
+        label='Exceto em',
+        required=False,
+        help_text='Datas separadas por vírgula (AAAA-MM-DD).',
+        widget=forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'AAAA-MM-DD, AAAA-MM-DD'})
+    )
 
     class Meta:
         model = Appointment
@@ -51,23 +70,104 @@ class AppointmentForm(forms.ModelForm):
             }),
         }
 
-    def clean(self):
-        cleaned_data = super().clean()
-        start_time_str = cleaned_data.get('start_time')
-        end_time_str = cleaned_data.get('end_time')
+    def __init__(self, *args, user=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user = user
+        self.working_hours = get_working_hours(user)
+
+        choices = self.working_hours.choices
+        for name in ('start_time', 'end_time'):
+            value = self.initial.get(name)
+            if isinstance(value, time):
+                value = self.initial[name] = f'{value:%H:%M}'
+            # Mantém um horário já gravado fora da grade ou do expediente
+            if value and not self.working_hours.offers(value):
+                self.fields[name].choices = sorted(choices + ((value, value),))
+            else:
+                self.fields[name].choices = choices
+
+        rule = getattr(self.instance, 'recurrence', None) if self.instance.pk else None
+        if rule is not None:
+            self.initial.update({
+                'recurrence_frequency': rule.frequency,
+                'recurrence_interval': rule.interval,
+                'recurrence_until': rule.until,
+                'recurrence_exceptions': ', '.join(rule.exceptions),
+            })
 
-        if start_time_str and end_time_str:
+    def clean_recurrence_exceptions(self):
+        value = self.cleaned_data.get('recurrence_exceptions') or ''
+        dates = []
+        for item in value.replace(';', ',').split(','):
+            item = item.strip()
+            if not item:
+                continue
             try:
-                # Converte strings 'HH:MM' para objetos de tempo comparáveis
-                start_time = datetime.strptime(start_time_str, '%H:%M').time()
-                end_time = datetime.strptime(end_time_str, '%H:%M').time()
+                dates.append(date.fromisoformat(item).isoformat())
             except ValueError:
-                raise forms.ValidationError('Formato de horário inválido.')
+                raise forms.ValidationError(f'Data inválida: {item}.')
+        return sorted(set(dates))
 
+    def _clean_time(self, name):
+        value = self.cleaned_data[name]
+        # A escolha já foi validada; fora da grade só sobra o horário já gravado
+        return self.working_hours.table.parse(value) or time.fromisoformat(value)
+
+    def clean_start_time(self):
+        return self._clean_time('start_time')
+
+    def clean_end_time(self):
+        return self._clean_time('end_time')
+
+    def clean(self):
+        cleaned_data = super().clean()
+        start_time = cleaned_data.get('start_time')
+        end_time = cleaned_data.get('end_time')
+
+        if start_time and end_time:
             # Verifica se o horário de término é anterior ou igual ao de início
             if end_time <= start_time:
                 raise forms.ValidationError(
                     'O horário de término deve ser **posterior** ao horário de início.'
                 )
 
+            # Verifica conflito com outros compromissos do usuário no mesmo dia
+            day = cleaned_data.get('date')
+            if self.user is not None and day:
+                conflicts = find_conflicts(
+                    self.user, day, start_time, end_time, exclude_pk=self.instance.pk
+                )[:3]
+                if conflicts:
+                    raise forms.ValidationError(
+                        'Conflito de horário com: %s.' % ', '.join(
+                            f"{c.title} ({c.start_time:%H:%M}-{c.end_time:%H:%M})" for c in conflicts
+                        )
+                    )
+
+        # Regra de repetição
+        until = cleaned_data.get('recurrence_until')
+        if cleaned_data.get('recurrence_frequency') and until and cleaned_data.get('date'):
+            if until < cleaned_data['date']:
+                self.add_error('recurrence_until', 'A data final deve ser posterior à data do compromisso.')
+
         return cleaned_data
+
+    def _save_m2m(self):
+        super()._save_m2m()
+        self.save_recurrence(self.instance)
+
+    def save_recurrence(self, appointment):
+        """Cria, atualiza ou remove a regra de repetição do compromisso."""
+        frequency = self.cleaned_data.get('recurrence_frequency')
+        if not frequency:
+            RecurrenceRule.objects.filter(appointment=appointment).delete()
+            return
+        RecurrenceRule.objects.update_or_create(
+            appointment=appointment,
+            defaults={
+                'frequency': frequency,
+                'interval': self.cleaned_data.get('recurrence_interval') or 1,
+                'until': self.cleaned_data.get('recurrence_until'),
+                'exceptions': self.cleaned_data.get('recurrence_exceptions') or [],
+            },
+        )
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0003_appointment_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecurrenceRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('frequency', models.CharField(choices=[('daily', 'Diária'), ('weekly', 'Semanal'), ('monthly', 'Mensal')], max_length=10, verbose_name='Frequência')),
+                ('interval', models.PositiveSmallIntegerField(default=1, verbose_name='Intervalo')),
+                ('until', models.DateField(blank=True, null=True, verbose_name='Repetir até')),
+                ('exceptions', models.JSONField(blank=True, default=list, verbose_name='Datas excluídas')),
+                ('appointment', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='recurrence', to='appointments.appointment', verbose_name='Compromisso')),
+            ],
+            options={
+                'verbose_name': 'Regra de repetição',
+                'verbose_name_plural': 'Regras de repetição',
+            },
+        ),
+    ]
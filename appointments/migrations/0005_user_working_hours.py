@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0004_appointment_recurrence'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserWorkingHours',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_time', models.TimeField(verbose_name='Início do expediente')),
+                ('end_time', models.TimeField(verbose_name='Fim do expediente')),
+                ('slot_minutes', models.PositiveSmallIntegerField(choices=[(5, '5 minutos'), (10, '10 minutos'), (15, '15 minutos'), (30, '30 minutos')], default=15, verbose_name='Intervalo entre horários')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='working_hours', to=settings.AUTH_USER_MODEL, verbose_name='Usuário')),
+            ],
+            options={
+                'verbose_name': 'Expediente',
+                'verbose_name_plural': 'Expedientes',
+            },
+        ),
+    ]
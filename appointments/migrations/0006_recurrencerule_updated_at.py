@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0005_user_working_hours'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recurrencerule',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Atualizado em'),
+        ),
+    ]
@@ -1,3 +1,4 @@
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
@@ -60,6 +61,9 @@ class Appointment(models.Model):
         verbose_name = 'Compromisso'
         verbose_name_plural = 'Compromissos'
         ordering = ['date', 'start_time']
+        indexes = [
+            models.Index(fields=['user', 'date', 'start_time'], name='appt_user_date_time_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.date} {self.start_time}"
@@ -83,3 +87,73 @@ class Appointment(models.Model):
         end = datetime.combine(self.date, self.end_time)
         duration = end - start
         return int(duration.total_seconds() / 60)
+
+
+class RecurrenceRule(models.Model):
+    """
+    Regra de repetição de um compromisso. O compromisso guarda a primeira
+    ocorrência; as demais são expandidas sob demanda (ver `recurrence.py`).
+    """
+    FREQUENCY_CHOICES = [
+        ('daily', 'Diária'),
+        ('weekly', 'Semanal'),
+        ('monthly', 'Mensal'),
+    ]
+
+    appointment = models.OneToOneField(
+        Appointment,
+        on_delete=models.CASCADE,
+        related_name='recurrence',
+        verbose_name='Compromisso'
+    )
+    frequency = models.CharField(
+        max_length=10,
+        choices=FREQUENCY_CHOICES,
+        verbose_name='Frequência'
+    )
+    interval = models.PositiveSmallIntegerField(default=1, verbose_name='Intervalo')
+    until = models.DateField(null=True, blank=True, verbose_name='Repetir até')
+    exceptions = models.JSONField(default=list, blank=True, verbose_name='Datas excluídas')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Atualizado em')
+
+    class Meta:
+        verbose_name = 'Regra de repetição'
+        verbose_name_plural = 'Regras de repetição'
+
+    def __str__(self):
+        return f"{self.appointment.title} - {self.get_frequency_display()}"
+
+
+class UserWorkingHours(models.Model):
+    """Expediente do usuário: limita os horários oferecidos no formulário."""
+    SLOT_CHOICES = [
+        (5, '5 minutos'),
+        (10, '10 minutos'),
+        (15, '15 minutos'),
+        (30, '30 minutos'),
+    ]
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        related_name='working_hours',
+        verbose_name='Usuário'
+    )
+    start_time = models.TimeField(verbose_name='Início do expediente')
+    end_time = models.TimeField(verbose_name='Fim do expediente')
+    slot_minutes = models.PositiveSmallIntegerField(
+        choices=SLOT_CHOICES,
+        default=15,
+        verbose_name='Intervalo entre horários'
+    )
+
+    class Meta:
+        verbose_name = 'Expediente'
+        verbose_name_plural = 'Expedientes'
+
+    def __str__(self):
+        return f"{self.user} - {self.start_time:%H:%M}-{self.end_time:%H:%M}"
+
+    def clean(self):
+        if self.start_time and self.end_time and self.end_time <= self.start_time:
+            raise ValidationError('O fim do expediente deve ser posterior ao início.')
@@ -0,0 +1,116 @@
+import copy
+import heapq
+from calendar import monthrange
+from datetime import date, timedelta
+
+from django.db.models import Q
+
+from .models import Appointment
+
+
+# Campos da regra lidos junto com o compromisso nas consultas `.values()`
+RULE_FIELDS = (
+    'recurrence__frequency',
+    'recurrence__interval',
+    'recurrence__until',
+    'recurrence__exceptions',
+)
+
+
+def _add_months(day, months):
+    index = day.year * 12 + (day.month - 1) + months
+    year, month = index // 12, index % 12 + 1
+    if day.day > monthrange(year, month)[1]:
+        return None
+    return date(year, month, day.day)
+
+
+def occurrence_dates(first, frequency, interval, start, end, until=None, exceptions=()):
+    """
+    Gera, em ordem, as datas da série iniciada em `first` que caem em
+    [start, end]. Começa direto na primeira ocorrência da janela, sem percorrer
+    a série desde o início. Meses sem o dia de `first` (ex.: dia 31) são pulados.
+    """
+    interval = max(interval or 1, 1)
+    if until and until < end:
+        end = until
+    if end < first or end < start:
+        return
+    start = max(start, first)
+    skip = {date.fromisoformat(value) for value in exceptions or ()}
+
+    if frequency == 'monthly':
+        months = (start.year - first.year) * 12 + start.month - first.month
+        step = -(-months // interval)
+        while True:
+            day = _add_months(first, step * interval)
+            step += 1
+            if day is None:
+                continue
+            if day > end:
+                return
+            if day >= start and day not in skip:
+                yield day
+    else:
+        days = interval * (7 if frequency == 'weekly' else 1)
+        offset = -(-(start - first).days // days) * days
+        day = first + timedelta(days=offset)
+        step = timedelta(days=days)
+        while day <= end:
+            if day not in skip:
+                yield day
+            day += step
+
+
+def _sort_key(item):
+    if isinstance(item, dict):
+        return item['date'], item['start_time']
+    return item.date, item.start_time
+
+
+def _expand_instance(appointment, start, end):
+    rule = appointment.recurrence
+    for day in occurrence_dates(
+        appointment.date, rule.frequency, rule.interval, start, end, rule.until, rule.exceptions,
+    ):
+        occurrence = copy.copy(appointment)
+        occurrence.date = day
+        occurrence.is_occurrence = True
+        yield occurrence
+
+
+def _expand_row(row, start, end):
+    for day in occurrence_dates(
+        row['date'], row['recurrence__frequency'], row['recurrence__interval'],
+        start, end, row['recurrence__until'], row['recurrence__exceptions'],
+    ):
+        yield {**row, 'date': day}
+
+
+def occurrences(user, start, end, fields=None, queryset=None, **lookups):
+    """
+    Compromissos do usuário entre `start` e `end` (inclusive), em ordem de
+    (data, início), com as séries recorrentes expandidas sob demanda.
+
+    Os compromissos avulsos vêm de uma consulta ordenada pelo banco; cada série
+    vira um gerador próprio, e `heapq.merge` intercala tudo sem materializar
+    nenhuma série inteira. Com `fields`, produz dicionários `.values()` em vez
+    de instâncias. `lookups` extras valem para as duas consultas (os horários
+    de uma série são os mesmos em todas as ocorrências), assim como os filtros
+    de um `queryset` de compromissos já filtrado.
+    """
+    base = (Appointment.objects.all() if queryset is None else queryset).filter(user=user, **lookups)
+    single = base.filter(recurrence__isnull=True, date__range=[start, end]).order_by('date', 'start_time')
+    series = base.filter(recurrence__isnull=False, date__lte=end).filter(
+        Q(recurrence__until__isnull=True) | Q(recurrence__until__gte=start)
+    )
+
+    if fields:
+        fields = tuple(dict.fromkeys((*fields, 'date', 'start_time')))
+        streams = [single.values(*fields).iterator()]
+        streams += [_expand_row(row, start, end) for row in series.values(*fields, *RULE_FIELDS)]
+    else:
+        streams = [single.iterator()]
+        streams += [_expand_instance(item, start, end) for item in series.select_related('recurrence')]
+
+    return heapq.merge(*streams, key=_sort_key)
@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from datetime import time
+from functools import lru_cache
+from types import MappingProxyType
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import UserWorkingHours
+
+
+# Passos (minutos) aceitos para a grade de horários
+STEPS = (5, 10, 15, 30)
+
+WORKING_HOURS_TIMEOUT = 60 * 60 * 24
+
+
+@dataclass(frozen=True)
+class SlotTable:
+    """Grade imutável de horários do dia para um passo fixo."""
+    step: int
+    times: tuple
+    choices: tuple
+    lookup: MappingProxyType
+
+    def parse(self, value):
+        """'HH:MM' -> time em O(1); None se o valor não estiver na grade."""
+        return self.lookup.get(value)
+
+    def window(self, start, end):
+        """Choices entre `start` e `end` (inclusive); o resultado fica em cache."""
+        return _window(self.step, start, end)
+
+
+@lru_cache(maxsize=None)
+def get_table(step=None):
+    step = step or settings.APPOINTMENT_SLOT_MINUTES
+    if step not in STEPS:
+        raise ValueError(f'Passo inválido: {step} (use {", ".join(map(str, STEPS))})')
+    times = tuple(time(minute // 60, minute % 60) for minute in range(0, 24 * 60, step))
+    labels = tuple(f'{slot:%H:%M}' for slot in times)
+    return SlotTable(
+        step=step,
+        times=times,
+        choices=tuple(zip(labels, labels)),
+        lookup=MappingProxyType(dict(zip(labels, times))),
+    )
+
+
+@lru_cache(maxsize=256)
+def _window(step, start, end):
+    table = get_table(step)
+    return tuple(
+        choice for slot, choice in zip(table.times, table.choices) if start <= slot <= end
+    )
+
+
+@lru_cache(maxsize=256)
+def _window_labels(step, start, end):
+    return frozenset(label for label, _ in _window(step, start, end))
+
+
+@lru_cache(maxsize=None)
+def _parse_setting(value):
+    hour, minute = value.split(':')
+    return time(int(hour), int(minute))
+
+
+@dataclass(frozen=True)
+class WorkingHours:
+    start: time
+    end: time
+    step: int
+
+    @property
+    def table(self):
+        return get_table(self.step)
+
+    @property
+    def choices(self):
+        return self.table.window(self.start, self.end)
+
+    def offers(self, label):
+        """Se o horário 'HH:MM' está entre as opções do expediente."""
+        return label in _window_labels(self.step, self.start, self.end)
+
+
+def default_working_hours():
+    start, end = settings.APPOINTMENT_WORKING_HOURS
+    return WorkingHours(_parse_setting(start), _parse_setting(end), settings.APPOINTMENT_SLOT_MINUTES)
+
+
+def _working_hours_key(user_id):
+    return f'working-hours:{user_id}'
+
+
+def get_working_hours(user):
+    """
+    Expediente do usuário (ou o padrão das settings), em cache até a próxima
+    alteração da configuração dele.
+    """
+    if user is None or not user.is_authenticated:
+        return default_working_hours()
+
+    key = _working_hours_key(user.pk)
+    hours = cache.get(key)
+    if hours is None:
+        row = UserWorkingHours.objects.filter(user=user).values_list(
+            'start_time', 'end_time', 'slot_minutes',
+        ).first()
+        hours = WorkingHours(*row) if row else default_working_hours()
+        cache.set(key, hours, WORKING_HOURS_TIMEOUT)
+    return hours
+
+
+def invalidate_working_hours(user_id):
+    cache.delete(_working_hours_key(user_id))
@@ -7,6 +7,7 @@ urlpatterns = [
     path('', views.appointment_list, name='appointment_list'),
     path('dashboard/', views.appointments_dashboard, name='appointments_dashboard'),
     path('calendar/', views.appointment_calendar, name='appointment_calendar'),
+    path('free-slots/', views.appointment_free_slots, name='appointment_free_slots'),
     path('create/', views.appointment_create, name='appointment_create'),
     path('<int:pk>/', views.appointment_detail, name='appointment_detail'),
     path('<int:pk>/edit/', views.appointment_update, name='appointment_update'),
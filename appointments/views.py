@@ -5,11 +5,17 @@ from django.core.paginator import Paginator
 from django.db.models import Q
 from django.http import JsonResponse
 from django.utils import timezone
+from django.utils.dateparse import parse_date
+from collections import deque
 from datetime import date, timedelta
-import calendar
-import json
-from .models import Appointment
+from .models import Appointment, RecurrenceRule
 from .forms import AppointmentForm
+from .calendar_engine import cached_months, cached_week
+from .conflicts import free_slots
+from .recurrence import occurrences
+from .timeslots import get_working_hours
+from app.conditional import user_etag
+from app.pagination import paginate
 
 
 @login_required
@@ -29,11 +35,10 @@ def appointment_list(request):
     if type_filter:
         appointments = appointments.filter(type=type_filter)
 
-    if date_filter:
-        try:
-            appointments = appointments.filter(date=date_filter)
-        except (ValueError, TypeError):
-            pass
+    try:
+        day = parse_date(date_filter or '')
+    except ValueError:
+        day = None
 
     if search_query:
         appointments = appointments.filter(
@@ -42,10 +47,14 @@ def appointment_list(request):
             Q(location__icontains=search_query)
         )
 
-    # Paginação
-    paginator = Paginator(appointments, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    if day:
+        # Um dia (ex.: "+N mais" do calendário): inclui as ocorrências das
+        # séries recorrentes, como o calendário que fez a contagem
+        day_appointments = list(occurrences(request.user, day, day, queryset=appointments))
+        page_obj = Paginator(day_appointments, 10).get_page(request.GET.get('page'))
+    else:
+        # Paginação (por página ou por cursor)
+        page_obj = paginate(request, appointments, ('date', 'start_time', 'id'))
 
     context = {
         'page_obj': page_obj,
@@ -56,6 +65,7 @@ def appointment_list(request):
 
 
 @login_required
+@user_etag((Appointment, 'user'), (RecurrenceRule, 'appointment__user'), daily=True)
 def appointment_detail(request, pk):
     """Exibe os detalhes de um compromisso específico do usuário."""
     appointment = get_object_or_404(Appointment, pk=pk, user=request.user)
@@ -67,17 +77,18 @@ def appointment_detail(request, pk):
 def appointment_create(request):
     """Cria um novo compromisso para o usuário logado."""
     if request.method == 'POST':
-        form = AppointmentForm(request.POST)
+        form = AppointmentForm(request.POST, user=request.user)
         if form.is_valid():
             appointment = form.save(commit=False)
             appointment.user = request.user
             appointment.save()
+            form.save_m2m()
             messages.success(request, 'Compromisso criado com sucesso!')
             return redirect('main_dashboard')
         else:
             messages.error(request, 'Por favor, corrija os erros abaixo.')
     else:
-        form = AppointmentForm()
+        form = AppointmentForm(user=request.user)
         form.fields['date'].initial = date.today()
 
     context = {
@@ -93,7 +104,7 @@ def appointment_update(request, pk):
     appointment = get_object_or_404(Appointment, pk=pk, user=request.user)
 
     if request.method == 'POST':
-        form = AppointmentForm(request.POST, instance=appointment)
+        form = AppointmentForm(request.POST, instance=appointment, user=request.user)
         if form.is_valid():
             form.save()
             messages.success(request, 'Compromisso atualizado com sucesso!')
@@ -101,7 +112,7 @@ def appointment_update(request, pk):
         else:
             messages.error(request, 'Por favor, corrija os erros abaixo.')
     else:
-        form = AppointmentForm(instance=appointment)
+        form = AppointmentForm(instance=appointment, user=request.user)
 
     context = {
         'form': form,
@@ -126,30 +137,23 @@ def appointment_delete(request, pk):
 
 
 @login_required
+@user_etag((Appointment, 'user'), (RecurrenceRule, 'appointment__user'), daily=True)
 def appointments_dashboard(request):
     """View para o dashboard de appointments - compatível com AJAX"""
     try:
         today = timezone.now().date()
         
         # Appointments de hoje
-        appointments_today = Appointment.objects.filter(
-            user=request.user,
-            date=today
-        ).order_by('start_time')
+        appointments_today = list(occurrences(request.user, today, today))
         
         # Próximos appointments (próximos 7 dias)
         next_week = today + timedelta(days=7)
-        appointments_upcoming = Appointment.objects.filter(
-            user=request.user,
-            date__range=[today + timedelta(days=1), next_week]
-        ).order_by('date', 'start_time')
+        appointments_upcoming = list(occurrences(request.user, today + timedelta(days=1), next_week))
         
-        # Appointments passados (últimos 30 dias)
+        # Appointments passados (últimos 30 dias): os 10 mais recentes, sem guardar o resto
         last_month = today - timedelta(days=30)
-        appointments_past = Appointment.objects.filter(
-            user=request.user,
-            date__range=[last_month, today - timedelta(days=1)]
-        ).order_by('-date', '-start_time')[:10]
+        appointments_past = deque(occurrences(request.user, last_month, today - timedelta(days=1)), maxlen=10)
+        appointments_past = list(reversed(appointments_past))
         
         context = {
             'appointments_today': appointments_today,
@@ -176,48 +180,64 @@ def appointments_dashboard(request):
 
 
 @login_required
+@user_etag((Appointment, 'user'), (RecurrenceRule, 'appointment__user'), daily=True)
 def appointment_calendar(request):
-    """Exibe um calendário com os compromissos do usuário para um mês específico."""
+    """
+    Exibe um calendário com os compromissos do usuário: um mês (padrão), vários
+    meses (`months=N`) ou uma semana (`view=week&date=AAAA-MM-DD`).
+    """
+    today = timezone.localdate()
     try:
-        year = int(request.GET.get('year', timezone.now().year))
-        month = int(request.GET.get('month', timezone.now().month))
+        year = int(request.GET.get('year', today.year))
+        month = int(request.GET.get('month', today.month))
         if month < 1 or month > 12:
-            month = timezone.now().month
+            month = today.month
         if year < 1900 or year > 2100:
-            year = timezone.now().year
+            year = today.year
     except (ValueError, TypeError):
-        year = timezone.now().year
-        month = timezone.now().month
-
-    start_date = date(year, month, 1)
-    end_date = date(year, month, calendar.monthrange(year, month)[1])
-
-    appointments = Appointment.objects.filter(
-        user=request.user,
-        date__range=[start_date, end_date]
-    ).order_by('date', 'start_time')
+        year = today.year
+        month = today.month
 
-    appointments_by_date = {}
-    for appointment in appointments:
-        date_key = appointment.date.strftime('%Y-%m-%d')
-        if date_key not in appointments_by_date:
-            appointments_by_date[date_key] = []
-        appointments_by_date[date_key].append(appointment)
-
-    cal = calendar.monthcalendar(year, month)
+    try:
+        months = min(max(int(request.GET.get('months', 1)), 1), 12)
+    except (ValueError, TypeError):
+        months = 1
 
+    view = request.GET.get('view', 'month')
     context = {
-        'calendar': cal,
-        'appointments_by_date': appointments_by_date,
+        'view': view,
         'current_month': month,
         'current_year': year,
-        'month_name': calendar.month_name[month],
+        'months_count': months,
         'prev_month': month - 1 if month > 1 else 12,
         'prev_year': year if month > 1 else year - 1,
         'next_month': month + 1 if month < 12 else 1,
         'next_year': year if month < 12 else year + 1,
-        'now': timezone.now().date(),
+        'now': today,
     }
+
+    if view == 'week':
+        try:
+            day = parse_date(request.GET.get('date') or '') or today
+        except ValueError:
+            # Data bem formada mas inexistente (ex.: 2024-02-30)
+            day = today
+        week = cached_week(request.user, day)
+        context.update({
+            'grids': [week],
+            'month_name': f"{week['start']:%d/%m} – {week['end']:%d/%m/%Y}",
+            'week_date': day,
+            'prev_week': day - timedelta(days=7),
+            'next_week': day + timedelta(days=7),
+        })
+    else:
+        context['view'] = 'month'
+        grids = cached_months(request.user, year, month, months)
+        context.update({
+            'grids': grids,
+            'month_name': grids[0]['month_name'],
+        })
+
     return render(request, 'appointments/appointment_calendar.html', context)
 
 @login_required
@@ -237,3 +257,31 @@ def update_appointment_status(request, pk):
         else:
             return JsonResponse({'success': False, 'message': 'Status inválido'})
     return JsonResponse({'success': False, 'message': 'Método inválido'}, status=400)
+
+
+@login_required
+def appointment_free_slots(request):
+    """Horários livres do usuário em um dia ou semana (JSON)."""
+    try:
+        day = parse_date(request.GET.get('date') or '') or timezone.localdate()
+        days = min(max(int(request.GET.get('days', 1)), 1), 31)
+        min_minutes = min(max(int(request.GET.get('min', 15)), 1), 24 * 60)
+    except (ValueError, TypeError):
+        return JsonResponse({'error': 'Parâmetros inválidos'}, status=400)
+
+    hours = get_working_hours(request.user)
+    result = free_slots(
+        request.user, day, days=days, day_start=hours.start, day_end=hours.end, min_minutes=min_minutes,
+    )
+    return JsonResponse({
+        'days': [
+            {
+                'date': item['date'].isoformat(),
+                'slots': [
+                    {'start': start.strftime('%H:%M'), 'end': end.strftime('%H:%M')}
+                    for start, end in item['slots']
+                ],
+            }
+            for item in result
+        ],
+    })
@@ -8,29 +8,28 @@ else
     echo "🔒 Modo produção ativado"
 fi
 
-# Executa migrations
-echo "🔍 Aplicando migrations..."
-python manage.py migrate --noinput
-echo "✅ Migrations concluídas"
-
-# Coleta arquivos estáticos
-echo "📦 Coletando arquivos estáticos..."
-python manage.py collectstatic --noinput
-echo "✅ Staticfiles coletados"
+# Sem comando explícito, o servidor é escolhido por SERVER_MODE:
+#   wsgi (padrão) / asgi -> Gunicorn (gunicorn.conf.py); dev -> runserver
+if [ "$#" -eq 0 ]; then
+    case "${SERVER_MODE:-wsgi}" in
+        wsgi|asgi)
+            set -- gunicorn --config gunicorn.conf.py
+            ;;
+        dev)
+            set -- python manage.py runserver "0.0.0.0:${PORT:-48321}"
+            ;;
+        *)
+            echo "❌ SERVER_MODE inválido: $SERVER_MODE (use wsgi, asgi ou dev)"
+            exit 1
+            ;;
+    esac
+fi
 
-# Testa conexão com o banco
-echo "🔌 Testando conexão com o banco..."
-python manage.py shell -c "
-import sys
-from django.db import connection
-try:
-    connection.ensure_connection()
-    print('✅ Banco de dados acessível')
-except Exception as e:
-    print(f'❌ Erro de conexão: {e}')
-    sys.exit(1)
-"
+# Banco, migrations e estáticos são verificados pelo próprio app ao carregar
+# (app/wsgi.py, app/asgi.py), num único boot do Django: no Gunicorn, uma vez
+# no master, antes do preload. No contêiner fica ligado por padrão.
+export STARTUP_CHECKS="${STARTUP_CHECKS:-True}"
 
 # Executa o comando do CMD
-echo "🚀 Iniciando aplicação..."
+echo "🚀 Iniciando aplicação (${SERVER_MODE:-wsgi})..."
 exec "$@"
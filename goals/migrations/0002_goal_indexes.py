@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:03
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(fields=['created_by', 'period', '-created_at'], name='goal_owner_period_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(fields=['created_by', '-created_at'], name='goal_owner_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(condition=models.Q(('status__in', ['not_started', 'in_progress'])), fields=['created_by', 'due_date'], name='goal_owner_open_due_idx'),
+        ),
+    ]
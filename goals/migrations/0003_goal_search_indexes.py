@@ -0,0 +1,39 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:10
+
+from django.db import migrations
+
+
+# Índices trigram (pg_trgm) sobre UPPER(coluna): atendem os filtros
+# `__icontains` das buscas, que o PostgreSQL traduz para UPPER(col) LIKE UPPER(%s).
+# Em outros bancos a migração não faz nada e a busca usa o backend básico.
+TABLE = 'goals_goal'
+COLUMNS = ['title', 'description']
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {TABLE}_{column}_trgm '
+            f'ON {TABLE} USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column in COLUMNS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {TABLE}_{column}_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0002_goal_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
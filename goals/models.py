@@ -38,6 +38,16 @@ class Goal(models.Model):
         verbose_name = 'Meta'
         verbose_name_plural = 'Metas'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_by', 'period', '-created_at'], name='goal_owner_period_idx'),
+            models.Index(fields=['created_by', '-created_at'], name='goal_owner_created_idx'),
+            # Índice parcial para a contagem de metas atrasadas
+            models.Index(
+                fields=['created_by', 'due_date'],
+                condition=models.Q(status__in=['not_started', 'in_progress']),
+                name='goal_owner_open_due_idx',
+            ),
+        ]
     
     def __str__(self):
         return self.title
@@ -10,6 +10,7 @@ urlpatterns = [
     path('board/', views.goals_board, name='goals_board'),
     path('create/', views.goal_create, name='goal_create'),
     path('update-period/', views.update_goal_period, name='update_period'),
+    path('update-period/bulk/', views.update_goal_period_bulk, name='update_period_bulk'),
     path('<int:pk>/', views.goal_detail, name='goal_detail'),
     path('<int:pk>/edit/', views.goal_update, name='goal_update'),
     path('<int:pk>/delete/', views.goal_delete, name='goal_delete'),
@@ -1,20 +1,23 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.core.paginator import Paginator
 from django.db.models import Q
 from django.http import JsonResponse
-from django.utils import timezone
 from django.views.decorators.http import require_http_methods
 import json
 from .models import Goal
 from .forms import GoalForm
+from app.boards import board_version, goal_board_diff, load_goal_board, parse_since
+from app.conditional import user_etag
+from app.bulk import MAX_MOVES, apply_moves
+from app.dashboard_cache import get_snapshot
+from app.pagination import paginate
 import logging
 
 @login_required
 def goal_list(request):
     """Exibe uma lista paginada de metas com opções de filtragem."""
-    goals = Goal.objects.filter(created_by=request.user)
+    goals = Goal.objects.filter(created_by=request.user).select_related('created_by')
 
     # Filtros
     status_filter = request.GET.get('status')
@@ -37,10 +40,8 @@ def goal_list(request):
             Q(description__icontains=search_query)
         )
 
-    # Paginação
-    paginator = Paginator(goals, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # Paginação (por página ou por cursor)
+    page_obj = paginate(request, goals, ('-created_at', '-id'))
 
     context = {
         'page_obj': page_obj,
@@ -52,6 +53,7 @@ def goal_list(request):
 
 
 @login_required
+@user_etag((Goal, 'created_by'), overdue=(Goal, 'created_by'))
 def goal_detail(request, pk):
     """Exibe os detalhes de uma meta específica."""
     goal = get_object_or_404(Goal, pk=pk, created_by=request.user)
@@ -121,40 +123,40 @@ def goal_dashboard(request):
     """Dashboard com estatísticas das metas do usuário."""
     user_goals = Goal.objects.filter(created_by=request.user)
 
-    context = {
+    context = get_snapshot(request.user, 'goals', lambda: {
         'total_goals': user_goals.count(),
         'pending_goals': user_goals.filter(status='active').count(),
         'completed_goals': user_goals.filter(status='completed').count(),
         'paused_goals': user_goals.filter(status='paused').count(),
-        'recent_goals': user_goals.order_by('-created_at')[:5],
-    }
+        'recent_goals': list(user_goals.order_by('-created_at')[:5]),
+    })
     return render(request, 'goals/dashboard.html', context)
 
 
 @login_required
+@user_etag((Goal, 'created_by'))
 def goals_board(request):
     """view para o board de goals - compatível com ajax"""
     try:
-        print(f"usuário logado: {request.user.username} (id: {request.user.id})")
+        user_goals = Goal.objects.filter(created_by=request.user)
 
-        goals_weekly = Goal.objects.filter(created_by=request.user, period='weekly').order_by('-created_at')
-        goals_monthly = Goal.objects.filter(created_by=request.user, period='monthly').order_by('-created_at')
-        goals_quarterly = Goal.objects.filter(created_by=request.user, period='quarterly').order_by('-created_at')
-        goals_biannual = Goal.objects.filter(created_by=request.user, period='biannual').order_by('-created_at')
-        goals_annual = Goal.objects.filter(created_by=request.user, period='annual').order_by('-created_at')
+        # modo incremental: apenas os cards alterados desde a versão informada
+        since = request.GET.get('since')
+        if since is not None:
+            since_dt = parse_since(since)
+            if since_dt is None:
+                return JsonResponse({'error': 'parâmetro since inválido'}, status=400)
+            return JsonResponse(goal_board_diff(user_goals, since_dt, request))
 
-        print(f"metas do usuário (weekly): {goals_weekly.count()}")
-        print(f"metas do usuário (monthly): {goals_monthly.count()}")
-        print(f"metas do usuário (quarterly): {goals_quarterly.count()}")
-        print(f"metas do usuário (biannual): {goals_biannual.count()}")
-        print(f"metas do usuário (annual): {goals_annual.count()}")
+        board = load_goal_board(user_goals)
 
         context = {
-            'goals_weekly': goals_weekly,
-            'goals_monthly': goals_monthly,
-            'goals_quarterly': goals_quarterly,
-            'goals_biannual': goals_biannual,
-            'goals_annual': goals_annual,
+            'board_version': board_version(),
+            'goals_weekly': board['weekly'],
+            'goals_monthly': board['monthly'],
+            'goals_quarterly': board['quarterly'],
+            'goals_biannual': board['biannual'],
+            'goals_annual': board['annual'],
         }
 
         if request.headers.get('x-requested-with') == 'xmlhttprequest':
@@ -168,7 +170,6 @@ def goals_board(request):
         logger.error(f"erro na view goals_board: {str(e)}")
 
         if request.headers.get('x-requested-with') == 'xmlhttprequest':
-            from django.http import JsonResponse
             return JsonResponse({'error': str(e)}, status=500)
         else:
             context = {'error': 'erro ao carregar goals'}
@@ -198,7 +199,7 @@ def update_goal_period(request):
         # Busca a meta e atualiza
         goal = get_object_or_404(Goal, id=goal_id, created_by=request.user)
         goal.period = new_period
-        goal.save(update_fields=['period'])
+        goal.save(update_fields=['period', 'updated_at'])
 
         return JsonResponse({
             'success': True,
@@ -212,3 +213,37 @@ def update_goal_period(request):
     except Exception as e:
         logger.exception(f"Erro ao atualizar período da meta {goal_id if 'goal_id' in locals() else 'desconhecida'}")
         return JsonResponse({'error': 'Erro interno ao atualizar a meta.'}, status=500)
+
+
+@login_required
+@require_http_methods(["POST"])
+def update_goal_period_bulk(request):
+    """Atualiza o período de várias metas em uma requisição (drag-and-drop em lote)"""
+    try:
+        data = json.loads(request.body.decode('utf-8'))
+        moves = data.get('moves') if isinstance(data, dict) else None
+
+        if not isinstance(moves, list) or not moves:
+            return JsonResponse({'error': 'Lista de movimentos é obrigatória.'}, status=400)
+
+        if len(moves) > MAX_MOVES:
+            return JsonResponse({'error': f'Máximo de {MAX_MOVES} movimentos por requisição.'}, status=400)
+
+        results = apply_moves(
+            Goal.objects.filter(created_by=request.user),
+            'period', dict(Goal.PERIOD_CHOICES), moves,
+            owner_fields=('created_by_id',),
+            event_type='goal',
+            invalid_message='Período inválido',
+        )
+
+        return JsonResponse({
+            'success': all(result['success'] for result in results),
+            'results': results,
+        })
+
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'JSON inválido.'}, status=400)
+    except Exception:
+        logger.exception("Erro ao atualizar períodos de metas em lote")
+        return JsonResponse({'error': 'Erro interno ao atualizar as metas.'}, status=500)
@@ -0,0 +1,83 @@
+"""
+Configuração do Gunicorn para servir a aplicação em produção.
+
+SERVER_MODE escolhe o tipo de worker:
+  - wsgi: workers gthread (processos x threads) com app.wsgi;
+  - asgi: workers Uvicorn com app.asgi (necessário para o stream de eventos).
+
+Recarga sem derrubar conexões: `kill -HUP <pid do master>` reinicia os
+workers aos poucos. Com preload_app o código fica carregado no master, então
+para publicar código novo use `kill -USR2` (sobe um novo master) seguido de
+`kill -QUIT` no antigo.
+"""
+import multiprocessing
+import os
+
+
+def _env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+mode = os.environ.get('SERVER_MODE', 'wsgi')
+cores = multiprocessing.cpu_count()
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '48321')}"
+
+if mode == 'asgi':
+    wsgi_app = 'app.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+    # Cada worker ASGI atende muitas conexões num event loop
+    workers = _env_int('WEB_CONCURRENCY', cores + 1)
+else:
+    wsgi_app = 'app.wsgi:application'
+    worker_class = 'gthread'
+    workers = _env_int('WEB_CONCURRENCY', 2 * cores + 1)
+    threads = _env_int('GUNICORN_THREADS', 4)
+
+# Importa o Django uma vez no master; os workers herdam os módulos (copy-on-write).
+# Ao importar, app/wsgi.py (ou asgi.py) prepara banco e estáticos antes de
+# montar o app, então o índice do WhiteNoise herdado pelos workers já está em dia.
+preload_app = True
+
+timeout = _env_int('GUNICORN_TIMEOUT', 30)
+graceful_timeout = _env_int('GUNICORN_GRACEFUL_TIMEOUT', 30)
+keepalive = _env_int('GUNICORN_KEEPALIVE', 5)
+
+# Recicla workers periodicamente para conter vazamentos de memória
+max_requests = _env_int('GUNICORN_MAX_REQUESTS', 2000)
+max_requests_jitter = max_requests // 10
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-') or None
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+# Em contêiner, /tmp pode ser disco; /dev/shm mantém o heartbeat em memória
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+
+# Caches que vivem dentro de um processo: com vários workers, a invalidação
+# feita num worker (versões dos snapshots, fingerprints de ETag, diretório de
+# usuários, expedientes) não chega aos outros
+PROCESS_LOCAL_CACHES = ('django.core.cache.backends.locmem.LocMemCache',)
+
+
+def on_starting(server):
+    # O app já foi carregado no master (preload), então as settings estão prontas
+    from django.conf import settings
+    backend = settings.CACHES['default']['BACKEND']
+    if server.cfg.workers > 1 and backend in PROCESS_LOCAL_CACHES:
+        raise RuntimeError(
+            f'{server.cfg.workers} workers com o cache default em {backend}: cada worker '
+            'teria o seu e as invalidações não chegariam aos demais. Configure um cache '
+            'compartilhado (CACHE_BACKEND: FileBasedCache, DatabaseCache ou Redis) ou '
+            'use WEB_CONCURRENCY=1.'
+        )
+
+
+def post_fork(server, worker):
+    # Conexões abertas no master durante o preload não podem ser compartilhadas
+    from django.db import connections
+    for connection in connections.all(initialized_only=True):
+        connection.close()
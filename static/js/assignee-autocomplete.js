@@ -0,0 +1,74 @@
+// static/js/assignee-autocomplete.js - Busca de responsáveis sob demanda
+//
+// Com muitos usuários o select "Atribuído para" vem só com a opção atual e o
+// atributo data-autocomplete-url; este script adiciona um campo de busca que
+// consulta o diretório em cache e substitui as opções pelos resultados.
+
+document.addEventListener('DOMContentLoaded', function () {
+    document.querySelectorAll('select[data-autocomplete-url]').forEach(inicializarAutocomplete);
+});
+
+const ATRASO_BUSCA = 250;
+const LIMITE_RESULTADOS = 20;
+
+function inicializarAutocomplete(select) {
+    const busca = document.createElement('input');
+    busca.type = 'search';
+    busca.className = 'form-control mb-2';
+    busca.placeholder = 'Buscar usuário...';
+    busca.setAttribute('autocomplete', 'off');
+    select.parentNode.insertBefore(busca, select);
+
+    let temporizador = null;
+    let controlador = null;
+
+    busca.addEventListener('input', function () {
+        clearTimeout(temporizador);
+        temporizador = setTimeout(function () {
+            if (controlador) {
+                controlador.abort();
+            }
+            controlador = new AbortController();
+            buscarUsuarios(select, busca.value, controlador.signal);
+        }, ATRASO_BUSCA);
+    });
+}
+
+function buscarUsuarios(select, termo, sinal) {
+    const url = new URL(select.dataset.autocompleteUrl, window.location.origin);
+    url.searchParams.set('q', termo);
+    url.searchParams.set('limit', LIMITE_RESULTADOS);
+
+    fetch(url, { signal: sinal, headers: { 'X-Requested-With': 'XMLHttpRequest' } })
+        .then(resposta => resposta.ok ? resposta.json() : Promise.reject(resposta.status))
+        .then(dados => preencherOpcoes(select, dados.results))
+        .catch(erro => {
+            if (erro.name !== 'AbortError') {
+                console.error('Erro ao buscar usuários:', erro);
+            }
+        });
+}
+
+function preencherOpcoes(select, usuarios) {
+    const selecionado = select.value;
+    const opcaoSelecionada = select.querySelector('option:checked');
+
+    // Mantém a opção vazia e a atual; troca o restante pelos resultados
+    Array.from(select.options).forEach(opcao => {
+        if (opcao.value && opcao.value !== selecionado) {
+            opcao.remove();
+        }
+    });
+
+    usuarios.forEach(usuario => {
+        if (String(usuario.id) === selecionado) {
+            return;
+        }
+        const rotulo = usuario.name ? `${usuario.username} (${usuario.name})` : usuario.username;
+        select.add(new Option(rotulo, usuario.id));
+    });
+
+    if (opcaoSelecionada) {
+        opcaoSelecionada.selected = true;
+    }
+}
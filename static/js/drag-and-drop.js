@@ -59,9 +59,19 @@ function inicializarArrastarSoltar() {
     });
 
     let cardArrastado = null;
-    let atualizacaoPendente = false;
     let colunaOriginal = null; // Para reverter em caso de erro
 
+    // Movimentos aguardando envio, agrupados por tipo e indexados pelo id do card.
+    // Arrastos em sequência rápida viram uma única requisição em lote.
+    const ATRASO_AGRUPAMENTO = 400;
+    const ENDPOINTS_LOTE = {
+        tarefa: { url: '/tasks/update-status/bulk/', campo: 'status', secao: 'tarefas' },
+        meta: { url: '/goals/update-period/bulk/', campo: 'period', secao: 'metas' },
+    };
+    const filaMovimentos = { tarefa: new Map(), meta: new Map() };
+    let temporizadorEnvio = null;
+    let envioEmAndamento = false;
+
     function lidarComInicioArrasto(e) {
         cardArrastado = this;
         colunaOriginal = this.parentElement;
@@ -99,17 +109,10 @@ function inicializarArrastarSoltar() {
         e.preventDefault();
         this.classList.remove('sobre-arrasto');
 
-        if (atualizacaoPendente) {
-            console.warn('⚠️ Operação em andamento, ignorando soltar');
-            return;
-        }
-
         const colunaDestino = this;
         const colunaOrigem = cardArrastado?.parentElement.closest('.task-column, .goal-column');
 
         if (cardArrastado && colunaDestino !== colunaOrigem) {
-            atualizacaoPendente = true;
-            
             console.log('📦 Soltar executado:', {
                 origem: colunaOrigem?.classList.toString(),
                 destino: colunaDestino?.classList.toString()
@@ -129,14 +132,13 @@ function inicializarArrastarSoltar() {
             if (idTarefa) {
                 const novoStatus = obterStatusTarefaDaColuna(colunaDestino);
                 console.log(`📋 Atualizando tarefa ${idTarefa} para status: ${novoStatus}`);
-                atualizarStatusItem(idTarefa, novoStatus, 'tarefa');
+                enfileirarMovimento('tarefa', idTarefa, novoStatus, cardArrastado, colunaOriginal);
             } else if (idMeta) {
                 const novoPeriodo = obterPeriodoMetaDaColuna(colunaDestino);
                 console.log(`🎯 Atualizando meta ${idMeta} para período: ${novoPeriodo}`);
-                atualizarPeriodoMeta(idMeta, novoPeriodo, 'meta');
+                enfileirarMovimento('meta', idMeta, novoPeriodo, cardArrastado, colunaOriginal);
             } else {
                 console.error('❌ Card sem ID válido');
-                atualizacaoPendente = false;
                 ocultarIndicadorCarregamento(cardArrastado);
             }
         }
@@ -183,10 +185,10 @@ function inicializarArrastarSoltar() {
         }
     }
 
-    function reverterPosicaoCard(card) {
-        if (card && colunaOriginal) {
+    function reverterPosicaoCard(card, origem) {
+        if (card && origem) {
             console.log('↩️ Revertendo posição do card');
-            colunaOriginal.appendChild(card);
+            origem.appendChild(card);
         }
     }
 
@@ -208,40 +210,77 @@ function inicializarArrastarSoltar() {
         return null;
     }
 
-    function atualizarStatusItem(itemId, novoStatus, tipoItem) {
-        console.log('📡 Enviando atualização:', { itemId, novoStatus, tipoItem });
+    function enfileirarMovimento(tipoItem, itemId, novoValor, card, origem) {
+        const fila = filaMovimentos[tipoItem];
+        const anterior = fila.get(itemId);
+        // Mantém a coluna de origem do primeiro movimento para poder reverter
+        fila.set(itemId, {
+            valor: novoValor,
+            card: card,
+            origem: anterior ? anterior.origem : origem,
+        });
+        agendarEnvio();
+    }
 
-        const csrfToken = document.querySelector('[name=csrfmiddlewaretoken]')?.value;
-        if (!csrfToken) {
-            console.error('❌ Token CSRF não encontrado');
-            lidarComErroAtualizacao('Token CSRF não encontrado');
-            return;
-        }
+    function agendarEnvio() {
+        clearTimeout(temporizadorEnvio);
+        temporizadorEnvio = setTimeout(enviarLote, ATRASO_AGRUPAMENTO);
+    }
 
-        let url;
-        if (tipoItem === 'tarefa') {
-            url = '/tasks/update-status/';
-        } else {
-            console.error('❌ Tipo de item não suportado:', tipoItem);
-            lidarComErroAtualizacao('Tipo de item não suportado');
+    function enviarLote() {
+        if (envioEmAndamento) {
+            agendarEnvio();
             return;
         }
 
-        fetch(url, {
+        const csrfToken = document.querySelector('[name=csrfmiddlewaretoken]')?.value;
+        const envios = [];
+
+        Object.keys(filaMovimentos).forEach(tipoItem => {
+            const fila = filaMovimentos[tipoItem];
+            if (fila.size === 0) return;
+
+            const movimentos = new Map(fila);
+            fila.clear();
+
+            if (!csrfToken) {
+                console.error('❌ Token CSRF não encontrado');
+                lidarComErroAtualizacao('Token CSRF não encontrado', movimentos);
+                return;
+            }
+
+            envios.push(enviarMovimentos(tipoItem, movimentos, csrfToken));
+        });
+
+        if (envios.length === 0) return;
+
+        envioEmAndamento = true;
+        Promise.all(envios).finally(() => {
+            envioEmAndamento = false;
+        });
+    }
+
+    function enviarMovimentos(tipoItem, movimentos, csrfToken) {
+        const { url, campo, secao } = ENDPOINTS_LOTE[tipoItem];
+        const moves = Array.from(movimentos, ([itemId, movimento]) => ({
+            id: parseInt(itemId),
+            [campo]: movimento.valor,
+        }));
+
+        console.log('📡 Enviando lote:', { tipoItem, moves });
+
+        return fetch(url, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
                 'X-CSRFToken': csrfToken,
                 'X-Requested-With': 'XMLHttpRequest',
             },
-            body: JSON.stringify({
-                id: parseInt(itemId),
-                status: novoStatus
-            })
+            body: JSON.stringify({ moves })
         })
         .then(response => {
             console.log('📡 Resposta recebida:', response.status);
-            
+
             if (!response.ok) {
                 throw new Error(`Erro ${response.status}: ${response.statusText}`);
             }
@@ -249,76 +288,162 @@ function inicializarArrastarSoltar() {
         })
         .then(data => {
             console.log('✅ Dados recebidos:', data);
-            
-            if (data.success) {
-                console.log('✅ Status atualizado com sucesso!');
-                lidarComSucessoAtualizacao('tarefas');
-            } else {
-                throw new Error(data.error || 'Erro desconhecido');
+
+            const falhas = new Map();
+            (data.results || []).forEach(resultado => {
+                const chave = String(resultado.id);
+                const movimento = movimentos.get(chave);
+                if (!movimento) return;
+                if (resultado.success) {
+                    ocultarIndicadorCarregamento(movimento.card);
+                } else {
+                    falhas.set(chave, movimento);
+                }
+            });
+
+            if (falhas.size > 0) {
+                const erros = data.results.filter(r => !r.success).map(r => `#${r.id}: ${r.error}`);
+                lidarComErroAtualizacao(erros.join('\n'), falhas);
+            }
+            if (falhas.size < movimentos.size) {
+                lidarComSucessoAtualizacao(secao);
             }
         })
         .catch(error => {
-            console.error('❌ Erro ao atualizar status:', error);
-            lidarComErroAtualizacao(error.message);
+            console.error('❌ Erro ao enviar lote:', error);
+            lidarComErroAtualizacao(error.message, movimentos);
         });
     }
 
-    function atualizarPeriodoMeta(metaId, novoPeriodo, tipoItem) {
-        console.log('📡 Enviando atualização de período:', { metaId, novoPeriodo, tipoItem });
+    // Configuração dos boards para a atualização incremental (modo `since`)
+    const QUADROS = {
+        tarefas: {
+            quadroId: 'tasks-board', url: '/tasks/board/',
+            seletorColuna: '.task-column', seletorCard: '.task-card', atributoId: 'taskId', atributoHtml: 'data-task-id',
+            classeColuna: valor => valor.replace('_', '-'),
+        },
+        metas: {
+            quadroId: 'goals-board', url: '/goals/board/',
+            seletorColuna: '.goal-column', seletorCard: '.goal-card', atributoId: 'goalId', atributoHtml: 'data-goal-id',
+            classeColuna: valor => valor,
+        },
+    };
 
-        const csrfToken = document.querySelector('[name=csrfmiddlewaretoken]')?.value;
-        if (!csrfToken) {
-            console.error('❌ Token CSRF não encontrado');
-            lidarComErroAtualizacao('Token CSRF não encontrado');
-            return;
-        }
+    function lidarComSucessoAtualizacao(secao) {
+        const config = QUADROS[secao];
+        const quadro = config && document.getElementById(config.quadroId);
+        const versao = quadro?.dataset.boardVersion;
 
-        let url;
-        if (tipoItem === 'meta') {
-            url = '/goals/update-period/';
-        } else {
-            console.error('❌ Tipo de item não suportado:', tipoItem);
-            lidarComErroAtualizacao('Tipo de item não suportado');
+        if (!versao) {
+            recarregarSecao(secao);
             return;
         }
 
-        fetch(url, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-                'X-CSRFToken': csrfToken,
-                'X-Requested-With': 'XMLHttpRequest',
-            },
-            body: JSON.stringify({
-                id: parseInt(metaId),
-                period: novoPeriodo
-            })
+        // O board pode indicar o próprio endpoint de diff (ex.: o do dashboard,
+        // com as tarefas atribuídas e o limite por coluna desse board)
+        const url = quadro.dataset.diffUrl || config.url;
+
+        fetch(`${url}?since=${encodeURIComponent(versao)}`, {
+            headers: { 'X-Requested-With': 'XMLHttpRequest' },
         })
         .then(response => {
-            console.log('📡 Resposta recebida:', response.status);
-            
             if (!response.ok) {
                 throw new Error(`Erro ${response.status}: ${response.statusText}`);
             }
             return response.json();
         })
-        .then(data => {
-            console.log('✅ Dados recebidos:', data);
-            
-            if (data.success) {
-                console.log('✅ Período atualizado com sucesso!');
-                lidarComSucessoAtualizacao('metas');
-            } else {
-                throw new Error(data.error || 'Erro desconhecido');
+        .then(diff => {
+            const completo = aplicarDiffQuadro(quadro, config, diff);
+            quadro.dataset.boardVersion = diff.version;
+            if (!completo) {
+                // Um card entrou no limite da coluna sem ter sido alterado: o
+                // diff não traz o HTML dele, então a seção é recarregada
+                recarregarSecao(secao);
             }
         })
         .catch(error => {
-            console.error('❌ Erro ao atualizar período:', error);
-            lidarComErroAtualizacao(error.message);
+            console.warn('⚠️ Falha na atualização incremental, recarregando seção:', error);
+            recarregarSecao(secao);
         });
     }
 
-    function lidarComSucessoAtualizacao(secao) {
+    function aplicarDiffQuadro(quadro, config, diff) {
+        console.log(`🔄 Aplicando ${diff.cards.length} alteração(ões) ao quadro ${config.quadroId}`);
+
+        diff.cards.forEach(item => {
+            const coluna = quadro.querySelector(`${config.seletorColuna}.${config.classeColuna(item.column)} .column-content`);
+            const existente = quadro.querySelector(`${config.seletorCard}[${config.atributoHtml}="${item.id}"]`);
+            if (!coluna) {
+                existente?.remove();
+                return;
+            }
+
+            const modelo = document.createElement('template');
+            modelo.innerHTML = item.html.trim();
+            const novoCard = modelo.content.firstElementChild;
+
+            if (existente) {
+                existente.replaceWith(novoCard);
+            }
+            if (novoCard.parentElement !== coluna) {
+                coluna.prepend(novoCard);
+            }
+            coluna.querySelector('.empty-state')?.remove();
+        });
+
+        // Remove os cards excluídos
+        const idsAtuais = new Set(diff.ids.map(String));
+        const idsExibidos = new Set();
+        quadro.querySelectorAll(config.seletorCard).forEach(card => {
+            if (!idsAtuais.has(card.dataset[config.atributoId])) {
+                card.remove();
+            } else {
+                idsExibidos.add(card.dataset[config.atributoId]);
+            }
+        });
+
+        // Atualiza contadores e listeners dos cards novos
+        quadro.querySelectorAll(config.seletorColuna).forEach(coluna => {
+            const contador = coluna.querySelector('.task-count');
+            if (contador) {
+                contador.textContent = coluna.querySelectorAll(config.seletorCard).length;
+            }
+        });
+        quadro.querySelectorAll(config.seletorCard).forEach(card => {
+            card.removeEventListener('dragstart', lidarComInicioArrasto);
+            card.removeEventListener('dragend', lidarComFimArrasto);
+            card.setAttribute('draggable', true);
+            card.addEventListener('dragstart', lidarComInicioArrasto);
+            card.addEventListener('dragend', lidarComFimArrasto);
+        });
+
+        return idsExibidos.size === idsAtuais.size;
+    }
+
+    // Eventos em tempo real (SSE): alterações feitas em outras abas ou por
+    // outros usuários chegam como eventos e viram uma atualização incremental.
+    const SECOES_POR_EVENTO = { task: 'tarefas', goal: 'metas' };
+    const atualizacoesAgendadas = {};
+
+    function conectarEventos() {
+        if (!window.EventSource || window.fonteEventosQuadros) return;
+
+        const fonte = new EventSource('/events/');
+        window.fonteEventosQuadros = fonte;
+
+        Object.keys(SECOES_POR_EVENTO).forEach(tipo => {
+            fonte.addEventListener(tipo, () => agendarAtualizacaoSecao(SECOES_POR_EVENTO[tipo]));
+        });
+    }
+
+    function agendarAtualizacaoSecao(secao) {
+        if (!document.getElementById(QUADROS[secao].quadroId)) return;
+        // Rajadas de eventos resultam em uma única consulta incremental
+        clearTimeout(atualizacoesAgendadas[secao]);
+        atualizacoesAgendadas[secao] = setTimeout(() => lidarComSucessoAtualizacao(secao), 200);
+    }
+
+    function recarregarSecao(secao) {
         setTimeout(() => {
             if (typeof refreshSection === 'function') {
                 console.log(`🔄 Atualizando seção ${secao}`);
@@ -327,18 +452,20 @@ function inicializarArrastarSoltar() {
                 console.log('🔄 Alternativa: recarregando página');
                 location.reload();
             }
-            atualizacaoPendente = false;
         }, 300);
     }
 
-    function lidarComErroAtualizacao(mensagemErro) {
+    function lidarComErroAtualizacao(mensagemErro, movimentos) {
         alert(`Erro: ${mensagemErro}\nTente novamente.`);
         
-        // Reverte posição do card
-        reverterPosicaoCard(cardArrastado);
-        ocultarIndicadorCarregamento(cardArrastado);
-        atualizacaoPendente = false;
+        // Reverte posição dos cards que não foram atualizados
+        movimentos.forEach(movimento => {
+            reverterPosicaoCard(movimento.card, movimento.origem);
+            ocultarIndicadorCarregamento(movimento.card);
+        });
     }
+
+    conectarEventos();
 }
 
 // Exporta função para uso global
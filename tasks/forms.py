@@ -2,6 +2,13 @@
 from django import forms
 from .models import Task
 from django.contrib.auth.models import User
+from django.urls import reverse
+
+from app.directory import assignee_choices
+
+
+# Acima disso o select não lista todos os usuários
+ASSIGNEE_SELECT_LIMIT = 200
 
 
 class TaskForm(forms.ModelForm):
@@ -42,5 +49,16 @@ class TaskForm(forms.ModelForm):
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Filtrar usuários ativos
-        self.fields['assigned_to'].queryset = User.objects.filter(is_active=True)
+        # Filtrar usuários ativos; a queryset só é consultada ao validar o POST
+        field = self.fields['assigned_to']
+        field.queryset = User.objects.filter(is_active=True)
+
+        # Opções do diretório em cache; com muitos usuários, só as opções atuais
+        # e o campo passa a buscar por autocomplete
+        choices = assignee_choices()
+        if len(choices) > ASSIGNEE_SELECT_LIMIT:
+            selected = {self.initial.get('assigned_to'), self.data.get(self.add_prefix('assigned_to'))}
+            selected = {str(pk) for pk in selected if pk}
+            choices = [choice for choice in choices if str(choice[0]) in selected]
+            field.widget.attrs['data-autocomplete-url'] = reverse('assignee_autocomplete')
+        field.choices = [('', field.empty_label)] + choices
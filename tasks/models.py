@@ -33,6 +33,22 @@ class Task(models.Model):
         verbose_name = 'Tarefa'
         verbose_name_plural = 'Tarefas'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_by', 'status', '-created_at'], name='task_owner_status_idx'),
+            models.Index(fields=['assigned_to', 'status', '-created_at'], name='task_assignee_status_idx'),
+            models.Index(fields=['created_by', '-created_at'], name='task_owner_created_idx'),
+            # Índices parciais para a contagem de tarefas atrasadas
+            models.Index(
+                fields=['created_by', 'due_date'],
+                condition=models.Q(status__in=['todo', 'in_progress']),
+                name='task_owner_open_due_idx',
+            ),
+            models.Index(
+                fields=['assigned_to', 'due_date'],
+                condition=models.Q(status__in=['todo', 'in_progress']),
+                name='task_assignee_open_due_idx',
+            ),
+        ]
     
     @property
     def is_overdue(self):
@@ -10,6 +10,7 @@ urlpatterns = [
     path('board/', views.tasks_board, name='tasks_board'),
     path('create/', views.task_create, name='task_create'),
     path('update-status/', views.update_task_status, name='update_status'),
+    path('update-status/bulk/', views.update_task_status_bulk, name='update_status_bulk'),
     path('<int:pk>/', views.task_detail, name='task_detail'),
     path('<int:pk>/edit/', views.task_update, name='task_update'),
     path('<int:pk>/delete/', views.task_delete, name='task_delete'),
@@ -1,21 +1,24 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.core.paginator import Paginator
 from django.db.models import Q
 from django.http import JsonResponse
-from django.utils import timezone
 from django.views.decorators.http import require_http_methods
-from datetime import timedelta
 import json
 from .models import Task
 from .forms import TaskForm
+from app.boards import board_version, load_task_board, parse_since, task_board_diff
+from app.conditional import user_etag
+from app.bulk import MAX_MOVES, apply_moves
+from app.dashboard_cache import get_snapshot
+from app.pagination import paginate
+from app.stats import task_stats
 
 
 @login_required
 def task_list(request):
     """Exibe uma lista paginada de tarefas com opções de filtragem."""
-    tasks = Task.objects.filter(created_by=request.user)
+    tasks = Task.objects.filter(created_by=request.user).select_related('assigned_to')
     
     # Filtros
     status_filter = request.GET.get('status')
@@ -34,10 +37,8 @@ def task_list(request):
             Q(description__icontains=search_query)
         )
     
-    # Paginação
-    paginator = Paginator(tasks, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # Paginação (por página ou por cursor)
+    page_obj = paginate(request, tasks, ('-created_at', '-id'))
     
     context = {
         'page_obj': page_obj,
@@ -48,6 +49,7 @@ def task_list(request):
 
 
 @login_required
+@user_etag((Task, 'created_by'), overdue=(Task, 'created_by'))
 def task_detail(request, pk):
     """Exibe os detalhes de uma tarefa específica."""
     task = get_object_or_404(Task, pk=pk, created_by=request.user)
@@ -117,32 +119,35 @@ def task_dashboard(request):
     """Dashboard com estatísticas das tarefas do usuário."""
     user_tasks = Task.objects.filter(created_by=request.user)
     
-    context = {
-        'total_tasks': user_tasks.count(),
-        'pending_tasks': user_tasks.filter(status='todo').count(),
-        'in_progress_tasks': user_tasks.filter(status='in_progress').count(),
-        'completed_tasks': user_tasks.filter(status='done').count(),
-        'overdue_tasks': user_tasks.filter(
-            due_date__lt=timezone.now(), 
-            status__in=['todo', 'in_progress']
-        ).count(),
-        'recent_tasks': user_tasks.order_by('-created_at')[:5],
-    }
+    context = get_snapshot(request.user, 'tasks', lambda: {
+        **task_stats(user_tasks),
+        'recent_tasks': list(user_tasks.order_by('-created_at')[:5]),
+    })
     return render(request, 'tasks/dashboard.html', context)
 
 
 @login_required
+@user_etag((Task, 'created_by'))
 def tasks_board(request):
     """View para o board de tasks - compatível com AJAX"""
     try:
-        tasks_todo = Task.objects.filter(created_by=request.user, status='todo').order_by('-created_at')
-        tasks_in_progress = Task.objects.filter(created_by=request.user, status='in_progress').order_by('-created_at')
-        tasks_done = Task.objects.filter(created_by=request.user, status='done').order_by('-created_at')
+        user_tasks = Task.objects.filter(created_by=request.user)
+        
+        # Modo incremental: apenas os cards alterados desde a versão informada
+        since = request.GET.get('since')
+        if since is not None:
+            since_dt = parse_since(since)
+            if since_dt is None:
+                return JsonResponse({'error': 'Parâmetro since inválido'}, status=400)
+            return JsonResponse(task_board_diff(user_tasks, since_dt, request))
+        
+        board = load_task_board(user_tasks)
         
         context = {
-            'tasks_todo': tasks_todo,
-            'tasks_in_progress': tasks_in_progress,
-            'tasks_done': tasks_done,
+            'board_version': board_version(),
+            'tasks_todo': board['todo'],
+            'tasks_in_progress': board['in_progress'],
+            'tasks_done': board['done'],
         }
         
         if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
@@ -195,3 +200,39 @@ def update_task_status(request):
         logger = logging.getLogger(__name__)
         logger.error(f"Erro ao atualizar status da task: {str(e)}")
         return JsonResponse({'error': str(e)}, status=500)
+
+
+@login_required
+@require_http_methods(["POST"])
+def update_task_status_bulk(request):
+    """Atualiza o status de várias tarefas em uma requisição (drag-and-drop em lote)"""
+    try:
+        data = json.loads(request.body)
+        moves = data.get('moves') if isinstance(data, dict) else None
+
+        if not isinstance(moves, list) or not moves:
+            return JsonResponse({'error': 'Lista de movimentos é obrigatória'}, status=400)
+
+        if len(moves) > MAX_MOVES:
+            return JsonResponse({'error': f'Máximo de {MAX_MOVES} movimentos por requisição'}, status=400)
+
+        results = apply_moves(
+            Task.objects.filter(created_by=request.user),
+            'status', dict(Task.STATUS_CHOICES), moves,
+            owner_fields=('created_by_id', 'assigned_to_id'),
+            event_type='task',
+            invalid_message='Status inválido',
+        )
+
+        return JsonResponse({
+            'success': all(result['success'] for result in results),
+            'results': results,
+        })
+
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'JSON inválido'}, status=400)
+    except Exception as e:
+        import logging
+        logger = logging.getLogger(__name__)
+        logger.error(f"Erro ao atualizar status das tasks em lote: {str(e)}")
+        return JsonResponse({'error': str(e)}, status=500)